@@ -17,6 +17,48 @@ celery = Celery(
 celery.conf.timezone = "UTC"
 celery.conf.enable_utc = True
 
+# Slow external-API searches get their own queues so one workload can't
+# starve the other; workers take one task at a time and ack on completion.
+celery.conf.task_routes = {
+    'celery_app.search_jobs_task': {'queue': 'job_search_queue'},
+    'celery_app.search_marketplaces_task': {'queue': 'marketplace_queue'},
+    'celery_app.compare_products_task': {'queue': 'marketplace_queue'},
+}
+celery.conf.worker_prefetch_multiplier = 1
+celery.conf.task_acks_late = True
+
+# Clients are built once per worker process, on the first task that needs them
+_worker_clients = {}
+
+
+def _get_worker_client(name, factory):
+    client = _worker_clients.get(name)
+    if client is None:
+        client = _worker_clients[name] = factory()
+    return client
+
+
+@celery.task(name='celery_app.search_jobs_task')
+def search_jobs_task(**kwargs):
+    """Run JobSearchClient.search_jobs on a worker"""
+    from src.jobs.job_search_client import JobSearchClient
+    return _get_worker_client('jobs', JobSearchClient).search_jobs(**kwargs)
+
+
+@celery.task(name='celery_app.search_marketplaces_task')
+def search_marketplaces_task(**kwargs):
+    """Run MarketplaceClient.search_all on a worker"""
+    from src.marketplace.marketplace_client import MarketplaceClient
+    return _get_worker_client('marketplace', MarketplaceClient).search_all(**kwargs)
+
+
+@celery.task(name='celery_app.compare_products_task')
+def compare_products_task(product_ids: list):
+    """Run MarketplaceClient.compare_products on a worker"""
+    from src.marketplace.marketplace_client import MarketplaceClient
+    return _get_worker_client('marketplace', MarketplaceClient).compare_products(product_ids)
+
+
 # --- NEW: Asynchronous Crawl Task ---
 @celery.task(name='celery_app.bootstrap_crawl_task')
 def bootstrap_crawl_task(urls: list, max_depth: int, max_total_pages: int):
@@ -40,14 +82,9 @@ def bootstrap_crawl_task(urls: list, max_depth: int, max_total_pages: int):
         tokenizer = Tokenizer()
         database_path = os.path.join(Config.STORAGE_DATA_DIR, 'index.json')
         database = Database(database_path)
+        # 2. The Indexer loads the existing index from disk when it is built
         indexer = Indexer(database, tokenizer)
         
-        # 2. Re-load the existing index before crawling (if necessary)
-        # Note: If Database is backed by a network service (like Redis/DB), 
-        # connection failure here will be caught by the outer try/except.
-        if hasattr(database, 'load_index'):
-             database.load_index() # Assuming database can load index into indexer/memory
-        
         # 3. Initialize Spider
         spider = Spider(
             tokenizer=tokenizer,
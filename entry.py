@@ -24,7 +24,9 @@ from src.ranking.advanced_ranker import AdvancedRanker
 from src.storage.database import Database
 
 # CRITICAL: Import the app instance and the setter function
-from src.web.app import app, set_components, initialize_components 
+from src.web.app import create_app, set_components, initialize_components
+
+app = create_app()
 
 
 # --- Setup Helpers ---
@@ -62,6 +64,7 @@ def run_development_server(indexer_instance: Indexer) -> None:
         logger.info(f"Server: http://{Config.WEB_HOST}:{Config.WEB_PORT}")
         logger.info("="*60)
         
+        # Development server only; production runs `gunicorn` (gunicorn.conf.py)
         app.run(
             host=Config.WEB_HOST,
             port=Config.WEB_PORT,
@@ -137,16 +140,10 @@ try:
     )
     logger.info("✓ SearchManager initialized in '%s' mode with external clients.", Config.SEARCH_MODE)
     
-    # 4. Marketplace and Jobs
-    from src.marketplace.marketplace_client import MarketplaceClient
-    from src.marketplace.price_alerts import PriceAlertManager
-    from src.jobs.job_search_client import JobSearchClient, JobAlertManager
-    
-    marketplace_client = MarketplaceClient()
-    price_alert_manager = PriceAlertManager()
-    job_search_client = JobSearchClient()
-    job_alert_manager = JobAlertManager()
-    logger.info("✓ Marketplace and Jobs components initialized.")
+    # 4. Marketplace and Jobs are left to src.web.app, which builds each
+    #    client on the first request that needs it (per worker, not at import).
+    #    Until then /health counts an enabled client as up, so a fresh worker
+    #    passes its load balancer check without building them here
     
     # 5. Inject components into the Flask app (CRITICAL STEP)
     # This ensures the global variables in src/web/app.py are set for the routes.
@@ -156,11 +153,7 @@ try:
         indexer=indexer,
         ranker=ranker,
         spider=spider,
-        search_manager_instance=search_manager,
-        marketplace_client_instance=marketplace_client,
-        job_search_client_instance=job_search_client,
-        price_alert_manager_instance=price_alert_manager,
-        job_alert_manager_instance=job_alert_manager
+        search_manager_instance=search_manager
     )
     logger.info("✓ All components successfully INJECTED into the Flask application.")
 
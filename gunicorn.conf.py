@@ -0,0 +1,30 @@
+"""
+gunicorn settings for production.
+
+gunicorn reads this file automatically from the working directory, so
+`gunicorn` on its own serves wsgi:app on gevent workers. Every setting can
+still be overridden on the command line.
+
+The job, marketplace and search routes are I/O bound (SerpAPI, RapidAPI,
+marketplace APIs), so each worker multiplexes requests on greenlets; the
+worker count follows the usual 2 * CPU + 1.
+"""
+
+import multiprocessing
+import os
+
+wsgi_app = 'wsgi:app'
+
+bind = f"0.0.0.0:{os.getenv('PORT', os.getenv('WEB_PORT', '8080'))}"
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gevent'
+worker_connections = int(os.getenv('WORKER_CONNECTIONS', 1000))
+
+# Upstream APIs time out well before this; /api/crawl runs in the background
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
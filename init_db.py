@@ -32,7 +32,7 @@ def init_db():
     ]
     
     # Initialize document store
-    doc_store = DocumentStore(os.path.join(config.storage_dir, 'documents.json'))
+    doc_store = DocumentStore(os.path.join(config.storage_dir, 'documents.db'))
     
     # Add documents
     for i, doc in enumerate(docs, 1):
@@ -8,6 +8,14 @@ import logging
 import os
 import sys
 
+# `python main.py --use-gevent` serves on gevent's WSGIServer instead of the
+# Flask development server. Monkey patching has to happen before requests,
+# urllib3 and redis import socket/ssl, so it runs ahead of every other import.
+USE_GEVENT = '--use-gevent' in sys.argv
+if USE_GEVENT:
+    from gevent import monkey
+    monkey.patch_all()
+
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -18,7 +26,7 @@ from src.indexing.indexer import Indexer
 from src.processing.tokenizer import Tokenizer
 from src.ranking.advanced_ranker import AdvancedRanker
 from src.storage.database import Database
-from src.web.app import app, set_components, initialize_components
+from src.web.app import create_app, set_components, initialize_components
 
 
 def setup_logging(log_level: str = 'INFO') -> None:
@@ -49,7 +57,6 @@ def main() -> None:
     logger.info("Initializing Search Engine Components")
     logger.info("="*60)
     
-    logger = logging.getLogger(__name__)
     # Initialize core components
     tokenizer = None
     database = None
@@ -162,7 +169,6 @@ def main() -> None:
         if not Config.INDEXER_AUTO_FLUSH:
             indexer.flush()
         
-        from src.web.app import app, set_components
         set_components(
             tokenizer=tokenizer,
             database=database,
@@ -177,17 +183,24 @@ def main() -> None:
         )
         
         # Start the Flask application
+        app = create_app()
         logger.info("="*60)
         logger.info("Starting Web Interface")
         logger.info(f"Server: http://localhost:{Config.WEB_PORT}")
         logger.info("="*60)
         
-        app.run(
-            host=Config.WEB_HOST,
-            port=Config.WEB_PORT,
-            debug=False,
-            use_reloader=False
-        )
+        # Production runs `gunicorn` (gunicorn.conf.py); these are for local use
+        if USE_GEVENT:
+            from gevent.pywsgi import WSGIServer
+            logger.info("Serving with gevent WSGIServer")
+            WSGIServer((Config.WEB_HOST, Config.WEB_PORT), app).serve_forever()
+        else:
+            app.run(
+                host=Config.WEB_HOST,
+                port=Config.WEB_PORT,
+                debug=False,
+                use_reloader=False
+            )
         
     except KeyboardInterrupt:
         logger.info("\nShutdown requested... cleaning up")
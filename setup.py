@@ -10,11 +10,20 @@ import os
 if __name__ == '__main__':
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     sys.path.insert(0, project_root)
-    
+
+# Opt-in native build of the CPU-bound BM25 ranker (needs `pip install mypy`):
+#   SEARCH_ENGINE_MYPYC=1 python setup.py build_ext --inplace
+# The compiled module shadows ranker.py; deleting the .so files reverts to it.
+ext_modules = []
+if os.getenv('SEARCH_ENGINE_MYPYC'):
+    from mypyc.build import mypycify
+    ext_modules = mypycify(['src/ranking/ranker.py'])
+
 setup(
     name="search-engine",
     version="4.0.0",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         'Flask==2.3.0',
         'beautifulsoup4==4.12.0',
@@ -32,7 +41,6 @@ setup(
         'celery==5.3.4',
         'python-crontab==3.0.0',
         'requests-cache==1.1.1',
-        'flask-cors==4.0.0',
     ],
     python_requires='>=3.8',
 )
@@ -6,6 +6,8 @@ Provides 95% faster response times for repeated queries
 import json
 import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import Any, Optional, Callable
 from functools import wraps
 import time
@@ -31,7 +33,9 @@ class CacheManager:
                  redis_port: int = 6379,
                  redis_db: int = 0,
                  default_ttl: int = 3600,
-                 enabled: bool = True):
+                 enabled: bool = True,
+                 l1_max_size: int = 1024,
+                 l1_ttl: int = 60):
         """
         Initialize cache manager
         
@@ -41,16 +45,31 @@ class CacheManager:
             redis_db: Redis database number
             default_ttl: Default time-to-live in seconds (1 hour)
             enabled: Enable/disable caching
+            l1_max_size: Entries kept in the in-process LRU in front of Redis
+            l1_ttl: Max seconds an entry is served from the in-process LRU
         """
         self.enabled = enabled
         self.default_ttl = default_ttl
         self.redis_client = None
         self.fallback_cache = {}  # In-memory fallback
         
+        # In-process LRU in front of Redis (L1); kept short-lived so entries
+        # invalidated through another worker don't linger for long
+        self.l1_cache = OrderedDict()
+        self.l1_max_size = l1_max_size
+        self.l1_ttl = l1_ttl
+        self._l1_lock = threading.Lock()
+        
         # Statistics
         self.hits = 0
         self.misses = 0
         self.errors = 0
+        self.stale_hits = 0
+        self.l1_hits = 0
+        
+        # Keys with a background stale-while-revalidate refresh in flight
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
         
         # Try to connect to Redis
         if enabled and REDIS_AVAILABLE:
@@ -64,9 +83,9 @@ class CacheManager:
                 )
                 # Test connection
                 self.redis_client.ping()
-                logger.info(f"✓ Redis connected: {redis_host}:{redis_port}")
+                logger.info("✓ Redis connected: %s:%s", redis_host, redis_port)
             except Exception as e:
-                logger.warning(f"Redis connection failed: {e}. Using in-memory cache.")
+                logger.warning("Redis connection failed: %s. Using in-memory cache.", e)
                 self.redis_client = None
         elif enabled and not REDIS_AVAILABLE:
             logger.warning("Redis not available. Using in-memory cache.")
@@ -92,6 +111,21 @@ class CacheManager:
         
         return f"{key_prefix}:{key_hash}"
     
+    @staticmethod
+    def swr_key(namespace: str, *parts: Any) -> str:
+        """
+        Build a request-keyed cache key for stale-while-revalidate entries
+        
+        Args:
+            namespace: Endpoint or operation name
+            *parts: Request parameters that identify the response
+            
+        Returns:
+            Cache key string
+        """
+        digest = hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=16).hexdigest()
+        return f"swr:{namespace}:{digest}"
+    
     def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache
@@ -106,12 +140,20 @@ class CacheManager:
             return None
         
         try:
-            # Try Redis first
+            # Try the in-process LRU, then Redis
             if self.redis_client:
+                found, value = self._l1_get(key)
+                if found:
+                    self.hits += 1
+                    self.l1_hits += 1
+                    return value
+                
                 value = self.redis_client.get(key)
                 if value:
                     self.hits += 1
-                    return json.loads(value)
+                    value = json.loads(value)
+                    self._l1_set(key, value, self.l1_ttl)
+                    return value
             
             # Fallback to in-memory cache
             if key in self.fallback_cache:
@@ -128,7 +170,7 @@ class CacheManager:
             return None
             
         except Exception as e:
-            logger.error(f"Cache get error: {e}")
+            logger.error("Cache get error: %s", e)
             self.errors += 1
             return None
     
@@ -155,6 +197,7 @@ class CacheManager:
             # Try Redis first
             if self.redis_client:
                 self.redis_client.setex(key, ttl, serialized)
+                self._l1_set(key, value, min(ttl, self.l1_ttl))
                 return True
             
             # Fallback to in-memory cache
@@ -170,7 +213,7 @@ class CacheManager:
             return True
             
         except Exception as e:
-            logger.error(f"Cache set error: {e}")
+            logger.error("Cache set error: %s", e)
             self.errors += 1
             return False
     
@@ -191,6 +234,8 @@ class CacheManager:
             # Delete from Redis
             if self.redis_client:
                 self.redis_client.delete(key)
+            with self._l1_lock:
+                self.l1_cache.pop(key, None)
             
             # Delete from fallback cache
             if key in self.fallback_cache:
@@ -199,7 +244,7 @@ class CacheManager:
             return True
             
         except Exception as e:
-            logger.error(f"Cache delete error: {e}")
+            logger.error("Cache delete error: %s", e)
             self.errors += 1
             return False
     
@@ -215,15 +260,72 @@ class CacheManager:
                 self.redis_client.flushdb()
             
             self.fallback_cache.clear()
+            with self._l1_lock:
+                self.l1_cache.clear()
             
             logger.info("Cache cleared")
             return True
             
         except Exception as e:
-            logger.error(f"Cache clear error: {e}")
+            logger.error("Cache clear error: %s", e)
             self.errors += 1
             return False
     
+    def invalidate_namespace(self, namespace: str) -> int:
+        """
+        Delete every stale-while-revalidate entry of a namespace
+        
+        Args:
+            namespace: Namespace passed to swr_key
+            
+        Returns:
+            Number of keys removed
+        """
+        prefix = f"swr:{namespace}:"
+        removed = set()
+        try:
+            if self.redis_client:
+                keys = list(self.redis_client.scan_iter(match=prefix + '*'))
+                if keys:
+                    self.redis_client.delete(*keys)
+                removed.update(keys)
+            
+            with self._l1_lock:
+                for key in [k for k in self.l1_cache if k.startswith(prefix)]:
+                    del self.l1_cache[key]
+                    removed.add(key)
+            
+            for key in [k for k in self.fallback_cache if k.startswith(prefix)]:
+                del self.fallback_cache[key]
+                removed.add(key)
+            
+            return len(removed)
+            
+        except Exception as e:
+            logger.error("Cache invalidate error: %s", e)
+            self.errors += 1
+            return len(removed)
+    
+    def _l1_get(self, key: str):
+        """Return (found, value) from the in-process LRU"""
+        with self._l1_lock:
+            entry = self.l1_cache.get(key)
+            if entry is None:
+                return False, None
+            if entry[1] <= time.monotonic():
+                del self.l1_cache[key]
+                return False, None
+            self.l1_cache.move_to_end(key)
+            return True, entry[0]
+    
+    def _l1_set(self, key: str, value: Any, ttl: int) -> None:
+        """Store a value in the in-process LRU, evicting the oldest entry"""
+        with self._l1_lock:
+            self.l1_cache[key] = (value, time.monotonic() + ttl)
+            self.l1_cache.move_to_end(key)
+            if len(self.l1_cache) > self.l1_max_size:
+                self.l1_cache.popitem(last=False)
+    
     def _cleanup_fallback_cache(self) -> None:
         """Remove expired entries from fallback cache"""
         current_time = time.time()
@@ -262,11 +364,11 @@ class CacheManager:
                 # Try to get from cache
                 cached_value = self.get(cache_key)
                 if cached_value is not None:
-                    logger.debug(f"Cache hit: {cache_key}")
+                    logger.debug("Cache hit: %s", cache_key)
                     return cached_value
                 
                 # Cache miss - execute function
-                logger.debug(f"Cache miss: {cache_key}")
+                logger.debug("Cache miss: %s", cache_key)
                 result = func(*args, **kwargs)
                 
                 # Store in cache
@@ -277,6 +379,115 @@ class CacheManager:
             return wrapper
         return decorator
     
+    def get_or_refresh(self,
+                       key: str,
+                       loader: Callable[[], Any],
+                       ttl: Optional[int] = None,
+                       stale_ttl: Optional[int] = None,
+                       should_cache: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Stale-while-revalidate lookup
+        
+        Fresh entries are returned directly. Stale entries (older than ttl but
+        younger than stale_ttl) are returned immediately while a background
+        thread reloads them; if that reload fails the stale value keeps being
+        served. Misses call loader synchronously.
+        
+        Args:
+            key: Cache key (see swr_key)
+            loader: Zero-argument callable producing the value
+            ttl: Seconds a value counts as fresh (None = default)
+            stale_ttl: Seconds a value may be served at all (>= ttl)
+            should_cache: Optional predicate; values failing it aren't stored
+            
+        Returns:
+            Cached or freshly loaded value
+        """
+        ttl = ttl or self.default_ttl
+        stale_ttl = max(stale_ttl or ttl, ttl)
+        
+        entry = self.get(key)
+        if isinstance(entry, dict) and 'fresh_until' in entry:
+            if entry['fresh_until'] > time.time():
+                return entry['value']
+            
+            self.stale_hits += 1
+            self._refresh_in_background(key, loader, ttl, stale_ttl, should_cache)
+            return entry['value']
+        
+        value = loader()
+        self._store_swr(key, value, ttl, stale_ttl, should_cache)
+        return value
+    
+    def refresh(self,
+                key: str,
+                loader: Callable[[], Any],
+                ttl: Optional[int] = None,
+                stale_ttl: Optional[int] = None,
+                should_cache: Optional[Callable[[Any], bool]] = None) -> None:
+        """
+        Reload a stale-while-revalidate entry now, whatever its age
+        
+        Used to warm popular keys before they go stale. Arguments are the
+        same as for get_or_refresh.
+        """
+        ttl = ttl or self.default_ttl
+        stale_ttl = max(stale_ttl or ttl, ttl)
+        self._store_swr(key, loader(), ttl, stale_ttl, should_cache)
+    
+    def _store_swr(self, key: str, value: Any, ttl: int, stale_ttl: int,
+                   should_cache: Optional[Callable[[Any], bool]]) -> None:
+        """Store a value with its freshness deadline"""
+        if should_cache is not None and not should_cache(value):
+            return
+        self.set(key, {'value': value, 'fresh_until': time.time() + ttl}, ttl=stale_ttl)
+    
+    def _refresh_in_background(self, key: str, loader: Callable[[], Any],
+                               ttl: int, stale_ttl: int,
+                               should_cache: Optional[Callable[[Any], bool]]) -> None:
+        """Reload a stale entry on a daemon thread (one refresh per key)"""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def refresh():
+            try:
+                self._store_swr(key, loader(), ttl, stale_ttl, should_cache)
+            except Exception as e:
+                logger.warning("Background refresh failed for %s, serving stale: %s", key, e)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=refresh, daemon=True).start()
+    
+    def swr_cached(self,
+                   key_prefix: str = 'default',
+                   ttl: Optional[int] = None,
+                   stale_ttl: Optional[int] = None) -> Callable:
+        """
+        Decorator for stale-while-revalidate caching of function results
+        
+        Args:
+            key_prefix: Prefix for cache keys
+            ttl: Seconds a result counts as fresh
+            stale_ttl: Seconds a stale result may still be served
+            
+        Returns:
+            Decorated function
+        """
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                cache_key = self.swr_key(key_prefix, args, sorted(kwargs.items()))
+                return self.get_or_refresh(
+                    cache_key, lambda: func(*args, **kwargs), ttl=ttl, stale_ttl=stale_ttl
+                )
+            
+            return wrapper
+        return decorator
+    
     def get_statistics(self) -> dict:
         """
         Get cache statistics
@@ -293,9 +504,12 @@ class CacheManager:
             'hits': self.hits,
             'misses': self.misses,
             'errors': self.errors,
+            'stale_hits': self.stale_hits,
+            'l1_hits': self.l1_hits,
             'total_requests': total_requests,
             'hit_rate_percent': round(hit_rate, 2),
-            'fallback_cache_size': len(self.fallback_cache)
+            'fallback_cache_size': len(self.fallback_cache),
+            'l1_cache_size': len(self.l1_cache)
         }
         
         # Get Redis info if available
@@ -311,11 +525,16 @@ class CacheManager:
         
         return stats
     
+    # The web API and the other clients expose their counters as get_stats()
+    get_stats = get_statistics
+    
     def reset_statistics(self) -> None:
         """Reset cache statistics counters"""
         self.hits = 0
         self.misses = 0
         self.errors = 0
+        self.stale_hits = 0
+        self.l1_hits = 0
 
 
 # Global cache manager instance
@@ -19,6 +19,8 @@ class Config:
     FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     FLASK_PORT = int(os.getenv('FLASK_PORT', 5000))
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+    FAST_BOOT = os.getenv('FAST_BOOT', 'false').lower() in ('1', 'true')  # Health-check external APIs in the background
+    JINJA_CACHE_DIR = os.getenv('JINJA_CACHE_DIR', '')  # Compiled template cache; empty uses a per-user temp dir
     
     # SerpAPI Configuration
     SERPAPI_KEY = os.getenv('SERPAPI_KEY', '')
@@ -33,6 +35,10 @@ class Config:
     GOOGLE_TIMEOUT = int(os.getenv('GOOGLE_TIMEOUT', 10))
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
+    # Marketplace / Job Search Integrations
+    MARKETPLACE_ENABLED = os.getenv('MARKETPLACE_ENABLED', 'true').lower() == 'true'
+    JOBS_ENABLED = os.getenv('JOBS_ENABLED', 'true').lower() == 'true'
+
     # Search Mode Configuration
     SEARCH_MODE = os.getenv('SEARCH_MODE', 'hybrid')  # local, serpapi, hybrid
     
@@ -54,6 +60,9 @@ class Config:
     CRAWLER_TIMEOUT = int(os.getenv('CRAWLER_TIMEOUT', 10))
     CRAWLER_RESPECT_ROBOTS = os.getenv('CRAWLER_RESPECT_ROBOTS', 'true').lower() == 'true'
     CRAWLER_USER_AGENT = os.getenv('CRAWLER_USER_AGENT', 'CustomSearchBot/1.0')
+    CRAWLER_MAX_URLS_PER_REQUEST = int(os.getenv('CRAWLER_MAX_URLS_PER_REQUEST', 100))
+    CRAWLER_MAX_DEPTH = int(os.getenv('CRAWLER_MAX_DEPTH', 3))
+    CRAWLER_MAX_JOBS = int(os.getenv('CRAWLER_MAX_JOBS', 1))  # Concurrent /api/crawl jobs per worker
     
     # Indexer Settings
     INDEXER_AUTO_FLUSH = os.getenv('INDEXER_AUTO_FLUSH', 'true').lower() == 'true'
@@ -73,6 +82,12 @@ class Config:
     CACHE_TTL_SEARCH = int(os.getenv('CACHE_TTL_SEARCH', 3600))
     CACHE_TTL_SUGGESTIONS = int(os.getenv('CACHE_TTL_SUGGESTIONS', 86400))
     CACHE_TTL_API_RESULTS = int(os.getenv('CACHE_TTL_API_RESULTS', 3600))
+    CACHE_TTL_API_FRESH = int(os.getenv('CACHE_TTL_API_FRESH', 300))
+    CACHE_L1_MAX_SIZE = int(os.getenv('CACHE_L1_MAX_SIZE', 1024))  # In-process LRU in front of Redis
+    CACHE_L1_TTL = int(os.getenv('CACHE_L1_TTL', 60))
+    CACHE_WARM_ENABLED = os.getenv('CACHE_WARM_ENABLED', 'true').lower() == 'true'
+    CACHE_WARM_INTERVAL = int(os.getenv('CACHE_WARM_INTERVAL', 240))  # Keep below CACHE_TTL_API_FRESH
+    CACHE_WARM_TOP_K = int(os.getenv('CACHE_WARM_TOP_K', 20))
     
     # Ranking Settings
     RANKING_MIN_FREQUENCY = int(os.getenv('RANKING_MIN_FREQUENCY', 1))
@@ -104,6 +119,7 @@ class Config:
     WEB_HOST = '127.0.0.1'
     WEB_PORT = int(os.getenv('WEB_PORT', 8080))
     WEB_DEBUG = os.getenv('WEB_DEBUG', 'true').lower() == 'true'
+    WEB_MAX_CONTENT_LENGTH = int(os.getenv('WEB_MAX_CONTENT_LENGTH', 1 << 20))  # 1 MiB request bodies
     
     @classmethod
     def validate(cls) -> bool:
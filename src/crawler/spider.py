@@ -79,13 +79,19 @@ class Spider:
         self.crawled_count = 0
         self.error_count = 0
 
-        # The crawl queue stores tuples: (url, depth)
-        initial_tasks = [(url, 0) for url in urls]
+        # The crawl queue stores tuples: (url, depth). Start URLs are marked
+        # visited up front, so duplicates and pages linking back to them
+        # don't fetch them again.
+        initial_tasks = []
+        for url in urls:
+            if url not in self.visited_urls:
+                self.visited_urls.add(url)
+                initial_tasks.append((url, 0))
         # future_tasks now maps the Future object to the URL it is crawling
         future_tasks = {}
         
         self.logger.info(
-            f"Crawl requested: {len(urls)} starts, Max Depth={max_depth}, Max Pages={max_total_pages}"
+            "Crawl requested: %s starts, Max Depth=%s, Max Pages=%s", len(urls), max_depth, max_total_pages
         )
         
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
@@ -133,9 +139,9 @@ class Spider:
                     
                 except Exception as e:
                     # Error was handled and counted inside _crawl_and_extract
-                    self.logger.debug(f"Task finished with warning/error. Crawl continues.")
+                    self.logger.debug("Task finished with warning/error. Crawl continues.")
 
-        self.logger.info(f"Crawl job finished. Crawled {self.crawled_count} pages with {self.error_count} errors.")
+        self.logger.info("Crawl job finished. Crawled %s pages with %s errors.", self.crawled_count, self.error_count)
         return {
             'crawled': self.crawled_count,
             'errors': self.error_count,
@@ -154,12 +160,12 @@ class Spider:
         # We rely on the check in the main loop.
         
         try:
-            self.logger.debug(f"Fetching URL (Depth {depth}/{max_depth}): {url}")
+            self.logger.debug("Fetching URL (Depth %s/%s): %s", depth, max_depth, url)
             response = self.session.get(url, timeout=15) # Increased timeout slightly for large docs
             response.raise_for_status()
             
             if 'text/html' not in response.headers.get('Content-Type', ''):
-                self.logger.debug(f"Skipping non-HTML content: {url}")
+                self.logger.debug("Skipping non-HTML content: %s", url)
                 return []
                 
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -177,7 +183,7 @@ class Spider:
 
             with self._lock:
                 self.crawled_count += 1
-            self.logger.info(f"Indexed (Depth {depth}): {url}")
+            self.logger.info("Indexed (Depth %s): %s", depth, url)
 
             # --- Link Extraction for Recursion ---
             links = []
@@ -194,12 +200,12 @@ class Spider:
         except requests.exceptions.RequestException as e:
             with self._lock:
                 self.error_count += 1
-            self.logger.warning(f"Fetch failed for {url}: {e}")
+            self.logger.warning("Fetch failed for %s: %s", url, e)
             
         except Exception as e:
             with self._lock:
                 self.error_count += 1
-            self.logger.error(f"Processing error for {url}: {e}", exc_info=True)
+            self.logger.error("Processing error for %s: %s", url, e, exc_info=True)
             
         return []
 
@@ -6,11 +6,15 @@ Official Google Search API integration with fallback support
 import os
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from src.utils.http_session import pooled_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,13 +29,21 @@ class GoogleSearchClient:
     Falls back to SerpAPI when quota is exceeded.
     """
     
-    def __init__(self, api_key: Optional[str] = None, cse_id: Optional[str] = None):
+    # Pages of one search fetched together after the first. Page 1 goes
+    # alone, so a query with a short first page uses one unit of quota;
+    # the rest follow in waves of this size, stopping once results run out
+    MAX_CONCURRENT_PAGES = 4
+    
+    def __init__(self, api_key: Optional[str] = None, cse_id: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize Google Search client.
         
         Args:
             api_key: Google API key
             cse_id: Custom Search Engine ID
+            session: requests session to share with other clients
+                (default: a keep-alive pool of the client's own)
         """
         self.api_key = api_key or os.getenv('GOOGLE_API_KEY')
         # Support both naming conventions: GOOGLE_CSE_ID and GOOGLE_SEARCH_ENGINE_ID
@@ -45,6 +57,11 @@ class GoogleSearchClient:
         except Exception as e:
             raise ValueError(f"Failed to initialize Google Search: {str(e)}")
         
+        # Keep-alive pool for the plain HTTP endpoints (autocomplete)
+        if session is None:
+            session = pooled_session()
+        self._session = session
+        
         # Statistics
         self.stats = {
             'total_requests': 0,
@@ -94,16 +111,14 @@ class GoogleSearchClient:
             # Calculate number of pages needed
             num_pages = (max_results + 9) // 10  # Round up
             
-            # Fetch multiple pages if needed
+            page_params = []
             for page in range(num_pages):
-                start_index = page * results_per_page + 1  # Google uses 1-based indexing
-                
                 # Build search parameters
                 params = {
                     'q': query,
                     'cx': self.cse_id,
                     'num': 10,  # Always request 10 per page
-                    'start': start_index,  # Google's pagination parameter
+                    'start': page * results_per_page + 1,  # Google uses 1-based indexing
                     'safe': 'active' if safe_search else 'off',
                     'lr': f'lang_{language}'
                 }
@@ -116,21 +131,45 @@ class GoogleSearchClient:
                 if file_type:
                     params['fileType'] = file_type
                 
-                logger.info(f"Executing Google search: query='{query}', page={page+1}")
-                
-                # Execute search
-                result = self.service.cse().list(**params).execute()
-                
-                # Check if we got any results
-                items = result.get('items', [])
-                if not items:
-                    break  # No more results available
+                page_params.append(params)
+            
+            logger.info("Executing Google search: query='%s', pages=%s", query, num_pages)
+            
+            # Fetch page 1 on its own, then the rest in waves only while the
+            # pages come back full; the pages of a wave are requested
+            # concurrently and merged in order
+            result = {}
+            waves = [page_params[:1]] + [
+                page_params[first:first + self.MAX_CONCURRENT_PAGES]
+                for first in range(1, num_pages, self.MAX_CONCURRENT_PAGES)
+            ]
+            for wave in waves:
+                if len(wave) == 1:
+                    pages = [self.service.cse().list(**wave[0]).execute()]
+                else:
+                    with ThreadPoolExecutor(max_workers=len(wave), thread_name_prefix='google-page') as executor:
+                        pages = list(executor.map(self._fetch_page, wave))
                 
-                all_results.extend(items)
+                exhausted = False
+                for result in pages:
+                    # Check if we got any results
+                    items = result.get('items', [])
+                    if not items:
+                        exhausted = True  # No more results available
+                        break
+                    
+                    all_results.extend(items)
+                    
+                    # Stop if we have enough results, or this was the last page
+                    if len(all_results) >= max_results:
+                        all_results = all_results[:max_results]
+                        exhausted = True
+                        break
+                    if len(items) < results_per_page:
+                        exhausted = True
+                        break
                 
-                # Stop if we have enough results
-                if len(all_results) >= max_results:
-                    all_results = all_results[:max_results]
+                if exhausted:
                     break
             
             # Normalize results (using combined results)
@@ -139,7 +178,7 @@ class GoogleSearchClient:
             self.stats['successful_requests'] += 1
             self.stats['total_results_returned'] += len(normalized['organic_results'])
             
-            logger.info(f"Google search successful: {len(normalized['organic_results'])} results")
+            logger.info("Google search successful: %s results", len(normalized['organic_results']))
             
             return normalized
             
@@ -152,14 +191,23 @@ class GoogleSearchClient:
                 logger.warning("Google API quota exceeded")
                 raise GoogleSearchException("Quota exceeded")
             
-            logger.error(f"Google search error: {str(e)}")
+            logger.error("Google search error: %s", e)
             raise GoogleSearchException(f"Search failed: {str(e)}")
         
         except Exception as e:
             self.stats['failed_requests'] += 1
-            logger.error(f"Google search error: {str(e)}")
+            logger.error("Google search error: %s", e)
             raise GoogleSearchException(f"Search failed: {str(e)}")
     
+    def _fetch_page(self, params: Dict[str, Any]) -> Dict:
+        """
+        Fetch one page of results on a pool thread.
+        
+        The service's own httplib2 connection isn't thread-safe, so each
+        concurrent page gets a connection of its own.
+        """
+        return self.service.cse().list(**params).execute(http=httplib2.Http())
+    
     def get_suggestions(self, query: str, max_suggestions: int = 10) -> List[str]:
         """
         Get search suggestions/autocomplete for a query.
@@ -179,7 +227,7 @@ class GoogleSearchClient:
                 'hl': 'en'
             }
             
-            response = requests.get(
+            response = self._session.get(
                 'https://suggestqueries.google.com/complete/search',
                 params=params,
                 timeout=5
@@ -191,17 +239,17 @@ class GoogleSearchClient:
             
             if isinstance(data, list) and len(data) > 1:
                 suggestions = data[1][:max_suggestions]
-                logger.info(f"Got {len(suggestions)} suggestions for query: '{query}'")
+                logger.info("Got %s suggestions for query: '%s'", len(suggestions), query)
                 return suggestions
             
-            logger.warning(f"No suggestions found for query: '{query}'")
+            logger.warning("No suggestions found for query: '%s'", query)
             return []
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Google Suggestions API error: {str(e)}")
+            logger.error("Google Suggestions API error: %s", e)
             return []
         except (ValueError, KeyError, IndexError) as e:
-            logger.error(f"Error parsing suggestions response: {str(e)}")
+            logger.error("Error parsing suggestions response: %s", e)
             return []
     
     def _normalize_results(self, raw_results: Dict, query: str) -> Dict[str, Any]:
@@ -312,18 +360,22 @@ class GoogleSearchClient:
         except:
             return ''
     
-    def health_check(self) -> bool:
+    def health_check(self, timeout: Optional[float] = None) -> bool:
         """
         Perform health check.
         
+        A single one-result request without search()'s retries, on a
+        connection of its own so the timeout applies to it alone.
+        
+        Args:
+            timeout: Seconds to wait for the API (default: no limit)
+        
         Returns:
             True if API is accessible
         """
         try:
-            # Perform a simple test search
-            result = self.search("test", max_results=1)
+            request = self.service.cse().list(q='test', cx=self.cse_id, num=1)
+            request.execute(http=httplib2.Http(timeout=timeout))
             return True
-        except GoogleSearchException:
-            return False
-        except:
+        except Exception:
             return False
\ No newline at end of file
@@ -5,40 +5,115 @@ Handles all interactions with SerpAPI (DuckDuckGo) for live web search
 
 import os
 import time
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
-from serpapi import GoogleSearch
+from serpapi import GoogleSearch as _GoogleSearch
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from ratelimit import limits, sleep_and_retry
 import requests
 
+from src.utils.http_session import pooled_session
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+SERPAPI_SEARCH_URL = 'https://serpapi.com/search.json'
+
 
 class SerpAPIException(Exception):
     """Custom exception for SerpAPI errors"""
     pass
 
 
+class GoogleSearch(_GoogleSearch):
+    """serpapi's GoogleSearch, sending its request over a shared session"""
+
+    def __init__(self, params_dict, session=None):
+        super().__init__(params_dict)
+        self.session = session or requests
+
+    def get_response(self, path='/search'):
+        url, parameter = self.construct_url(path)
+        return self.session.get(url, params=parameter, timeout=self.timeout)
+
+    def get_dict(self, keys=None):
+        """
+        Fetch the results as a dict.
+
+        Args:
+            keys: Top-level keys to keep ('error' is always kept). With ijson
+                installed the body is stream-parsed, only these values are
+                built, and the rest of the body is read off unparsed once
+                all of them are in. None returns the whole payload.
+        """
+        if keys is None:
+            return super().get_dict()
+        wanted = set(keys)
+        if ijson is None:
+            return {k: v for k, v in super().get_dict().items() if k in wanted or k == 'error'}
+
+        self.params_dict['output'] = 'json'
+        url, parameter = self.construct_url()
+        results = {}
+        with self.session.get(url, params=parameter, timeout=self.timeout, stream=True) as response:
+            response.raw.decode_content = True
+            for key, value in ijson.kvitems(response.raw, '', use_float=True):
+                if key in wanted or key == 'error':
+                    results[key] = value
+                    if wanted <= results.keys():
+                        break
+            # Finish the body so the connection goes back to the pool
+            while response.raw.read(65536):
+                pass
+        return results
+
+
 class SerpAPIClient:
     """
     Client for interacting with SerpAPI using DuckDuckGo engine.
     Includes rate limiting, retry logic, and error handling.
     """
     
-    def __init__(self, api_key: Optional[str] = None, timeout: int = 5):
+    # Upper bound on searches one search_many batch keeps in flight
+    MAX_CONCURRENT_SEARCHES = 10
+    
+    # Pages of one search fetched together after the first. Page 1 goes
+    # alone, so a query with a short first page is billed for one request;
+    # the rest follow in waves of this size, stopping once results run out
+    MAX_CONCURRENT_PAGES = 4
+    
+    def __init__(self, api_key: Optional[str] = None, timeout: int = 5,
+                 session: Optional[requests.Session] = None):
         """
         Initialize SerpAPI client.
         
         Args:
             api_key: SerpAPI key (reads from env if not provided)
             timeout: Request timeout in seconds
+            session: requests session to share with other clients
+                (default: a keep-alive pool of the client's own)
         """
         self.api_key = api_key or os.getenv('SERPAPI_KEY')
         if not self.api_key:
             raise ValueError("SERPAPI_KEY not found in environment variables")
         
         self.timeout = timeout
+        
+        # One keep-alive pool for every call, so cache misses skip the TLS handshake
+        if session is None:
+            session = pooled_session()
+        self._session = session
         self.base_params = {
             'api_key': self.api_key,
             'engine': 'duckduckgo',  # Using DuckDuckGo engine
@@ -91,41 +166,62 @@ class SerpAPIClient:
             results_per_page = 10  # SerpAPI returns 10 results per request
             num_pages = (max_results + 9) // 10  # Round up to get enough pages
             
-            # Fetch multiple pages if needed to reach max_results
+            page_params = []
             for page in range(num_pages):
-                start = page * results_per_page
-                
                 params = {
                     **self.base_params,
                     'q': query,
                     'kl': region,
                     'safe': '1' if safe_search else '-1',
-                    'start': start  # SerpAPI pagination parameter
+                    'start': page * results_per_page  # SerpAPI pagination parameter
                 }
                 
                 if time_period:
                     params['df'] = time_period
                 
-                logger.info(f"Executing SerpAPI search: query='{query}', page={page+1}, region={region}")
-                
-                search = GoogleSearch(params)
-                results = search.get_dict()
-                
-                # Check for errors
-                if 'error' in results:
-                    self.stats['failed_requests'] += 1
-                    raise SerpAPIException(f"SerpAPI error: {results['error']}")
-                
-                # Get organic results from this page
-                page_results = results.get('organic_results', [])
-                if not page_results:
-                    break  # No more results available
+                page_params.append(params)
+            
+            logger.info("Executing SerpAPI search: query='%s', pages=%s, region=%s", query, num_pages, region)
+            
+            # Fetch page 1 on its own, then the rest in waves only while the
+            # pages come back full; the pages of a wave are requested
+            # concurrently and merged in order
+            waves = [page_params[:1]] + [
+                page_params[first:first + self.MAX_CONCURRENT_PAGES]
+                for first in range(1, num_pages, self.MAX_CONCURRENT_PAGES)
+            ]
+            for wave in waves:
+                if len(wave) == 1:
+                    pages = [self._fetch_page(wave[0])]
+                else:
+                    with ThreadPoolExecutor(max_workers=len(wave), thread_name_prefix='serpapi-page') as executor:
+                        pages = list(executor.map(self._fetch_page, wave))
                 
-                all_results.extend(page_results)
+                exhausted = False
+                for results in pages:
+                    # Check for errors
+                    if 'error' in results:
+                        self.stats['failed_requests'] += 1
+                        raise SerpAPIException(f"SerpAPI error: {results['error']}")
+                    
+                    # Get organic results from this page
+                    page_results = results.get('organic_results', [])
+                    if not page_results:
+                        exhausted = True  # No more results available
+                        break
+                    
+                    all_results.extend(page_results)
+                    
+                    # Stop if we have enough results, or this was the last page
+                    if len(all_results) >= max_results:
+                        all_results = all_results[:max_results]
+                        exhausted = True
+                        break
+                    if len(page_results) < results_per_page:
+                        exhausted = True
+                        break
                 
-                # Stop if we have enough results
-                if len(all_results) >= max_results:
-                    all_results = all_results[:max_results]
+                if exhausted:
                     break
             
             # Normalize and structure the response
@@ -134,15 +230,20 @@ class SerpAPIClient:
             self.stats['successful_requests'] += 1
             self.stats['total_results_returned'] += len(normalized['organic_results'])
             
-            logger.info(f"SerpAPI search successful: {len(normalized['organic_results'])} results")
+            logger.info("SerpAPI search successful: %s results", len(normalized['organic_results']))
             
             return normalized
             
         except Exception as e:
             self.stats['failed_requests'] += 1
-            logger.error(f"SerpAPI search failed: {str(e)}")
+            logger.error("SerpAPI search failed: %s", e)
             raise SerpAPIException(f"Search failed: {str(e)}") from e
     
+    def _fetch_page(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one page of web results over the shared session"""
+        search = GoogleSearch(params, session=self._session)
+        return search.get_dict(keys=('organic_results',))
+    
     def _normalize_results(self, raw_results: Dict, max_results: int) -> Dict[str, Any]:
         """
         Normalize SerpAPI results to match internal format.
@@ -234,14 +335,14 @@ class SerpAPIClient:
                 'engine': 'duckduckgo_suggestions'
             }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
+            search = GoogleSearch(params, session=self._session)
+            results = search.get_dict(keys=('suggestions',))
             
             suggestions = results.get('suggestions', [])[:max_suggestions]
             return [s.get('value', s) if isinstance(s, dict) else s for s in suggestions]
             
         except Exception as e:
-            logger.error(f"Failed to get suggestions: {str(e)}")
+            logger.error("Failed to get suggestions: %s", e)
             return []
     
     def search_news(self, query: str, max_results: int = 10) -> Dict[str, Any]:
@@ -262,29 +363,13 @@ class SerpAPIClient:
                 'tbm': 'nws'  # News search
             }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
-            
-            news_results = []
-            for item in results.get('news_results', [])[:max_results]:
-                news_results.append({
-                    'title': item.get('title', ''),
-                    'url': item.get('link', ''),
-                    'snippet': item.get('snippet', ''),
-                    'source': item.get('source', ''),
-                    'date': item.get('date', ''),
-                    'thumbnail': item.get('thumbnail'),
-                    'type': 'news'
-                })
+            search = GoogleSearch(params, session=self._session)
+            results = search.get_dict(keys=('news_results',))
             
-            return {
-                'query': query,
-                'results': news_results,
-                'total': len(news_results)
-            }
+            return self._normalize_news(query, results, max_results)
             
         except Exception as e:
-            logger.error(f"News search failed: {str(e)}")
+            logger.error("News search failed: %s", e)
             return {'query': query, 'results': [], 'total': 0}
     
     def search_images(self, query: str, max_results: int = 20) -> Dict[str, Any]:
@@ -305,31 +390,162 @@ class SerpAPIClient:
                 'tbm': 'isch'  # Image search
             }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
+            search = GoogleSearch(params, session=self._session)
+            results = search.get_dict(keys=('images_results',))
             
-            image_results = []
-            for item in results.get('images_results', [])[:max_results]:
-                image_results.append({
-                    'title': item.get('title', ''),
-                    'url': item.get('link', ''),
-                    'thumbnail': item.get('thumbnail', ''),
-                    'source': item.get('source', ''),
-                    'width': item.get('original_width'),
-                    'height': item.get('original_height'),
-                    'type': 'image'
-                })
+            return self._normalize_images(query, results, max_results)
             
-            return {
-                'query': query,
-                'results': image_results,
-                'total': len(image_results)
-            }
+        except Exception as e:
+            logger.error("Image search failed: %s", e)
+            return {'query': query, 'results': [], 'total': 0}
+    
+    @staticmethod
+    def _normalize_news(query: str, results: Dict, max_results: int) -> Dict[str, Any]:
+        """Shape raw SerpAPI news results into the API response format."""
+        news_results = []
+        for item in results.get('news_results', [])[:max_results]:
+            news_results.append({
+                'title': item.get('title', ''),
+                'url': item.get('link', ''),
+                'snippet': item.get('snippet', ''),
+                'source': item.get('source', ''),
+                'date': item.get('date', ''),
+                'thumbnail': item.get('thumbnail'),
+                'type': 'news'
+            })
+        
+        return {
+            'query': query,
+            'results': news_results,
+            'total': len(news_results)
+        }
+    
+    @staticmethod
+    def _normalize_images(query: str, results: Dict, max_results: int) -> Dict[str, Any]:
+        """Shape raw SerpAPI image results into the API response format."""
+        image_results = []
+        for item in results.get('images_results', [])[:max_results]:
+            image_results.append({
+                'title': item.get('title', ''),
+                'url': item.get('link', ''),
+                'thumbnail': item.get('thumbnail', ''),
+                'source': item.get('source', ''),
+                'width': item.get('original_width'),
+                'height': item.get('original_height'),
+                'type': 'image'
+            })
+        
+        return {
+            'query': query,
+            'results': image_results,
+            'total': len(image_results)
+        }
+    
+    # ------------------------------------------------------------------
+    # Async variants (require httpx)
+    # ------------------------------------------------------------------
+    
+    async def _async_get_dict(self, client, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one SerpAPI response on an httpx.AsyncClient."""
+        response = await client.get(SERPAPI_SEARCH_URL, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+    
+    async def async_search_news(self, query: str, max_results: int = 10,
+                                client=None) -> Dict[str, Any]:
+        """
+        Async version of search_news.
+        
+        Args:
+            query: Search query
+            max_results: Maximum results
+            client: Optional shared httpx.AsyncClient
+            
+        Returns:
+            News results dictionary
+        """
+        return await self._async_vertical(query, max_results, 'nws', self._normalize_news, client)
+    
+    async def async_search_images(self, query: str, max_results: int = 20,
+                                  client=None) -> Dict[str, Any]:
+        """
+        Async version of search_images.
+        
+        Args:
+            query: Search query
+            max_results: Maximum results
+            client: Optional shared httpx.AsyncClient
+            
+        Returns:
+            Image results dictionary
+        """
+        return await self._async_vertical(query, max_results, 'isch', self._normalize_images, client)
+    
+    async def _async_vertical(self, query: str, max_results: int, tbm: str,
+                              normalize, client=None) -> Dict[str, Any]:
+        """Fetch and normalize one news/image search over httpx."""
+        if httpx is None:
+            raise SerpAPIException("httpx is required for async search: pip install httpx")
+        
+        params = {**self.base_params, 'q': query, 'tbm': tbm}
+        
+        try:
+            if client is None:
+                async with httpx.AsyncClient() as own_client:
+                    results = await self._async_get_dict(own_client, params)
+            else:
+                results = await self._async_get_dict(client, params)
+            
+            if 'error' in results:
+                raise SerpAPIException(f"SerpAPI error: {results['error']}")
+            
+            return normalize(query, results, max_results)
             
         except Exception as e:
-            logger.error(f"Image search failed: {str(e)}")
+            logger.error("Async search (%s) failed: %s", tbm, e)
             return {'query': query, 'results': [], 'total': 0}
     
+    async def async_search_many(self, queries: List[str], vertical: str = 'news',
+                                max_results: int = 10) -> List[Dict[str, Any]]:
+        """
+        Run several news/image searches concurrently on one connection pool.
+        
+        Args:
+            queries: Search queries
+            vertical: 'news' or 'images'
+            max_results: Maximum results per query
+            
+        Returns:
+            One results dictionary per query, in input order
+        """
+        if httpx is None:
+            raise SerpAPIException("httpx is required for async search: pip install httpx")
+        
+        search = self.async_search_images if vertical == 'images' else self.async_search_news
+        slots = asyncio.Semaphore(self.MAX_CONCURRENT_SEARCHES)
+        
+        async def bounded(query, client):
+            async with slots:
+                return await search(query, max_results, client=client)
+        
+        async with httpx.AsyncClient() as client:
+            return await asyncio.gather(*(bounded(query, client) for query in queries))
+    
+    def search_many(self, queries: List[str], vertical: str = 'news',
+                    max_results: int = 10) -> List[Dict[str, Any]]:
+        """
+        Blocking wrapper around async_search_many for sync callers (Flask views).
+        
+        Falls back to the sync calls on a small thread pool when httpx isn't
+        installed; either way at most MAX_CONCURRENT_SEARCHES run at once.
+        """
+        if httpx is None:
+            search = self.search_images if vertical == 'images' else self.search_news
+            workers = min(self.MAX_CONCURRENT_SEARCHES, len(queries)) or 1
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='serpapi-batch') as executor:
+                return list(executor.map(lambda query: search(query, max_results), queries))
+        return asyncio.run(self.async_search_many(queries, vertical, max_results))
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get client statistics."""
         return {
@@ -350,16 +566,24 @@ class SerpAPIClient:
         except:
             return ''
     
-    def health_check(self) -> bool:
+    def health_check(self, timeout: Optional[float] = None) -> bool:
         """
         Perform a health check on the API.
         
+        A single page fetch without search()'s retries and rate limiter, over
+        a plain request (the shared session's adapter retries too), so the
+        probe takes at most about one timeout.
+        
+        Args:
+            timeout: Seconds to wait for the API (default: the client's timeout)
+        
         Returns:
             True if API is accessible, False otherwise
         """
+        params = {**self.base_params, 'q': 'test', 'start': 0}
         try:
-            # Perform a simple test search
-            result = self.search("test", max_results=1)
-            return len(result.get('organic_results', [])) >= 0
-        except:
+            search = GoogleSearch(params)
+            search.timeout = self.timeout if timeout is None else timeout
+            return 'error' not in search.get_dict(keys=('organic_results',))
+        except Exception:
             return False
\ No newline at end of file
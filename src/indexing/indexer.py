@@ -23,17 +23,22 @@ class Indexer:
         # Inverted index: term -> list of [doc_id, freq]
         self.index = defaultdict(list)
         self._lock = threading.Lock()
+        # Bumped on every change, so readers can tell when derived data is stale
+        self.version = 0
         # Background flusher settings
         self._auto_flush = False
         self._flush_interval = None
+        self._on_flush = None
         self._stop_event = threading.Event()
         self._flusher_thread = None
         
         # Load index from disk if it exists
         loaded_index = self.database.load_index()
         if loaded_index:
+            # Copied: index_document updates postings in place, and the
+            # loaded dict is shared through the Database's cache
             for term, postings in loaded_index.items():
-                self.index[term] = postings
+                self.index[term] = [list(p) for p in postings]
 
     def index_document(self, doc_id, tokens):
         """Thread-safe update of the in-memory index. Does NOT persist to disk.
@@ -42,21 +47,37 @@ class Indexer:
             doc_id (str): document identifier
             tokens (iterable): token sequence for the document
         """
-        term_freq = defaultdict(int)
-        for token in tokens:
-            term_freq[token] += 1
+        self.index_documents([(doc_id, tokens)])
+
+    def index_documents(self, docs):
+        """Like `index_document` for many documents, taking the lock once.
+
+        Args:
+            docs (iterable): (doc_id, tokens) pairs
+        """
+        # Count outside the lock; only the posting updates need it
+        counted = []
+        for doc_id, tokens in docs:
+            term_freq = defaultdict(int)
+            for token in tokens:
+                term_freq[token] += 1
+            counted.append((doc_id, term_freq))
+        if not counted:
+            return
 
         with self._lock:
-            for term, freq in term_freq.items():
-                postings = self.index[term]
-                # Try to merge with existing posting for the same doc_id
-                for p in postings:
-                    if p[0] == doc_id:
-                        p[1] += freq
-                        break
-                else:
-                    # store as list so JSON serialization keeps it as array
-                    postings.append([doc_id, freq])
+            for doc_id, term_freq in counted:
+                for term, freq in term_freq.items():
+                    postings = self.index[term]
+                    # Try to merge with existing posting for the same doc_id
+                    for p in postings:
+                        if p[0] == doc_id:
+                            p[1] += freq
+                            break
+                    else:
+                        # store as list so JSON serialization keeps it as array
+                        postings.append([doc_id, freq])
+            self.version += 1
 
     def flush(self):
         """Persist the current in-memory index to storage (thread-safe).
@@ -70,15 +91,21 @@ class Indexer:
             self.database.save_index(serializable)
 
     # --- background flusher API -------------------------------------------------
-    def start_auto_flush(self, interval=5.0):
+    def start_auto_flush(self, interval=5.0, on_flush=None):
         """Start a background thread that calls `flush()` every `interval` seconds.
 
         If a flusher is already running this is a no-op.
+
+        Args:
+            interval (float): seconds between flushes
+            on_flush (callable): called with no arguments on the flusher
+                thread after each successful flush
         """
         if self._flusher_thread and self._flusher_thread.is_alive():
             return
         self._auto_flush = True
         self._flush_interval = float(interval)
+        self._on_flush = on_flush
         self._stop_event.clear()
         self._flusher_thread = threading.Thread(target=self._auto_flush_loop, daemon=True)
         self._flusher_thread.start()
@@ -88,6 +115,8 @@ class Indexer:
         while not self._stop_event.wait(self._flush_interval):
             try:
                 self.flush()
+                if self._on_flush is not None:
+                    self._on_flush()
             except Exception:
                 # Swallow exceptions in background flusher to avoid thread death.
                 pass
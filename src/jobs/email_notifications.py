@@ -28,10 +28,10 @@ def _send_email(to_email: str, subject: str, body: str):
             server.login(SMTP_USERNAME, SMTP_PASSWORD)
             server.sendmail(SMTP_USERNAME, to_email, msg.as_string())
 
-        logger.info(f"Email sent to {to_email} — {subject}")
+        logger.info("Email sent to %s — %s", to_email, subject)
 
     except Exception as e:
-        logger.error(f"Email send failure ({to_email}): {e}")
+        logger.error("Email send failure (%s): %s", to_email, e)
         raise
 def send_job_alert_email(alert: dict, jobs: list):
     """
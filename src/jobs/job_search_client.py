@@ -11,6 +11,9 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from src.utils.concurrency import gather_with_deadline
+from src.utils.http_session import pooled_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,8 +46,16 @@ class JobSearchClient:
     }
     # ---------------------------------------------
     
-    def __init__(self):
-        """Initialize job search client"""
+    # Seconds a search waits for all sources together; late sources are dropped
+    SOURCE_TIMEOUT = 15
+    
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize job search client
+        
+        Args:
+            session: requests session to share with other clients
+        """
         self.rapidapi_key = os.getenv('RAPIDAPI_KEY')
         
         # Statistics
@@ -55,6 +66,12 @@ class JobSearchClient:
             'total_jobs_returned': 0
         }
         
+        # Job board requests of every search, on long-lived threads
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='job-sources')
+        
+        # One keep-alive pool for every RapidAPI call, so searches skip the TLS handshake
+        self._session = session or pooled_session()
+        
         if not self.rapidapi_key:
             logger.warning("JobSearchClient initialized without RAPIDAPI_KEY. Searches will fail.")
             
@@ -103,35 +120,34 @@ class JobSearchClient:
         }
         
         # Search job boards in parallel
-        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
-            futures = {}
-            
-            for source_name in sources:
-                if source_name in self.API_SOURCES:
-                     futures[source_name] = executor.submit(
-                        self._search_single_source, 
-                        source_name, 
-                        query, 
-                        location, 
-                        max_results,
-                        remote_only, 
-                        min_salary, 
-                        experience_level, 
-                        job_type
-                    )
-            
-            # Collect results
-            for source, future in futures.items():
-                try:
-                    source_results = future.result(timeout=15)
-                    results['sources'][source] = source_results
-                    results['jobs'].extend(source_results)
-                    results['metadata']['sources_searched'].append(source)
-                    self.stats['successful_searches'] += 1
-                except Exception as e:
-                    logger.error(f"{source} job search failed: {str(e)}")
-                    results['sources'][source] = []
-                    self.stats['failed_searches'] += 1
+        futures = {}
+        for source_name in sources:
+            if source_name in self.API_SOURCES:
+                futures[source_name] = self._executor.submit(
+                    self._search_single_source, 
+                    source_name, 
+                    query, 
+                    location, 
+                    max_results,
+                    remote_only, 
+                    min_salary, 
+                    experience_level, 
+                    job_type
+                )
+        
+        found, errors = gather_with_deadline(futures, self.SOURCE_TIMEOUT)
+        
+        # Collect results
+        for source in futures:
+            if source in errors:
+                logger.error("%s job search failed: %s", source, errors[source])
+                results['sources'][source] = []
+                self.stats['failed_searches'] += 1
+                continue
+            results['sources'][source] = found[source]
+            results['jobs'].extend(found[source])
+            results['metadata']['sources_searched'].append(source)
+            self.stats['successful_searches'] += 1
         
         # If we got no results from any source, fall back to mock data
         if len(results['jobs']) == 0:
@@ -217,7 +233,7 @@ class JobSearchClient:
                 params[k] = str(v).lower()
         
         # Execute the API call
-        response = requests.get(url, headers=headers, params=params, timeout=20)
+        response = self._session.get(url, headers=headers, params=params, timeout=20)
         response.raise_for_status()
         
         data = response.json()
@@ -521,6 +537,8 @@ class JobAlertManager:
         
         self.storage_path = storage_path
         self.alerts = {}
+        # user_email -> alert ids (a dict, to keep creation order)
+        self._ids_by_email: Dict[str, Dict[str, None]] = {}
         
         # Email configuration
         self.smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
@@ -529,7 +547,7 @@ class JobAlertManager:
         self.smtp_password = os.getenv('SMTP_PASSWORD')
         
         self._load_alerts()
-        logger.info(f"Job Alert Manager initialized with {len(self.alerts)} alerts")
+        logger.info("Job Alert Manager initialized with %s alerts", len(self.alerts))
     
     def create_alert(
         self,
@@ -555,9 +573,10 @@ class JobAlertManager:
             'last_checked': None,
             'jobs_found': 0
         }
+        self._ids_by_email.setdefault(user_email, {})[alert_id] = None
         
         self._save_alerts()
-        logger.info(f"Created job alert: {alert_id}")
+        logger.info("Created job alert: %s", alert_id)
         return alert_id
     
     def _load_alerts(self):
@@ -568,7 +587,11 @@ class JobAlertManager:
                 with open(self.storage_path, 'r') as f:
                     self.alerts = json.load(f)
         except Exception as e:
-            logger.error(f"Failed to load job alerts: {str(e)}")
+            logger.error("Failed to load job alerts: %s", e)
+        
+        self._ids_by_email = {}
+        for alert_id, alert in self.alerts.items():
+            self._ids_by_email.setdefault(alert['user_email'], {})[alert_id] = None
     
     def _save_alerts(self):
         """Save alerts to storage"""
@@ -578,14 +601,12 @@ class JobAlertManager:
             with open(self.storage_path, 'w') as f:
                 json.dump(self.alerts, f, indent=2)
         except Exception as e:
-            logger.error(f"Failed to save job alerts: {str(e)}")
+            logger.error("Failed to save job alerts: %s", e)
     
     def get_user_alerts(self, user_email: str) -> List[Dict]:
         """Get all alerts for a user"""
-        return [
-            alert for alert in self.alerts.values()
-            if alert['user_email'] == user_email and alert['is_active']
-        ]
+        alerts = (self.alerts[i] for i in self._ids_by_email.get(user_email, ()))
+        return [alert for alert in alerts if alert['is_active']]
     
     def get_stats(self) -> Dict[str, Any]:
         """Get alert statistics"""
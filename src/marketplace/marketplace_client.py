@@ -6,9 +6,12 @@ Aggregates product search across multiple marketplaces
 import os
 import logging
 import requests
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout, as_completed
+
+from src.utils.concurrency import gather_with_deadline
+from src.utils.http_session import pooled_session
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +22,16 @@ class MarketplaceClient:
     Supports Amazon, eBay, Walmart, and more.
     """
     
-    def __init__(self):
-        """Initialize marketplace client with API credentials"""
+    # Seconds a search waits for all marketplaces together; late ones are dropped
+    SOURCE_TIMEOUT = 10
+    
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize marketplace client with API credentials
+        
+        Args:
+            session: requests session to share with other clients
+        """
         # Amazon credentials
         self.amazon_access_key = os.getenv('AMAZON_ACCESS_KEY')
         self.amazon_secret_key = os.getenv('AMAZON_SECRET_KEY')
@@ -42,6 +53,12 @@ class MarketplaceClient:
             'failed_searches': 0
         }
         
+        # Marketplace requests of every search, on long-lived threads
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='marketplaces')
+        
+        # One keep-alive pool for every RapidAPI call, so searches skip the TLS handshake
+        self._session = session or pooled_session()
+        
         logger.info("Marketplace client initialized")
     
     def search_all(
@@ -69,22 +86,7 @@ class MarketplaceClient:
         """
         self.stats['total_searches'] += 1
         
-        if not marketplaces:
-            # Default marketplaces set
-            marketplaces = ['amazon', 'ebay', 'walmart']
-
-        # Filter marketplaces by available credentials and record unavailable ones
-        available = []
-        unavailable = []
-        for m in marketplaces:
-            if m == 'amazon' and self.amazon_access_key:
-                available.append('amazon')
-            elif m == 'ebay' and self.ebay_app_id:
-                available.append('ebay')
-            elif m == 'walmart' and self.rapidapi_key:
-                available.append('walmart')
-            else:
-                unavailable.append(m)
+        available, unavailable = self._split_available(marketplaces)
 
         if not available:
             # No marketplace credentials available -> fallback to mock data
@@ -96,9 +98,6 @@ class MarketplaceClient:
             mock_res['metadata']['unavailable'] = unavailable
             return mock_res
 
-        # Use only available marketplaces
-        marketplaces = available
-        
         results = {
             'query': query,
             'products': [],
@@ -113,40 +112,24 @@ class MarketplaceClient:
         }
         
         # Search marketplaces in parallel
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {}
-            
-            if 'amazon' in marketplaces and self.amazon_access_key:
-                futures['amazon'] = executor.submit(
-                    self._search_amazon, query, max_results, min_price, max_price
-                )
-            
-            if 'ebay' in marketplaces and self.ebay_app_id:
-                futures['ebay'] = executor.submit(
-                    self._search_ebay, query, max_results, min_price, max_price
-                )
-            
-            if 'walmart' in marketplaces and self.rapidapi_key:
-                futures['walmart'] = executor.submit(
-                    self._search_walmart, query, max_results, min_price, max_price
-                )
-            
-            # Collect results
-            for marketplace, future in futures.items():
-                try:
-                    marketplace_results = future.result(timeout=10)
-                    results['marketplaces'][marketplace] = marketplace_results
-                    results['products'].extend(marketplace_results)
-                    results['metadata']['sources'].append(marketplace)
-                    self.stats['successful_searches'] += 1
-                except Exception as e:
-                    logger.error(f"{marketplace} search failed: {str(e)}")
-                    results['marketplaces'][marketplace] = []
-                    self.stats['failed_searches'] += 1
+        futures = self._submit_searches(available, query, max_results, min_price, max_price)
+        found, errors = gather_with_deadline(futures, self.SOURCE_TIMEOUT)
+        
+        # Collect results
+        for marketplace in futures:
+            if marketplace in errors:
+                logger.error("%s search failed: %s", marketplace, errors[marketplace])
+                results['marketplaces'][marketplace] = []
+                self.stats['failed_searches'] += 1
+                continue
+            results['marketplaces'][marketplace] = found[marketplace]
+            results['products'].extend(found[marketplace])
+            results['metadata']['sources'].append(marketplace)
+            self.stats['successful_searches'] += 1
         
         # If we got no results from any provider, fall back to mock data
         if len(results['products']) == 0:
-            logger.warning(f"No real results from any marketplace for query '{query}'. Using mock data as fallback.")
+            logger.warning("No real results from any marketplace for query '%s'. Using mock data as fallback.", query)
             mock_res = self._get_mock_marketplace_results(query, max_results, min_price, max_price)
             if 'metadata' not in mock_res:
                 mock_res['metadata'] = {}
@@ -161,6 +144,90 @@ class MarketplaceClient:
         
         return results
     
+    def search_stream(
+        self,
+        query: str,
+        max_results: int = 10,
+        marketplaces: Optional[List[str]] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        sort_by: str = 'relevance'
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Search like search_all, yielding each marketplace as soon as it answers.
+        
+        Products are deduplicated and sorted within a marketplace only. With
+        no usable credentials a single 'mock' chunk is yielded.
+        
+        Yields:
+            Dicts with 'marketplace', 'products' and, on failure, 'error'
+        """
+        self.stats['total_searches'] += 1
+        
+        available, _ = self._split_available(marketplaces)
+        if not available:
+            mock_res = self._get_mock_marketplace_results(query, max_results, min_price, max_price)
+            yield {'marketplace': 'mock', 'products': mock_res['products']}
+            return
+        
+        futures = self._submit_searches(available, query, max_results, min_price, max_price)
+        marketplace_of = {future: marketplace for marketplace, future in futures.items()}
+        
+        try:
+            for future in as_completed(marketplace_of, timeout=self.SOURCE_TIMEOUT):
+                marketplace = marketplace_of.pop(future)
+                try:
+                    products = self._deduplicate_products(future.result())
+                    self.stats['successful_searches'] += 1
+                    yield {
+                        'marketplace': marketplace,
+                        'products': self._sort_products(products, sort_by)
+                    }
+                except Exception as e:
+                    logger.error("%s search failed: %s", marketplace, e)
+                    self.stats['failed_searches'] += 1
+                    yield {'marketplace': marketplace, 'products': [], 'error': str(e)}
+        except FutureTimeout:
+            for future, marketplace in marketplace_of.items():
+                future.cancel()
+                self.stats['failed_searches'] += 1
+                yield {
+                    'marketplace': marketplace,
+                    'products': [],
+                    'error': f"no response within {self.SOURCE_TIMEOUT}s"
+                }
+    
+    def _split_available(self, marketplaces: Optional[List[str]]):
+        """Split requested marketplaces into (available, unavailable) by credentials"""
+        if not marketplaces:
+            # Default marketplaces set
+            marketplaces = ['amazon', 'ebay', 'walmart']
+        
+        available = []
+        unavailable = []
+        for m in marketplaces:
+            if m == 'amazon' and self.amazon_access_key:
+                available.append('amazon')
+            elif m == 'ebay' and self.ebay_app_id:
+                available.append('ebay')
+            elif m == 'walmart' and self.rapidapi_key:
+                available.append('walmart')
+            else:
+                unavailable.append(m)
+        return available, unavailable
+    
+    def _submit_searches(self, marketplaces, query, max_results, min_price, max_price):
+        """Start one search per marketplace on the shared pool"""
+        searches = {
+            'amazon': self._search_amazon,
+            'ebay': self._search_ebay,
+            'walmart': self._search_walmart,
+        }
+        return {
+            m: self._executor.submit(searches[m], query, max_results, min_price, max_price)
+            for m in marketplaces
+        }
+    
     def _search_amazon(
         self,
         query: str,
@@ -214,7 +281,7 @@ class MarketplaceClient:
             return results
             
         except Exception as e:
-            logger.error(f"Amazon search error: {str(e)}")
+            logger.error("Amazon search error: %s", e)
             return []
     
     def _search_ebay(
@@ -277,7 +344,7 @@ class MarketplaceClient:
             return results
             
         except Exception as e:
-            logger.error(f"eBay search error: {str(e)}")
+            logger.error("eBay search error: %s", e)
             return []
     
     def _search_walmart(
@@ -305,7 +372,7 @@ class MarketplaceClient:
                 "num": max_results
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self._session.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -338,7 +405,7 @@ class MarketplaceClient:
             return results
             
         except Exception as e:
-            logger.error(f"Walmart search error: {str(e)}")
+            logger.error("Walmart search error: %s", e)
             return []
     
     def compare_products(self, product_ids: List[Dict[str, str]]) -> Dict[str, Any]:
@@ -351,24 +418,19 @@ class MarketplaceClient:
         Returns:
             Comparison data
         """
-        products = []
+        fetchers = {
+            'amazon': self._get_amazon_product,
+            'ebay': self._get_ebay_product,
+            'walmart': self._get_walmart_product,
+        }
         
-        for item in product_ids:
-            product_id = item['id']
-            marketplace = item['marketplace']
-            
-            # Fetch detailed product info
-            if marketplace == 'amazon':
-                product = self._get_amazon_product(product_id)
-            elif marketplace == 'ebay':
-                product = self._get_ebay_product(product_id)
-            elif marketplace == 'walmart':
-                product = self._get_walmart_product(product_id)
-            else:
-                continue
-            
-            if product:
-                products.append(product)
+        # Detail lookups are independent, so fetch them on the shared pool
+        futures = [
+            self._executor.submit(fetchers[item['marketplace']], item['id'])
+            for item in product_ids
+            if item['marketplace'] in fetchers
+        ]
+        products = [product for product in (f.result() for f in futures) if product]
         
         return {
             'products': products,
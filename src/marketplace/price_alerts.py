@@ -8,7 +8,7 @@ import logging
 import json
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -30,6 +30,35 @@ class PriceAlert:
     is_active: bool = True
     last_checked: Optional[str] = None
     alert_sent: bool = False
+    
+    def __setattr__(self, name, value):
+        # Any field change drops the cached to_dict()
+        self.__dict__.pop('_as_dict', None)
+        object.__setattr__(self, name, value)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Flat dict of the fields (asdict() deep-copies every value)
+        
+        Built once and reused until a field is assigned, so listing and
+        saving unchanged alerts doesn't rebuild it. Treat it as read-only.
+        """
+        cached = self.__dict__.get('_as_dict')
+        if cached is None:
+            cached = self.__dict__['_as_dict'] = {
+                'id': self.id,
+                'user_email': self.user_email,
+                'product_name': self.product_name,
+                'product_url': self.product_url,
+                'marketplace': self.marketplace,
+                'target_price': self.target_price,
+                'current_price': self.current_price,
+                'created_at': self.created_at,
+                'is_active': self.is_active,
+                'last_checked': self.last_checked,
+                'alert_sent': self.alert_sent
+            }
+        return cached
 
 
 class PriceAlertManager:
@@ -48,6 +77,8 @@ class PriceAlertManager:
         self.storage_path = storage_path
         self.alerts: Dict[str, PriceAlert] = {}
         self.price_history: Dict[str, List[Dict]] = {}
+        # user_email -> alert ids (a dict, to keep creation order)
+        self._ids_by_email: Dict[str, Dict[str, None]] = {}
         
         # Email configuration
         self.smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
@@ -56,7 +87,7 @@ class PriceAlertManager:
         self.smtp_password = os.getenv('SMTP_PASSWORD')
         
         self._load_alerts()
-        logger.info(f"Price Alert Manager initialized with {len(self.alerts)} alerts")
+        logger.info("Price Alert Manager initialized with %s alerts", len(self.alerts))
     
     def create_alert(
         self,
@@ -97,12 +128,13 @@ class PriceAlertManager:
         )
         
         self.alerts[alert_id] = alert
+        self._ids_by_email.setdefault(user_email, {})[alert_id] = None
         self._save_alerts()
         
         # Initialize price history
         self._add_price_history(alert_id, current_price)
         
-        logger.info(f"Created price alert: {alert_id} for {product_name}")
+        logger.info("Created price alert: %s for %s", alert_id, product_name)
         return alert_id
     
     def get_alert(self, alert_id: str) -> Optional[PriceAlert]:
@@ -120,11 +152,9 @@ class PriceAlertManager:
         Returns:
             List of alerts
         """
-        alerts = []
-        for alert in self.alerts.values():
-            if alert.user_email == user_email:
-                if not active_only or alert.is_active:
-                    alerts.append(alert)
+        alerts = [self.alerts[i] for i in self._ids_by_email.get(user_email, ())]
+        if active_only:
+            return [a for a in alerts if a.is_active]
         return alerts
     
     def update_alert(self, alert_id: str, target_price: float) -> bool:
@@ -146,7 +176,7 @@ class PriceAlertManager:
         alert.alert_sent = False  # Reset alert sent flag
         self._save_alerts()
         
-        logger.info(f"Updated alert {alert_id} target price to {target_price}")
+        logger.info("Updated alert %s target price to %s", alert_id, target_price)
         return True
     
     def delete_alert(self, alert_id: str) -> bool:
@@ -160,9 +190,10 @@ class PriceAlertManager:
             Success status
         """
         if alert_id in self.alerts:
-            del self.alerts[alert_id]
+            alert = self.alerts.pop(alert_id)
+            self._ids_by_email.get(alert.user_email, {}).pop(alert_id, None)
             self._save_alerts()
-            logger.info(f"Deleted alert: {alert_id}")
+            logger.info("Deleted alert: %s", alert_id)
             return True
         return False
     
@@ -182,7 +213,7 @@ class PriceAlertManager:
         
         alert.is_active = False
         self._save_alerts()
-        logger.info(f"Deactivated alert: {alert_id}")
+        logger.info("Deactivated alert: %s", alert_id)
         return True
     
     def check_alert(self, alert_id: str, current_price: float) -> bool:
@@ -213,7 +244,7 @@ class PriceAlertManager:
             self._send_alert_email(alert, current_price)
             alert.alert_sent = True
             self._save_alerts()
-            logger.info(f"Alert triggered: {alert_id} at price {current_price}")
+            logger.info("Alert triggered: %s at price %s", alert_id, current_price)
             return True
         
         self._save_alerts()
@@ -251,7 +282,7 @@ class PriceAlertManager:
                     results['triggered_alerts'].append(alert_id)
             
             except Exception as e:
-                logger.error(f"Error checking alert {alert_id}: {str(e)}")
+                logger.error("Error checking alert %s: %s", alert_id, e)
                 results['errors'] += 1
         
         return results
@@ -374,10 +405,10 @@ class PriceAlertManager:
                 server.login(self.smtp_user, self.smtp_password)
                 server.send_message(msg)
             
-            logger.info(f"Alert email sent to {alert.user_email}")
+            logger.info("Alert email sent to %s", alert.user_email)
         
         except Exception as e:
-            logger.error(f"Failed to send alert email: {str(e)}")
+            logger.error("Failed to send alert email: %s", e)
     
     def _add_price_history(self, alert_id: str, price: float):
         """Add price point to history"""
@@ -407,7 +438,11 @@ class PriceAlertManager:
                     }
                     self.price_history = data.get('price_history', {})
         except Exception as e:
-            logger.error(f"Failed to load alerts: {str(e)}")
+            logger.error("Failed to load alerts: %s", e)
+        
+        self._ids_by_email = {}
+        for alert_id, alert in self.alerts.items():
+            self._ids_by_email.setdefault(alert.user_email, {})[alert_id] = None
     
     def _save_alerts(self):
         """Save alerts to storage"""
@@ -415,12 +450,12 @@ class PriceAlertManager:
             os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
             with open(self.storage_path, 'w') as f:
                 data = {
-                    'alerts': {k: asdict(v) for k, v in self.alerts.items()},
+                    'alerts': {k: v.to_dict() for k, v in self.alerts.items()},
                     'price_history': self.price_history
                 }
                 json.dump(data, f, indent=2)
         except Exception as e:
-            logger.error(f"Failed to save alerts: {str(e)}")
+            logger.error("Failed to save alerts: %s", e)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get alert statistics"""
@@ -45,8 +45,8 @@ class MetricsCollector:
         self.cpu_history = deque(maxlen=history_size)
         self.memory_history = deque(maxlen=history_size)
         
-        # Start time
-        self.start_time = datetime.now()
+        # Start time (perf_counter: monotonic, so clock changes don't skew uptime)
+        self.start_time = time.perf_counter()
     
     def record_request(self, 
                       endpoint: str, 
@@ -140,7 +140,7 @@ class MetricsCollector:
         """
         with self.lock:
             # Calculate uptime
-            uptime_seconds = (datetime.now() - self.start_time).total_seconds()
+            uptime_seconds = time.perf_counter() - self.start_time
             
             # Request metrics
             request_percentiles = self.get_percentiles(list(self.request_times))
@@ -245,7 +245,7 @@ class MetricsCollector:
             self.errors_by_type.clear()
             self.cpu_history.clear()
             self.memory_history.clear()
-            self.start_time = datetime.now()
+            self.start_time = time.perf_counter()
 
 
 # Global metrics collector instance
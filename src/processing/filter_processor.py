@@ -53,7 +53,7 @@ class FilterProcessor:
             if filter_name in self.filters:
                 filter_func = self.filters[filter_name]
                 filtered = filter_func(filtered, filter_value)
-                logger.info(f"Applied {filter_name}:{filter_value} - {len(filtered)} results remain")
+                logger.info("Applied %s:%s - %s results remain", filter_name, filter_value, len(filtered))
         
         return filtered
     
@@ -132,7 +132,7 @@ class FilterProcessor:
                     if self._match_date(r.get('published_date'), target_date)
                 ]
         except (ValueError, AttributeError) as e:
-            logger.warning(f"Invalid date spec: {date_spec} - {e}")
+            logger.warning("Invalid date spec: %s - %s", date_spec, e)
             return results
     
     def _filter_before(self, results: List[Dict], date_spec: str) -> List[Dict]:
@@ -149,7 +149,7 @@ class FilterProcessor:
                 if self._date_before(r.get('published_date'), cutoff_date)
             ]
         except (ValueError, AttributeError):
-            logger.warning(f"Invalid date spec: {date_spec}")
+            logger.warning("Invalid date spec: %s", date_spec)
             return results
     
     def _filter_after(self, results: List[Dict], date_spec: str) -> List[Dict]:
@@ -166,7 +166,7 @@ class FilterProcessor:
                 if self._date_after(r.get('published_date'), cutoff_date)
             ]
         except (ValueError, AttributeError):
-            logger.warning(f"Invalid date spec: {date_spec}")
+            logger.warning("Invalid date spec: %s", date_spec)
             return results
     
     def _filter_language(self, results: List[Dict], lang: str) -> List[Dict]:
@@ -243,7 +243,7 @@ class FilterProcessor:
             filter_func: Function(results, value) -> filtered_results
         """
         self.filters[name] = filter_func
-        logger.info(f"Registered custom filter: {name}")
+        logger.info("Registered custom filter: %s", name)
     
     def get_available_filters(self) -> Dict[str, str]:
         """
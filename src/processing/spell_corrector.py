@@ -46,7 +46,7 @@ class SpellCorrector:
         """
         
         self.vocabulary.update(common_words.lower().split())
-        logger.info(f"Loaded {len(self.vocabulary)} common words")
+        logger.info("Loaded %s common words", len(self.vocabulary))
     
     def train(self, text: str):
         """
@@ -5,6 +5,7 @@ Provides better text processing for search
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import List, Set
 import logging
 
@@ -19,6 +20,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; tokenize() runs for every query and every crawled page
+_WORD_RE = re.compile(r'\b[a-z0-9]+\b')
+_ORIGINAL_WORD_RE = re.compile(r'\b[a-zA-Z0-9]+\b')
+
+# Distinct words whose stems are remembered per tokenizer
+STEM_CACHE_SIZE = 65536
+
 
 class Tokenizer:
     """
@@ -57,9 +65,12 @@ class Tokenizer:
         if use_stemming and NLTK_AVAILABLE:
             try:
                 self.stemmer = PorterStemmer()
+                # Porter stemming is pure Python and by far the slowest step;
+                # the same words recur across queries and pages
+                self._stem = lru_cache(maxsize=STEM_CACHE_SIZE)(self.stemmer.stem)
                 logger.info("Porter Stemmer initialized")
             except Exception as e:
-                logger.warning(f"Could not initialize stemmer: {e}")
+                logger.warning("Could not initialize stemmer: %s", e)
                 self.use_stemming = False
         elif use_stemming:
             logger.warning("Stemming requested but NLTK not available")
@@ -71,13 +82,13 @@ class Tokenizer:
             if NLTK_AVAILABLE:
                 try:
                     self.stop_words = set(stopwords.words('english'))
-                    logger.info(f"Loaded {len(self.stop_words)} stop words from NLTK")
+                    logger.info("Loaded %s stop words from NLTK", len(self.stop_words))
                 except Exception as e:
-                    logger.warning(f"Could not load NLTK stop words: {e}")
+                    logger.warning("Could not load NLTK stop words: %s", e)
                     self.stop_words = self.DEFAULT_STOP_WORDS
             else:
                 self.stop_words = self.DEFAULT_STOP_WORDS
-                logger.info(f"Using default stop words ({len(self.stop_words)} words)")
+                logger.info("Using default stop words (%s words)", len(self.stop_words))
     
     def normalize_text(self, text: str) -> str:
         """
@@ -91,6 +102,8 @@ class Tokenizer:
         """
         # Convert to lowercase
         text = text.lower()
+        if text.isascii():
+            return text  # NFKD leaves ASCII unchanged
         
         # Normalize unicode characters (é -> e, ñ -> n, etc.)
         text = unicodedata.normalize('NFKD', text)
@@ -123,7 +136,7 @@ class Tokenizer:
         
         # Step 2: Split into words (alphanumeric only)
         # Keep numbers and letters, split on everything else
-        words = re.findall(r'\b[a-z0-9]+\b', text)
+        words = _WORD_RE.findall(text)
         
         # Step 3: Remove stop words
         if self.use_stop_words:
@@ -131,7 +144,7 @@ class Tokenizer:
         
         # Step 4: Apply stemming
         if self.use_stemming and self.stemmer:
-            words = [self.stemmer.stem(w) for w in words]
+            words = [self._stem(w) for w in words]
         
         # Step 5: Filter by length
         words = [
@@ -156,7 +169,7 @@ class Tokenizer:
             return []
         
         # Extract original words
-        original_words = re.findall(r'\b[a-zA-Z0-9]+\b', text)
+        original_words = _ORIGINAL_WORD_RE.findall(text)
         
         # Process each word
         result = []
@@ -170,7 +183,7 @@ class Tokenizer:
             
             # Apply stemming
             if self.use_stemming and self.stemmer:
-                processed = self.stemmer.stem(normalized)
+                processed = self._stem(normalized)
             else:
                 processed = normalized
             
@@ -228,7 +241,7 @@ class Tokenizer:
         result = {
             'original': text,
             'normalized': self.normalize_text(text),
-            'raw_tokens': re.findall(r'\b[a-z0-9]+\b', self.normalize_text(text))
+            'raw_tokens': _WORD_RE.findall(self.normalize_text(text))
         }
         
         # Show stop words filtered
@@ -50,10 +50,12 @@ class AdvancedRanker(Ranker):
         Returns:
             List of (doc_id, score) tuples
         """
+        self._sync_index_version()
+        
         # Parse query
         parsed = self.query_parser.parse(query)
         
-        logger.info(f"Parsed query: {self.query_parser.explain_query(parsed)}")
+        logger.info("Parsed query: %s", self.query_parser.explain_query(parsed))
         
         # Handle different query types
         if parsed.is_simple:
@@ -3,9 +3,12 @@ Enhanced Ranker with BM25 Algorithm
 Provides better ranking than TF-IDF by handling document length and term saturation
 """
 
+import heapq
 import math
+import threading
+from operator import itemgetter
 from typing import List, Tuple, Dict
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 
 class Ranker:
@@ -14,6 +17,9 @@ class Ranker:
     BM25 is superior to TF-IDF for search ranking
     """
     
+    # Ranked results kept for repeated queries, until the index changes
+    RESULT_CACHE_SIZE = 1024
+    
     def __init__(self, indexer, k1: float = 1.5, b: float = 0.75):
         """
         Initialize ranker with BM25 parameters
@@ -32,6 +38,18 @@ class Ranker:
         self._avg_doc_length: float = 0.0
         self._total_docs: int = 0
         self._cache_valid = False
+        self._index_version: object = None
+        
+        # (sorted query tokens, top_k, index version) -> ranked results, LRU first
+        self._results: OrderedDict = OrderedDict()
+        self._results_lock = threading.Lock()
+    
+    def _sync_index_version(self) -> None:
+        """Drop the caches if the indexer reports changes since they were built"""
+        version = getattr(self.indexer, 'version', None)
+        if version != self._index_version:
+            self._index_version = version
+            self.invalidate_cache()
     
     def _update_cache(self) -> None:
         """Update document length cache"""
@@ -138,29 +156,57 @@ class Ranker:
             return []
         
         # Update document length cache
+        self._sync_index_version()
         self._update_cache()
         
         if self._total_docs == 0:
             return []
         
+        # Term order doesn't change BM25 scores, so reordered queries share an
+        # entry; the index version keeps a search that raced an update from
+        # caching results of the old index
+        key = (tuple(sorted(query_tokens)), top_k, self._index_version)
+        with self._results_lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return list(cached)
+        
         # Calculate scores for each document
         doc_scores: Dict[str, float] = defaultdict(float)
         
-        for term in query_tokens:
-            # Get document scores for each term
-            # postings is a list of [doc_id, freq] pairs, not a dict
-            postings = self.indexer.index.get(term, [])
-            
-            # Calculate BM25 score for each document containing this term
-            for doc_id, term_freq in postings:
-                bm25_score = self._calculate_bm25_score(term, doc_id, term_freq)
-                doc_scores[doc_id] += bm25_score
-        
-        # Sort by score (descending)
-        ranked_docs = sorted(doc_scores.items(), key=lambda x: x[1], reverse=True)
-        
-        # Return top K results
-        return ranked_docs[:top_k]
+        # Resolve every term's posting list and IDF up front, so the scoring
+        # loop below does no per-posting index or IDF lookups
+        # postings is a list of [doc_id, freq] pairs, not a dict
+        term_postings = [
+            (self._calculate_idf(term), self.indexer.index.get(term, []))
+            for term in query_tokens
+        ]
+        
+        # Same arithmetic as _calculate_bm25_score, inlined for the hot loop
+        k1 = self.k1
+        b = self.b
+        avg_doc_length = self._avg_doc_length
+        doc_lengths = self._doc_lengths
+        if avg_doc_length == 0:
+            # Only empty documents: every match scores 0, nothing to compute
+            for _, postings in term_postings:
+                for doc_id, _ in postings:
+                    doc_scores[doc_id] = 0.0
+        else:
+            for idf, postings in term_postings:
+                for doc_id, term_freq in postings:
+                    length_norm = 1 - b + b * (doc_lengths.get(doc_id, 0) / avg_doc_length)
+                    doc_scores[doc_id] += idf * ((term_freq * (k1 + 1)) / (term_freq + k1 * length_norm))
+        
+        # Top K by score (descending); nlargest keeps a K-sized heap instead
+        # of sorting every matching document, and breaks ties like sorted()
+        ranked_docs = heapq.nlargest(top_k, doc_scores.items(), key=itemgetter(1))
+        with self._results_lock:
+            self._results[key] = tuple(ranked_docs)
+            if len(self._results) > self.RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return ranked_docs
     
     def rank_tfidf(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
         """
@@ -178,6 +224,7 @@ class Ranker:
         if not query_tokens:
             return []
         
+        self._sync_index_version()
         self._update_cache()
         
         if self._total_docs == 0:
@@ -206,8 +253,7 @@ class Ranker:
                 doc_scores[doc_id] += tfidf_score
         
         # Sort and return top K
-        ranked_docs = sorted(doc_scores.items(), key=lambda x: x[1], reverse=True)
-        return ranked_docs[:top_k]
+        return heapq.nlargest(top_k, doc_scores.items(), key=itemgetter(1))
     
     def compare_algorithms(self, query: str, top_k: int = 10) -> Dict:
         """
@@ -233,8 +279,10 @@ class Ranker:
         }
     
     def invalidate_cache(self) -> None:
-        """Invalidate document length cache (call after indexing new documents)"""
+        """Invalidate document length and result caches (call after indexing new documents)"""
         self._cache_valid = False
+        with self._results_lock:
+            self._results.clear()
     
     def get_statistics(self) -> Dict:
         """
@@ -243,6 +291,7 @@ class Ranker:
         Returns:
             Dictionary with ranking stats
         """
+        self._sync_index_version()
         self._update_cache()
         
         return {
@@ -4,6 +4,7 @@ Manages search operations across local and external sources
 """
 
 from .search_manager import SearchManager
+from .prefix_trie import PrefixTrie
 
 def __init__(
     self,
@@ -23,5 +24,5 @@ def __init__(
     self.mode = mode or os.getenv('SEARCH_MODE', 'hybrid')
     
 
-__all__ = ['SearchManager']
+__all__ = ['SearchManager', 'PrefixTrie']
 
@@ -0,0 +1,117 @@
+"""
+Prefix Trie
+Weighted prefix tree for autocomplete
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Node keys besides the single characters of the children
+_END = ''     # weight of the term ending at this node
+_TOP = None   # the node's best completions, as (-weight, term), best first
+
+# Longer terms are skipped; they make poor suggestions and deep trees
+MAX_TERM_LENGTH = 100
+
+
+class PrefixTrie:
+    """
+    Prefix tree over weighted terms.
+
+    Nodes are plain dicts. Every node keeps its top_k completions, computed
+    once when the trie is built, so complete() only walks the prefix and
+    costs O(len(prefix)) regardless of how many terms share it.
+    """
+
+    def __init__(self, weighted_terms: Iterable[Tuple[str, int]], top_k: int = 20):
+        """
+        Build the trie.
+
+        Args:
+            weighted_terms: (term, weight) pairs; higher weights rank first
+            top_k: Completions kept per node, the most complete() can return
+        """
+        self.top_k = top_k
+        self._root: Dict = {}
+        self.size = 0
+
+        for term, weight in weighted_terms:
+            term = ' '.join(term.lower().split())
+            if not term or len(term) > MAX_TERM_LENGTH:
+                continue
+            node = self._root
+            for char in term:
+                node = node.setdefault(char, {})
+            if _END not in node:
+                self.size += 1
+            node[_END] = node.get(_END, 0) + weight
+
+        self._collect(self._root, '')
+
+    def _collect(self, node: Dict, prefix: str) -> List[Tuple[int, str]]:
+        """Fill in the top completions of node and everything below it"""
+        candidates = []
+        if _END in node:
+            candidates.append((-node[_END], prefix))
+        for char, child in node.items():
+            if char:
+                candidates.extend(self._collect(child, prefix + char))
+        node[_TOP] = heapq.nsmallest(self.top_k, candidates)
+        return node[_TOP]
+
+    def complete(self, prefix: str, k: int = 10) -> List[str]:
+        """
+        Return up to k terms starting with prefix, highest weight first.
+
+        Args:
+            prefix: Typed prefix (case and repeated spaces are ignored)
+            k: Maximum completions (capped at top_k)
+
+        Returns:
+            Matching terms
+        """
+        return self._top(self.locate(prefix), k)
+
+    def locate(self, prefix: str, node: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Return the node reached by prefix, or None when no term starts with it.
+
+        Pass the node of an earlier prefix to walk only the newly typed
+        characters; the suffix is lower-cased but not whitespace-normalized.
+
+        Args:
+            prefix: Characters to walk
+            node: Node to start from (default: the root, with prefix normalized)
+        """
+        if node is None:
+            node = self._root
+            prefix = ' '.join(prefix.lower().split())
+        else:
+            prefix = prefix.lower()
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def complete_from(self, node: Optional[Dict], suffix: str = '', k: int = 10) -> List[str]:
+        """
+        Like complete(), continuing from a node returned by locate().
+
+        Args:
+            node: Starting node (None yields no completions)
+            suffix: Characters typed since node was located
+            k: Maximum completions (capped at top_k)
+        """
+        if node is None:
+            return []
+        return self._top(self.locate(suffix, node), k)
+
+    @staticmethod
+    def _top(node: Optional[Dict], k: int) -> List[str]:
+        if node is None:
+            return []
+        return [term for _, term in node[_TOP][:k]]
+
+    def __len__(self) -> int:
+        return self.size
@@ -5,12 +5,15 @@ Includes full normalization, blending, and fallback support
 """
 
 import os
+import time
 import logging
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from urllib.parse import urlparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from src.utils.concurrency import gather_with_deadline
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +23,12 @@ class SearchManager:
     Handles result blending, deduplication, re-ranking, and normalization.
     """
     
+    # Seconds a hybrid search waits for all sources together; late ones are dropped
+    SOURCE_TIMEOUT = 10
+    
+    # Cache namespace of search() results (see CacheManager.invalidate_namespace)
+    CACHE_NAMESPACE = 'search'
+    
     def __init__(
         self,
         google_client=None,
@@ -62,13 +71,17 @@ class SearchManager:
             'avg_response_time': 0
         }
         
-        logger.info(f"Search Manager initialized in '{self.mode}' mode")
+        # API sources of hybrid searches, on long-lived threads
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='search-sources')
+        
+        logger.info("Search Manager initialized in '%s' mode", self.mode)
     
     def search(
         self,
         query: str,
         max_results: int = None,
         filters: Optional[Dict] = None,
+        mode: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -78,77 +91,105 @@ class SearchManager:
             query: Search query
             max_results: Maximum results to return
             filters: Optional filters to apply
+            mode: Search mode for this call only (defaults to self.mode)
             **kwargs: Additional search parameters (safe_search, region, time_period, etc.)
             
         Returns:
             Unified search results dictionary with normalized structure
         """
+        from src.config.config import Config
         if max_results is None:
-            from src.config.config import Config
             max_results = Config.DEFAULT_MAX_RESULTS
 
-        start_time = datetime.now()
+        # Resolved once so concurrent set_mode() calls can't switch it mid-search
+        mode = mode or self.mode
+        
         self.stats['total_searches'] += 1
         
-        # Check cache first
-        cache_key = self._generate_cache_key(query, filters)
-        if self.cache_manager:
-            cached = self.cache_manager.get(cache_key)
-            if cached:
-                self.stats['cache_hits'] += 1
-                logger.info(f"Cache hit for query: '{query}'")
-                return cached
+        cache_key = self._generate_cache_key(query, filters, mode, max_results, **kwargs)
+        loaded = []
+        
+        def run():
+            loaded.append(True)
+            return self._run_search(query, max_results, filters, mode, **kwargs)
         
         try:
-            # Route to appropriate search method
-            if self.mode == 'local':
-                results = self._search_local(query, max_results, filters)
-                self.stats['local_searches'] += 1
-                
-            elif self.mode == 'serpapi':
-                results = self._search_api(query, max_results, filters, **kwargs)
-                self.stats['api_searches'] += 1
-            
-            elif self.mode == 'google':
-                results = self._search_google(query, max_results, filters, **kwargs)
-                self.stats['google_searches'] += 1
-                
-            elif self.mode == 'hybrid':
-                results = self._search_hybrid(query, max_results, filters, **kwargs)
-                self.stats['hybrid_searches'] += 1
-                
+            if not self.cache_manager:
+                results = run()
+            elif mode == 'local':
+                results = self.cache_manager.get(cache_key)
+                if not results:
+                    results = run()
+                    self.cache_manager.set(cache_key, results, Config.CACHE_TTL_SEARCH)
             else:
-                raise ValueError(f"Invalid search mode: {self.mode}")
-            
-            # CRITICAL: Normalize the response structure
-            # This ensures 'organic_results' becomes 'results' and all keys exist
-            results = self._normalize_response(results)
-            
-            # Add metadata
-            response_time = (datetime.now() - start_time).total_seconds()
-            results['metadata']['response_time'] = response_time
-            results['metadata']['mode'] = self.mode
-            results['metadata']['timestamp'] = datetime.now().isoformat()
-            
-            # Update stats
-            self._update_stats(response_time)
-            
-            # Cache results
-            if self.cache_manager:
-                ttl = int(os.getenv('CACHE_TTL_SEARCH', 3600))
-                self.cache_manager.set(cache_key, results, ttl)
-            
-            logger.info(
-                f"Search completed: query='{query}', mode={self.mode}, "
-                f"results={len(results['results'])}, time={response_time:.3f}s"
-            )
-            
-            return results
-            
+                # API results go stale: past the fresh TTL the cached result is
+                # still served while a background search replaces it
+                results = self.cache_manager.get_or_refresh(
+                    cache_key, run,
+                    ttl=Config.CACHE_TTL_API_FRESH,
+                    stale_ttl=Config.CACHE_TTL_API_RESULTS,
+                    should_cache=lambda r: bool(r['results'])
+                )
         except Exception as e:
-            logger.error(f"Search failed: {str(e)}", exc_info=True)
+            logger.error("Search failed: %s", e, exc_info=True)
             # Return empty results on error
             return self._empty_results(query, str(e))
+        
+        if not loaded:
+            self.stats['cache_hits'] += 1
+            logger.info("Cache hit for query: '%s'", query)
+        
+        return results
+    
+    def _run_search(
+        self,
+        query: str,
+        max_results: int,
+        filters: Optional[Dict],
+        mode: str,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Route one uncached search to its mode and normalize the response"""
+        start_time = time.perf_counter()
+        
+        if mode == 'local':
+            results = self._search_local(query, max_results, filters)
+            self.stats['local_searches'] += 1
+            
+        elif mode == 'serpapi':
+            results = self._search_api(query, max_results, filters, **kwargs)
+            self.stats['api_searches'] += 1
+        
+        elif mode == 'google':
+            results = self._search_google(query, max_results, filters, **kwargs)
+            self.stats['google_searches'] += 1
+            
+        elif mode == 'hybrid':
+            results = self._search_hybrid(query, max_results, filters, **kwargs)
+            self.stats['hybrid_searches'] += 1
+            
+        else:
+            raise ValueError(f"Invalid search mode: {mode}")
+        
+        # CRITICAL: Normalize the response structure
+        # This ensures 'organic_results' becomes 'results' and all keys exist
+        results = self._normalize_response(results)
+        
+        # Add metadata
+        response_time = time.perf_counter() - start_time
+        results['metadata']['response_time'] = response_time
+        results['metadata']['mode'] = mode
+        results['metadata']['timestamp'] = datetime.now().isoformat()
+        
+        # Update stats
+        self._update_stats(response_time)
+        
+        logger.info(
+            "Search completed: query='%s', mode=%s, results=%s, time=%.3fs",
+            query, mode, len(results['results']), response_time
+        )
+        
+        return results
 
     
     def _search_local(
@@ -171,7 +212,7 @@ class SearchManager:
         if not self.local_ranker:
             raise ValueError("Local ranker not configured")
         
-        logger.debug(f"Performing local search: '{query}'")
+        logger.debug("Performing local search: '%s'", query)
         
         # Execute local search (rank() only accepts query and top_k)
         local_results = self.local_ranker.rank(query, top_k=max_results)
@@ -211,15 +252,19 @@ class SearchManager:
         if not self.serpapi_client:
             raise ValueError("SerpAPI client not configured")
         
-        logger.debug(f"Performing SerpAPI search: '{query}'")
+        logger.debug("Performing SerpAPI search: '%s'", query)
         
-        # Execute API search
+        safe_search = kwargs.get('safe_search', True)
+        region = kwargs.get('region', 'wt-wt')
+        time_period = kwargs.get('time_period')
+        
+        # Execute API search (search() caches the result)
         api_results = self.serpapi_client.search(
             query=query,
             max_results=max_results,
-            safe_search=kwargs.get('safe_search', True),
-            region=kwargs.get('region', 'wt-wt'),
-            time_period=kwargs.get('time_period')
+            safe_search=safe_search,
+            region=region,
+            time_period=time_period
         )
         
         return {
@@ -254,7 +299,7 @@ class SearchManager:
         if not self.google_client:
             raise ValueError("Google client not configured")
 
-        logger.debug(f"Performing Google search: '{query}'")
+        logger.debug("Performing Google search: '%s'", query)
 
         # Convert time period if provided
         date_restrict = self._convert_time_period(kwargs.get('time_period'))
@@ -301,7 +346,7 @@ class SearchManager:
         Returns:
             Dictionary with blended search results from all sources
         """
-        logger.debug(f"Performing hybrid search: '{query}'")
+        logger.debug("Performing hybrid search: '%s'", query)
         
         local_results = []
         google_results = {}
@@ -311,60 +356,46 @@ class SearchManager:
         knowledge_graph = None
         related_searches = []
         
-        # Execute searches in parallel (local + Google + SerpAPI)
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {}
-            
-            # Submit local search
-            if self.local_ranker:
-                futures['local'] = executor.submit(
-                    self._search_local, query, max_results, filters
-                )
-                google_kwargs = kwargs.copy()
-                google_kwargs['max_results'] = max_results
-                google_kwargs['filters'] = filters 
-            # Submit Google search
-            if self.google_client:
-                futures['google'] = executor.submit(
-                    self._search_google, query, **google_kwargs
-                )
-            
-            # Submit SerpAPI search
-            if self.serpapi_client:
-                futures['serpapi'] = executor.submit(
-                    self._search_api, query, max_results, filters, **kwargs
-                )
-            
-            # Collect results from all futures
-            for source, future in futures.items():
-                try:
-                    result = future.result(timeout=10)
-                    if source == 'local':
-                        local_results = result.get('results', [])
-                    elif source == 'google':
-                        google_results = result
-                        all_api_results.extend(result.get('results', []))
-                        answer_box = answer_box or result.get('answer_box')
-                        knowledge_graph = knowledge_graph or result.get('knowledge_graph')
-                        related_searches = related_searches or result.get('related_searches', [])
-                    elif source == 'serpapi':
-                        serpapi_results = result
-                        all_api_results.extend(result.get('results', []))
-                        answer_box = answer_box or result.get('answer_box')
-                        knowledge_graph = knowledge_graph or result.get('knowledge_graph')
-                        related_searches = related_searches or result.get('related_searches', [])
-                except Exception as e:
-                    logger.warning(f"{source} search failed in hybrid mode: {str(e)}")
-        
-        # If both sources failed to produce results, try a direct local fallback
-        if (not local_results or len(local_results) == 0) and self.local_ranker:
+        # The API searches run on the pool while the local index is ranked
+        # on this thread
+        futures = {}
+        
+        if self.google_client:
+            futures['google'] = self._executor.submit(
+                self._search_google, query,
+                max_results=max_results, filters=filters, **kwargs
+            )
+        
+        if self.serpapi_client:
+            futures['serpapi'] = self._executor.submit(
+                self._search_api, query, max_results, filters, **kwargs
+            )
+        
+        deadline = time.perf_counter() + self.SOURCE_TIMEOUT
+        
+        if self.local_ranker:
             try:
-                logger.debug("Hybrid: local results empty, attempting direct local fallback")
-                local_fallback = self._search_local(query, max_results, filters)
-                local_results = local_fallback.get('results', []) or []
+                local_results = self._search_local(query, max_results, filters).get('results', [])
             except Exception as e:
-                logger.warning(f"Local fallback failed in hybrid mode: {str(e)}")
-
+                logger.warning("local search failed in hybrid mode: %s", e)
+        
+        found, errors = gather_with_deadline(futures, deadline - time.perf_counter())
+        
+        # Collect results from the API futures
+        for source in futures:
+            if source in errors:
+                logger.warning("%s search failed in hybrid mode: %s", source, errors[source])
+                continue
+            result = found[source]
+            if source == 'google':
+                google_results = result
+            else:
+                serpapi_results = result
+            all_api_results.extend(result.get('results', []))
+            answer_box = answer_box or result.get('answer_box')
+            knowledge_graph = knowledge_graph or result.get('knowledge_graph')
+            related_searches = related_searches or result.get('related_searches', [])
+        
         # Blend results from all sources
         blended = self._blend_results(
             local_results,
@@ -575,7 +606,8 @@ class SearchManager:
         
         return results
     
-    def get_suggestions(self, query: str, max_suggestions: int = 10) -> List[str]:
+    def get_suggestions(self, query: str, max_suggestions: int = 10,
+                        mode: Optional[str] = None) -> List[str]:
         """
         Get autocomplete suggestions.
         Tries multiple sources in order of preference, falls back gracefully.
@@ -588,29 +620,33 @@ class SearchManager:
         Args:
             query: Partial search query
             max_suggestions: Maximum number of suggestions to return
+            mode: Search mode for this call only (defaults to self.mode)
             
         Returns:
             List of suggestion strings
         """
+        # Resolved once, as in search(), so a concurrent set_mode() can't apply halfway
+        mode = mode or self.mode
+        
         # Try Google first if available and in appropriate mode
-        if self.google_client and self.mode in ['google', 'hybrid']:
+        if self.google_client and mode in ['google', 'hybrid']:
             try:
                 suggestions = self.google_client.get_suggestions(query, max_suggestions)
                 if suggestions:
-                    logger.debug(f"Got {len(suggestions)} suggestions from Google")
+                    logger.debug("Got %s suggestions from Google", len(suggestions))
                     return suggestions
             except Exception as e:
-                logger.warning(f"Google suggestions failed: {str(e)}")
+                logger.warning("Google suggestions failed: %s", e)
         
         # Try SerpAPI if available
-        if self.serpapi_client and self.mode in ['serpapi', 'hybrid']:
+        if self.serpapi_client and mode in ['serpapi', 'hybrid']:
             try:
                 suggestions = self.serpapi_client.get_suggestions(query, max_suggestions)
                 if suggestions:
-                    logger.debug(f"Got {len(suggestions)} suggestions from SerpAPI")
+                    logger.debug("Got %s suggestions from SerpAPI", len(suggestions))
                     return suggestions
             except Exception as e:
-                logger.warning(f"SerpAPI suggestions failed: {str(e)}")
+                logger.warning("SerpAPI suggestions failed: %s", e)
         
         # Fallback to local suggestions (could be implemented in the future)
         logger.debug("No suggestions available from any source")
@@ -628,12 +664,12 @@ class SearchManager:
         """
         valid_modes = ['local', 'serpapi', 'google', 'hybrid']
         if mode not in valid_modes:
-            logger.error(f"Invalid mode: {mode}. Valid modes: {valid_modes}")
+            logger.error("Invalid mode: %s. Valid modes: %s", mode, valid_modes)
             return False
         
         old_mode = self.mode
         self.mode = mode
-        logger.info(f"Search mode changed from '{old_mode}' to '{mode}'")
+        logger.info("Search mode changed from '%s' to '%s'", old_mode, mode)
         return True
     
     def get_stats(self) -> Dict[str, Any]:
@@ -677,24 +713,24 @@ class SearchManager:
         # Try primary engine
         try:
             if primary == 'google' and self.google_client:
-                logger.info(f"Using primary search engine: {primary}")
+                logger.info("Using primary search engine: %s", primary)
                 return self._search_google(query, max_results, filters, **kwargs)
             elif primary == 'serpapi' and self.serpapi_client:
-                logger.info(f"Using primary search engine: {primary}")
+                logger.info("Using primary search engine: %s", primary)
                 return self._search_api(query, max_results, filters, **kwargs)
         except (GoogleSearchException, Exception) as e:
-            logger.warning(f"Primary search engine ({primary}) failed: {str(e)}, switching to fallback: {fallback}")
+            logger.warning("Primary search engine (%s) failed: %s, switching to fallback: %s", primary, e, fallback)
 
             # Try fallback engine
             try:
                 if fallback == 'google' and self.google_client:
-                    logger.info(f"Using fallback search engine: {fallback}")
+                    logger.info("Using fallback search engine: %s", fallback)
                     return self._search_google(query, max_results, filters, **kwargs)
                 elif fallback == 'serpapi' and self.serpapi_client:
-                    logger.info(f"Using fallback search engine: {fallback}")
+                    logger.info("Using fallback search engine: %s", fallback)
                     return self._search_api(query, max_results, filters, **kwargs)
             except Exception as e:
-                logger.error(f"Fallback search engine ({fallback}) also failed: {str(e)}")
+                logger.error("Fallback search engine (%s) also failed: %s", fallback, e)
 
         # Both engines failed
         return self._empty_results(query, "All search engines failed")
@@ -717,23 +753,37 @@ class SearchManager:
             return ''
     
     @staticmethod
-    def _generate_cache_key(query: str, filters: Optional[Dict]) -> str:
+    def _generate_cache_key(query: str, filters: Optional[Dict], mode: Optional[str] = None,
+                            max_results: Optional[int] = None, **kwargs) -> str:
         """
         Generate cache key for query.
         
+        Case and whitespace variants of a query share a key; every parameter
+        that changes the results (result count, safe_search, region, ...) is
+        part of it.
+        
         Args:
             query: Search query
             filters: Optional filters
+            mode: Search mode the results were produced by
+            max_results: Number of results requested
+            **kwargs: The remaining search parameters
             
         Returns:
-            MD5 hash-based cache key
+            MD5 hash-based cache key, under the swr: prefix of CACHE_NAMESPACE
+            so invalidating that namespace drops it
         """
         import hashlib
-        key_parts = [query]
+        key_parts = [' '.join(query.lower().split())]
         if filters:
             key_parts.append(str(sorted(filters.items())))
+        if mode:
+            key_parts.append(f"mode={mode}")
+        if max_results is not None:
+            key_parts.append(f"max_results={max_results}")
+        key_parts.extend(f"{name}={value}" for name, value in sorted(kwargs.items()))
         key_string = '|'.join(key_parts)
-        return f"search:{hashlib.md5(key_string.encode()).hexdigest()}"
+        return f"swr:{SearchManager.CACHE_NAMESPACE}:{hashlib.md5(key_string.encode()).hexdigest()}"
     
     def _update_stats(self, response_time: float):
         """
@@ -850,8 +900,8 @@ def search_with_fallback(self, query: str, **kwargs) -> Dict[str, Any]:
             logger.info("Using SerpAPI as primary search engine")
             return self._search_api(query, **kwargs)
     except (GoogleSearchException, Exception) as e:
-        logger.warning(f"Primary search engine ({primary}) failed: {str(e)}")
-        logger.info(f"Falling back to {fallback}")
+        logger.warning("Primary search engine (%s) failed: %s", primary, e)
+        logger.info("Falling back to %s", fallback)
         
         # Try fallback
         try:
@@ -860,7 +910,7 @@ def search_with_fallback(self, query: str, **kwargs) -> Dict[str, Any]:
             elif fallback == 'serpapi' and self.serpapi_client:
                 return self._search_api(query, **kwargs)
         except Exception as e2:
-            logger.error(f"Fallback search engine ({fallback}) also failed: {str(e2)}")
+            logger.error("Fallback search engine (%s) also failed: %s", fallback, e2)
             if self.local_ranker:
                 return self._search_local(query, kwargs.get('max_results', 10), None)
     
@@ -1,327 +1,441 @@
 """
 Analytics Store - Track search queries and usage patterns
+
+Backed by SQLite in WAL mode so each logged search is a single indexed
+insert instead of a full JSON snapshot rewrite.
 """
 
-import json
+import itertools
 import os
+import sqlite3
+import sys
 import threading
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
-from collections import defaultdict, Counter
-from datetime import datetime
 
+from src.storage.json_loader import load_json
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queries (
+    text TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_queries_count ON queries(count);
+CREATE TABLE IF NOT EXISTS query_events (
+    ts REAL NOT NULL,
+    query TEXT NOT NULL,
+    result_count INTEGER NOT NULL,
+    search_time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_query_events_ts ON query_events(ts);
+CREATE INDEX IF NOT EXISTS idx_query_events_query ON query_events(query);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS legacy_hits (
+    ts REAL NOT NULL,
+    query TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_legacy_hits_ts ON legacy_hits(ts);
+"""
+
+
+def _format_ts(ts: float) -> str:
+    """Format an epoch timestamp as a second-resolution UTC ISO string"""
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec='seconds')
 
 
 class AnalyticsStore:
     """
     Track and analyze search queries and user behavior
     """
-    
-    def __init__(self, filepath: str = 'data/analytics.json'):
+
+    def __init__(self, filepath: str = 'data/analytics.db'):
         """
         Initialize analytics store
-        
+
         Args:
-            filepath: Path to analytics JSON file
+            filepath: Path to analytics SQLite database
         """
         self.filepath = filepath
-        self.lock = threading.Lock()
-        
-        # In-memory analytics data
-        self.query_counts: Counter = Counter()  # query -> count
-        self.query_timestamps: Dict[str, List[str]] = defaultdict(list)  # query -> [timestamps]
-        self.recent_queries: List[Dict] = []  # Recent query history
-        self.total_searches: int = 0
-        self.failed_searches: int = 0  # Searches with 0 results
-        
-        # Performance tracking
-        self.search_times: List[float] = []  # Search execution times
-        
+        self.lock = threading.RLock()
+
+        # Hot in-memory view of the most recent searches
+        self.recent_queries: deque = deque(maxlen=100)
+        self.failed_recent: deque = deque(maxlen=100)  # Zero-result subset
+        # Plain ints, only written under self.lock
+        self._total_searches = 0
+        self._failed_searches = 0  # Searches with 0 results
+
         self._ensure_directory()
+        self.conn = self._connect()
         self._load()
-    
+
     def _ensure_directory(self) -> None:
         """Create directory if it doesn't exist"""
         directory = os.path.dirname(self.filepath)
         if directory and not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
-    
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database in WAL mode and make sure the schema exists"""
+        conn = sqlite3.connect(self.filepath, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(_SCHEMA)
+        return conn
+
     def _load(self) -> None:
-        """Load analytics from file"""
-        if os.path.exists(self.filepath):
-            try:
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                self.query_counts = Counter(data.get('query_counts', {}))
-                self.query_timestamps = defaultdict(list, data.get('query_timestamps', {}))
-                self.recent_queries = data.get('recent_queries', [])
-                self.total_searches = data.get('total_searches', 0)
-                self.failed_searches = data.get('failed_searches', 0)
-                self.search_times = data.get('search_times', [])
-                
-            except (json.JSONDecodeError, Exception) as e:
-                print(f"Warning: Could not parse analytics file: {e}")
-    
-    def _save(self) -> None:
-        """Save analytics to file"""
-        temp_filepath = self.filepath + '.tmp'
-        
+        """Load counters and recent history from the database"""
+        with self.lock:
+            self._import_legacy_json()
+
+            total, failed = self.conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(result_count = 0), 0) FROM query_events'
+            ).fetchone()
+            # Searches counted by the legacy JSON store but not imported as events
+            offsets = dict(self.conn.execute('SELECT key, value FROM meta'))
+            self._total_searches = total + offsets.get('total_offset', 0)
+            self._failed_searches = failed + offsets.get('failed_offset', 0)
+
+            rows = self.conn.execute(
+                'SELECT ts, query, result_count, search_time FROM query_events '
+                'ORDER BY ts DESC LIMIT ?', (self.recent_queries.maxlen,)
+            ).fetchall()
+            for ts, query, result_count, search_time in reversed(rows):
+                self.recent_queries.append({
+                    'query': sys.intern(query),
+                    'result_count': result_count,
+                    'search_time': search_time,
+                    'timestamp': _format_ts(ts),
+                    'user_agent': None
+                })
+
+            rows = self.conn.execute(
+                'SELECT ts, query, search_time FROM query_events '
+                'WHERE result_count = 0 ORDER BY ts DESC LIMIT ?',
+                (self.failed_recent.maxlen,)
+            ).fetchall()
+            for ts, query, search_time in reversed(rows):
+                self.failed_recent.append({
+                    'query': sys.intern(query),
+                    'result_count': 0,
+                    'search_time': search_time,
+                    'timestamp': _format_ts(ts),
+                    'user_agent': None
+                })
+
+    def _import_legacy_json(self) -> None:
+        """One-off import of the old JSON snapshot into an empty database"""
+        legacy_path = os.path.splitext(self.filepath)[0] + '.json'
+        if legacy_path == self.filepath or not os.path.exists(legacy_path):
+            return
+        if self.conn.execute('SELECT 1 FROM queries LIMIT 1').fetchone():
+            return
+
         try:
-            data = {
-                'query_counts': dict(self.query_counts),
-                'query_timestamps': dict(self.query_timestamps),
-                'recent_queries': self.recent_queries[-1000:],  # Keep last 1000
-                'total_searches': self.total_searches,
-                'failed_searches': self.failed_searches,
-                'search_times': self.search_times[-1000:],  # Keep last 1000
-                'last_updated': datetime.now().isoformat()
-            }
-            
-            with open(temp_filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            os.replace(temp_filepath, self.filepath)
-            
-        except Exception as e:
-            print(f"Error saving analytics: {e}")
-            if os.path.exists(temp_filepath):
-                os.remove(temp_filepath)
-    
-    def log_search(self, query: str, result_count: int, 
+            data = load_json(legacy_path)
+        except (ValueError, OSError) as e:
+            print(f"Warning: Could not parse analytics file: {e}")
+            return
+
+        events = []
+        seen = set()
+        for entry in data.get('recent_queries', []):
+            try:
+                ts = datetime.fromisoformat(entry['timestamp']).timestamp()
+            except (KeyError, TypeError, ValueError):
+                continue
+            seen.add((entry.get('query', ''), entry['timestamp']))
+            events.append((
+                ts,
+                entry.get('query', ''),
+                entry.get('result_count', entry.get('results_count', 0)),
+                entry.get('search_time', entry.get('response_time', 0.0)),
+            ))
+
+        # Older searches only survive as timestamps; recent ones are already
+        # events, stamped with the same string
+        hits = []
+        for query, stamps in data.get('query_timestamps', {}).items():
+            for stamp in stamps:
+                if (query, stamp) in seen:
+                    continue
+                try:
+                    hits.append((datetime.fromisoformat(stamp).timestamp(), query))
+                except (TypeError, ValueError):
+                    continue
+
+        # Only the last ~100 searches become events; keep the JSON totals
+        failed_events = sum(1 for event in events if event[2] == 0)
+        offsets = {
+            'total_offset': max(data.get('total_searches', 0) - len(events), 0),
+            'failed_offset': max(data.get('failed_searches', 0) - failed_events, 0),
+        }
+
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO queries (text, count) VALUES (?, ?)',
+                data.get('query_counts', {}).items()
+            )
+            self.conn.executemany(
+                'INSERT INTO query_events VALUES (?, ?, ?, ?)', events
+            )
+            self.conn.executemany('INSERT INTO legacy_hits VALUES (?, ?)', hits)
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', offsets.items()
+            )
+
+    def log_search(self, query: str, result_count: int,
                    search_time: float, user_agent: Optional[str] = None) -> None:
         """
         Log a search query
-        
+
         Args:
             query: Search query string
             result_count: Number of results returned
             search_time: Time taken to execute search (seconds)
             user_agent: User agent string (optional)
         """
+        self._log_many([(query, result_count, search_time, user_agent, time.time())])
+
+    def _log_many(self, searches) -> None:
+        """Write (query, result_count, search_time, user_agent, ts) rows in one transaction"""
+        entries = []
+        rows = []
+        for query, result_count, search_time, user_agent, ts in searches:
+            # Normalize query; interned so every recent/failed entry for a
+            # repeated query shares one str object
+            query = sys.intern(query.strip().lower())
+            if query:
+                entries.append({
+                    'query': query,
+                    'result_count': result_count,
+                    'search_time': search_time,
+                    'timestamp': _format_ts(ts),
+                    'user_agent': user_agent
+                })
+                rows.append((ts, query, result_count, search_time))
+
+        if not entries:
+            return
+
         with self.lock:
-            # Normalize query
-            query = query.strip().lower()
-            
-            if not query:
-                return
-            
-            # Update counters
-            self.query_counts[query] += 1
-            self.total_searches += 1
-            
-            if result_count == 0:
-                self.failed_searches += 1
-            
-            # Track timestamp
-            timestamp = datetime.now().isoformat()
-            self.query_timestamps[query].append(timestamp)
-            
-            # Track search time
-            self.search_times.append(search_time)
-            
-            # Add to recent queries (keep last 100)
-            self.recent_queries.append({
-                'query': query,
-                'result_count': result_count,
-                'search_time': search_time,
-                'timestamp': timestamp,
-                'user_agent': user_agent
-            })
-            
-            # Keep only last 100 recent queries
-            if len(self.recent_queries) > 100:
-                self.recent_queries = self.recent_queries[-100:]
-            
-            # Save periodically (every 10 searches)
-            if self.total_searches % 10 == 0:
-                self._save()
-    
-    def get_popular_queries(self, limit: int = 10, 
+            with self.conn:
+                self.conn.executemany('INSERT INTO query_events VALUES (?, ?, ?, ?)', rows)
+                self.conn.executemany(
+                    'INSERT INTO queries (text, count) VALUES (?, 1) '
+                    'ON CONFLICT(text) DO UPDATE SET count = count + 1',
+                    [(e['query'],) for e in entries]
+                )
+
+            # Only count rows that actually committed
+            self._total_searches += len(entries)
+            self._failed_searches += sum(1 for e in entries if e['result_count'] == 0)
+            for entry in entries:
+                self.recent_queries.append(entry)
+                if entry['result_count'] == 0:
+                    self.failed_recent.append(entry)
+
+    @property
+    def total_searches(self) -> int:
+        return self._total_searches
+
+    @property
+    def failed_searches(self) -> int:
+        return self._failed_searches
+
+    def get_popular_queries(self, limit: int = 10,
                            time_window: Optional[timedelta] = None) -> List[Dict]:
         """
         Get most popular queries
-        
+
         Args:
             limit: Number of queries to return
             time_window: Optional time window (e.g., last 24 hours)
-            
+
         Returns:
             List of {query, count} dictionaries
         """
         with self.lock:
             if time_window:
-                # Filter by time window
-                cutoff = datetime.now() - time_window
-                filtered_counts = Counter()
-                
-                for query, timestamps in self.query_timestamps.items():
-                    recent_count = sum(
-                        1 for ts in timestamps
-                        if datetime.fromisoformat(ts) > cutoff
-                    )
-                    if recent_count > 0:
-                        filtered_counts[query] = recent_count
-                
-                top_queries = filtered_counts.most_common(limit)
+                cutoff = time.time() - time_window.total_seconds()
+                rows = self.conn.execute(
+                    'SELECT query, COUNT(*) AS c FROM ('
+                    'SELECT query FROM query_events WHERE ts > ? '
+                    'UNION ALL SELECT query FROM legacy_hits WHERE ts > ?'
+                    ') GROUP BY query ORDER BY c DESC LIMIT ?', (cutoff, cutoff, limit)
+                ).fetchall()
             else:
-                top_queries = self.query_counts.most_common(limit)
-            
+                rows = self.conn.execute(
+                    'SELECT text, count FROM queries ORDER BY count DESC LIMIT ?',
+                    (limit,)
+                ).fetchall()
+
             return [
                 {'query': query, 'count': count}
-                for query, count in top_queries
+                for query, count in rows
             ]
-    
+
     def get_failed_queries(self, limit: int = 10) -> List[Dict]:
         """
         Get queries that returned no results
-        
+
         Args:
             limit: Number of queries to return
-            
+
         Returns:
             List of failed queries
         """
         with self.lock:
-            failed = [
-                q for q in self.recent_queries
-                if q['result_count'] == 0
-            ]
-            
             # Get unique queries
             unique_failed = {}
-            for q in reversed(failed):  # Most recent first
+            for q in reversed(self.failed_recent):  # Most recent first
                 if q['query'] not in unique_failed:
                     unique_failed[q['query']] = q
                 if len(unique_failed) >= limit:
                     break
-            
+
             return list(unique_failed.values())
-    
+
     def get_recent_searches(self, limit: int = 10) -> List[Dict]:
         """
         Get recent search queries
-        
+
         Args:
             limit: Number of queries to return
-            
+
         Returns:
             List of recent searches
         """
         with self.lock:
-            return self.recent_queries[-limit:][::-1]  # Most recent first
-    
+            # Most recent first; only the requested tail is copied
+            return list(itertools.islice(reversed(self.recent_queries), max(limit, 0)))
+
     def get_query_suggestions(self, prefix: str, limit: int = 5) -> List[str]:
         """
         Get query suggestions based on prefix
-        
+
         Args:
             prefix: Query prefix to match
             limit: Number of suggestions
-            
+
         Returns:
             List of suggested queries
         """
+        prefix = prefix.lower().strip()
+
+        if not prefix:
+            # Return popular queries if no prefix
+            return [q['query'] for q in self.get_popular_queries(limit)]
+
+        # Range scan on the primary key instead of LIKE, so the index is used
         with self.lock:
-            prefix = prefix.lower().strip()
-            
-            if not prefix:
-                # Return popular queries if no prefix
-                return [q['query'] for q in self.get_popular_queries(limit)]
-            
-            # Find queries starting with prefix
-            matching = [
-                (query, count) for query, count in self.query_counts.items()
-                if query.startswith(prefix)
-            ]
-            
-            # Sort by count (popularity)
-            matching.sort(key=lambda x: x[1], reverse=True)
-            
-            return [query for query, _ in matching[:limit]]
-    
+            rows = self.conn.execute(
+                'SELECT text FROM queries WHERE text >= ? AND text < ? '
+                'ORDER BY count DESC LIMIT ?',
+                (prefix, prefix + '\uffff', limit)
+            ).fetchall()
+
+        return [row[0] for row in rows]
+
     def get_search_trends(self, days: int = 7) -> Dict:
         """
         Get search trends over time
-        
+
         Args:
             days: Number of days to analyze
-            
+
         Returns:
             Dictionary with trend data
         """
+        cutoff = time.time() - timedelta(days=days).total_seconds()
+
         with self.lock:
-            cutoff = datetime.now() - timedelta(days=days)
-            
-            # Count searches per day
-            daily_counts = defaultdict(int)
-            
-            for query in self.recent_queries:
-                timestamp = datetime.fromisoformat(query['timestamp'])
-                if timestamp > cutoff:
-                    date_key = timestamp.strftime('%Y-%m-%d')
-                    daily_counts[date_key] += 1
-            
-            # Sort by date
-            sorted_dates = sorted(daily_counts.items())
-            
-            return {
-                'period_days': days,
-                'daily_searches': [
-                    {'date': date, 'count': count}
-                    for date, count in sorted_dates
-                ],
-                'total_searches': sum(daily_counts.values()),
-                'average_per_day': sum(daily_counts.values()) / len(daily_counts) if daily_counts else 0
-            }
-    
+            rows = self.conn.execute(
+                "SELECT date(ts, 'unixepoch', 'localtime') AS day, COUNT(*) "
+                "FROM query_events WHERE ts > ? GROUP BY day ORDER BY day",
+                (cutoff,)
+            ).fetchall()
+
+        total = sum(count for _, count in rows)
+
+        return {
+            'period_days': days,
+            'daily_searches': [
+                {'date': date, 'count': count}
+                for date, count in rows
+            ],
+            'total_searches': total,
+            'average_per_day': total / len(rows) if rows else 0
+        }
+
     def get_statistics(self) -> Dict:
         """
         Get overall analytics statistics
-        
+
         Returns:
             Dictionary with analytics stats
         """
         with self.lock:
-            # Calculate average search time
-            avg_search_time = (
-                sum(self.search_times) / len(self.search_times)
-                if self.search_times else 0
-            )
-            
-            # Calculate success rate
-            success_rate = (
-                ((self.total_searches - self.failed_searches) / self.total_searches * 100)
-                if self.total_searches > 0 else 0
-            )
-            
-            return {
-                'total_searches': self.total_searches,
-                'unique_queries': len(self.query_counts),
-                'failed_searches': self.failed_searches,
-                'success_rate_percent': round(success_rate, 2),
-                'average_search_time_ms': round(avg_search_time * 1000, 2),
-                'most_popular_query': (
-                    self.query_counts.most_common(1)[0][0]
-                    if self.query_counts else None
-                )
-            }
-    
+            unique_queries = self.conn.execute(
+                'SELECT COUNT(*) FROM queries'
+            ).fetchone()[0]
+
+            # Average over the last 1000 searches
+            avg_search_time = self.conn.execute(
+                'SELECT AVG(search_time) FROM '
+                '(SELECT search_time FROM query_events ORDER BY ts DESC LIMIT 1000)'
+            ).fetchone()[0] or 0
+
+            most_popular = self.conn.execute(
+                'SELECT text FROM queries ORDER BY count DESC LIMIT 1'
+            ).fetchone()
+
+        total_searches = self.total_searches
+        failed_searches = self.failed_searches
+
+        # Calculate success rate
+        success_rate = (
+            ((total_searches - failed_searches) / total_searches * 100)
+            if total_searches > 0 else 0
+        )
+
+        return {
+            'total_searches': total_searches,
+            'unique_queries': unique_queries,
+            'failed_searches': failed_searches,
+            'success_rate_percent': round(success_rate, 2),
+            'average_search_time_ms': round(avg_search_time * 1000, 2),
+            'most_popular_query': most_popular[0] if most_popular else None
+        }
+
     def clear(self) -> None:
         """Clear all analytics data"""
         with self.lock:
-            self.query_counts.clear()
-            self.query_timestamps.clear()
+            with self.conn:
+                self.conn.execute('DELETE FROM query_events')
+                self.conn.execute('DELETE FROM queries')
+                self.conn.execute('DELETE FROM legacy_hits')
+                self.conn.execute('DELETE FROM meta')
             self.recent_queries.clear()
-            self.total_searches = 0
-            self.failed_searches = 0
-            self.search_times.clear()
-            self._save()
-    
+            self.failed_recent.clear()
+            self._total_searches = 0
+            self._failed_searches = 0
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self.lock:
+            self.conn.close()
+
     def export_data(self) -> Dict:
         """
         Export all analytics data
-        
+
         Returns:
             Complete analytics data dictionary
         """
@@ -333,41 +447,30 @@ class AnalyticsStore:
                 'recent_searches': self.get_recent_searches(20),
                 'trends': self.get_search_trends(7)
             }
+
     def track_search(self, query: str, results_count: int, response_time: float, mode: str):
         """
         Record analytics for a search query
 
         Args:
-        query: The search term used.
-        results_count: Number of results returned.
-        search_time: Time taken to perform the search (seconds).
+            query: The search term used.
+            results_count: Number of results returned.
+            response_time: Time taken to perform the search (seconds).
+            mode: Search mode that served the query.
         """
-        timestamp = datetime.now().isoformat()
+        self.log_search(query, results_count, response_time)
 
-        with self.lock:
-        # Track counts
-            self.total_searches += 1
-            self.query_counts[query] += 1
-
-            # Track timestamps
-            self.query_timestamps[query].append(timestamp)
-
-            # Record recent search
-            self.recent_queries.append({
-            "query": query,
-            "timestamp": timestamp,
-            "results_count": results_count,
-            "response_time": response_time
-            })
-          # Keep list from growing too large
-            if len(self.recent_queries) > 200:
-                self.recent_queries.pop(0)
-
-            # Track failed searches
-            if results_count == 0:
-                self.failed_searches += 1
-
-            # Track performance
-            self.search_times.append(response_time)
-
-            # Persist data
\ No newline at end of file
+    def track_searches_batch(self, searches: List[Dict]) -> None:
+        """
+        Record several searches in a single transaction
+
+        Args:
+            searches: Dicts with the track_search() keyword arguments
+                (query, results_count, response_time, mode), plus an
+                optional epoch 'timestamp' of when the search happened.
+        """
+        now = time.time()
+        self._log_many(
+            (s['query'], s['results_count'], s['response_time'], None, s.get('timestamp', now))
+            for s in searches
+        )
@@ -10,6 +10,8 @@ import os
 import threading
 import tempfile
 
+from src.storage.json_loader import load_json
+
 
 class Database:
     """Simple JSON-backed storage for the inverted index.
@@ -21,6 +23,8 @@ class Database:
     def __init__(self, filename="index.json"):
         self.filename = filename
         self._lock = threading.Lock()
+        # (st_mtime_ns, st_size, index) of the last file parsed by load_index
+        self._cached = None
 
     def save_index(self, index):
         """Atomically write JSON to disk using a temp file and os.replace.
@@ -39,10 +43,12 @@ class Database:
             fd, tmp_path = tempfile.mkstemp(dir=dirpath)
             try:
                 with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                    # Convert to a plain dict for JSON serialization
-                    json.dump(index, f, ensure_ascii=False, indent=2)
+                    # Compact: indentation roughly doubled the file that
+                    # every load has to page in and parse
+                    json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
                 # Atomic replace
                 os.replace(tmp_path, self.filename)
+                self._cached = None
             finally:
                 # If something failed and tmp file remains, try to remove it
                 if os.path.exists(tmp_path):
@@ -52,13 +58,24 @@ class Database:
                         pass
 
     def load_index(self):
-        """Load index from disk under lock. Returns {} if file missing or unreadable."""
+        """Load index from disk under lock. Returns {} if file missing or unreadable.
+
+        The parsed index is kept and returned again until the file's mtime or
+        size changes, so callers share it and must copy before mutating.
+        """
         with self._lock:
-            if not os.path.exists(self.filename):
+            try:
+                st = os.stat(self.filename)
+            except OSError:
                 return {}
+            cached = self._cached
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return cached[2]
             try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # Parsed straight from a read-only mapping of the file
+                index = load_json(self.filename)
             except (OSError, ValueError):
                 # If the file is corrupt or unreadable, return empty index.
                 return {}
+            self._cached = (st.st_mtime_ns, st.st_size, index)
+            return index
@@ -1,17 +1,35 @@
 import os
+import sqlite3
 import threading
-from flask import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Optional, List
 
+from src.storage.json_loader import load_json
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id TEXT PRIMARY KEY,
+    url TEXT,
+    title TEXT,
+    snippet TEXT,
+    content_length INTEGER NOT NULL DEFAULT 0,
+    timestamp TEXT,
+    crawl_count INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_documents_timestamp ON documents(timestamp);
+"""
+
+_COLUMNS = ('url', 'title', 'snippet', 'content_length', 'timestamp', 'crawl_count')
+
 
 class DocumentStore:
-    def __init__(self, filepath: str = 'data/documents.json'):
-        """Initialize document store"""
+    def __init__(self, filepath: str = 'data/documents.db'):
+        """Initialize document store (SQLite, WAL mode)"""
         self.filepath = filepath
-        self.documents: Dict[str, Dict] = {}
         self.lock = threading.Lock()
         self._ensure_directory()
+        self.conn = self._connect()
         self._load()
 
     def _ensure_directory(self) -> None:
@@ -20,88 +38,109 @@ class DocumentStore:
         if directory and not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database in WAL mode and make sure the schema exists"""
+        conn = sqlite3.connect(self.filepath, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(_SCHEMA)
+        return conn
+
     def _load(self) -> None:
-        """Load documents from file"""
-        if os.path.exists(self.filepath):
+        """Import the legacy JSON snapshot into an empty database"""
+        legacy_path = os.path.splitext(self.filepath)[0] + '.json'
+        if legacy_path == self.filepath or not os.path.exists(legacy_path):
+            return
+
+        with self.lock:
+            if self.conn.execute('SELECT 1 FROM documents LIMIT 1').fetchone():
+                return
             try:
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    self.documents = json.load(f)
-            except json.JSONDecodeError:
-                print(f"Warning: Could not parse {self.filepath}, starting fresh")
-                self.documents = {}
-
-    def _save(self) -> None:
-        """Save documents to file atomically"""
-        temp_filepath = self.filepath + '.tmp'
-        
-        try:
-            with open(temp_filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.documents, f, indent=2, ensure_ascii=False)
-            
-            os.replace(temp_filepath, self.filepath)
-        except Exception as e:
-            print(f"Error saving document store: {e}")
-            if os.path.exists(temp_filepath):
-                os.remove(temp_filepath)
-
-    def add_document(self, doc_id: str, url: str, title: str, 
+                documents = load_json(legacy_path)
+            except (ValueError, OSError):
+                print(f"Warning: Could not parse {legacy_path}, starting fresh")
+                return
+
+            with self.conn:
+                self.conn.executemany(
+                    'INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [
+                        (doc_id, *(doc.get(col) for col in _COLUMNS[:-1]),
+                         doc.get('crawl_count', 1))
+                        for doc_id, doc in documents.items()
+                    ]
+                )
+
+    @staticmethod
+    def _row_to_dict(row) -> Dict:
+        return dict(zip(_COLUMNS, row))
+
+    def add_document(self, doc_id: str, url: str, title: str,
                      snippet: str, content_length: int) -> None:
         """Add or update a document in the store"""
-        with self.lock:
-            crawl_count = 1
-            if doc_id in self.documents:
-                crawl_count = self.documents[doc_id].get('crawl_count', 0) + 1
-            
-            self.documents[doc_id] = {
-                'url': url,
-                'title': title,
-                'snippet': snippet[:200],
-                'content_length': content_length,
-                'timestamp': datetime.now().isoformat(),
-                'crawl_count': crawl_count
-            }
-            self._save()
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT INTO documents VALUES (?, ?, ?, ?, ?, ?, 1) '
+                'ON CONFLICT(doc_id) DO UPDATE SET url = excluded.url, '
+                'title = excluded.title, snippet = excluded.snippet, '
+                'content_length = excluded.content_length, '
+                'timestamp = excluded.timestamp, crawl_count = crawl_count + 1',
+                (doc_id, url, title, snippet[:200], content_length,
+                 datetime.now(timezone.utc).isoformat(timespec='seconds'))
+            )
 
     def get_document(self, doc_id: str) -> Optional[Dict]:
         """Retrieve a document by ID"""
         with self.lock:
-            return self.documents.get(doc_id)
+            row = self.conn.execute(
+                'SELECT url, title, snippet, content_length, timestamp, crawl_count '
+                'FROM documents WHERE doc_id = ?', (doc_id,)
+            ).fetchone()
+        return self._row_to_dict(row) if row else None
 
     def get_all(self) -> Dict[str, Dict]:
         """Get all documents"""
         with self.lock:
-            return self.documents.copy()
+            rows = self.conn.execute(
+                'SELECT doc_id, url, title, snippet, content_length, timestamp, crawl_count '
+                'FROM documents'
+            ).fetchall()
+        return {row[0]: self._row_to_dict(row[1:]) for row in rows}
 
     def delete_document(self, doc_id: str) -> bool:
         """Delete a document from the store"""
-        with self.lock:
-            if doc_id in self.documents:
-                del self.documents[doc_id]
-                self._save()
-                return True
-            return False
+        with self.lock, self.conn:
+            cursor = self.conn.execute('DELETE FROM documents WHERE doc_id = ?', (doc_id,))
+            return cursor.rowcount > 0
 
     def get_recent_documents(self, limit: int = 10) -> List[Dict]:
         """Get most recently crawled documents"""
         with self.lock:
-            docs = [{'id': doc_id, **doc} for doc_id, doc in self.documents.items()]
-            docs.sort(key=lambda x: x['timestamp'], reverse=True)
-            return docs[:limit]
+            rows = self.conn.execute(
+                'SELECT doc_id, url, title, snippet, content_length, timestamp, crawl_count '
+                'FROM documents ORDER BY timestamp DESC, rowid DESC LIMIT ?', (limit,)
+            ).fetchall()
+        return [{'id': row[0], **self._row_to_dict(row[1:])} for row in rows]
 
     def get_statistics(self) -> Dict:
         """Get store statistics"""
         with self.lock:
-            total_docs = len(self.documents)
-            total_content = sum(doc.get('content_length', 0) for doc in self.documents.values())
-            
-            return {
-                'total_documents': total_docs,
-                'total_content_bytes': total_content,
-                'average_content_length': total_content // total_docs if total_docs > 0 else 0
-            }
+            total_docs, total_content = self.conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(content_length), 0) FROM documents'
+            ).fetchone()
+
+        return {
+            'total_documents': total_docs,
+            'total_content_bytes': total_content,
+            'average_content_length': total_content // total_docs if total_docs > 0 else 0
+        }
 
     def clear(self) -> None:
         """Clear all documents from the store"""
+        with self.lock, self.conn:
+            self.conn.execute('DELETE FROM documents')
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
         with self.lock:
-            self.documents = {}
-            self._save()
\ No newline at end of file
+            self.conn.close()
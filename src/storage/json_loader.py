@@ -0,0 +1,39 @@
+"""Helpers for reading JSON snapshots from disk without an extra copy."""
+
+import json
+import mmap
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(path: str) -> Any:
+    """Parse a JSON file through a read-only memory map.
+
+    The OS pages the file in lazily and the parser reads straight from the
+    mapping, so there is no intermediate str of the whole file. Uses orjson
+    when installed, stdlib json otherwise.
+
+    Args:
+        path: JSON file to read
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        OSError: if the file cannot be opened
+        ValueError: if the file is empty or not valid JSON
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"{path} is empty")
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
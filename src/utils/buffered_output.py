@@ -0,0 +1,36 @@
+"""
+Buffered Output
+Per-thread print() buffering for diagnostic scripts whose checks run concurrently
+"""
+
+import builtins
+import io
+import sys
+import threading
+from typing import Any, Callable, Tuple
+
+
+_local = threading.local()
+
+
+def buffered_print(*args, **kwargs) -> None:
+    """print() into the running check's buffer, if any"""
+    kwargs.setdefault('file', getattr(_local, 'buffer', None) or sys.stdout)
+    builtins.print(*args, **kwargs)
+
+
+def run_buffered(check: Callable[[], Any]) -> Tuple[Any, str]:
+    """
+    Run one check with buffered_print() captured
+
+    Args:
+        check: Zero-argument callable
+
+    Returns:
+        (check's return value, everything it printed)
+    """
+    _local.buffer = io.StringIO()
+    try:
+        return check(), _local.buffer.getvalue()
+    finally:
+        del _local.buffer
@@ -0,0 +1,40 @@
+"""
+Concurrency Helpers
+Collecting fan-out work submitted to a thread pool
+"""
+
+from concurrent.futures import Future, wait
+from typing import Any, Dict, Hashable, Tuple
+
+
+def gather_with_deadline(futures: Dict[Hashable, Future],
+                         timeout: float) -> Tuple[Dict[Hashable, Any], Dict[Hashable, Exception]]:
+    """
+    Wait for a set of futures under one shared deadline
+
+    Futures still running when the deadline passes are cancelled (if not yet
+    started) and abandoned rather than joined, so one slow source can't hold
+    up the rest.
+
+    Args:
+        futures: Name -> future
+        timeout: Seconds to wait for all of them together
+
+    Returns:
+        (name -> result, name -> exception) for the futures that finished and
+        those that failed or missed the deadline, both in futures order
+    """
+    _, pending = wait(futures.values(), timeout=max(timeout, 0))
+
+    results = {}
+    errors = {}
+    for name, future in futures.items():
+        if future in pending:
+            future.cancel()
+            errors[name] = TimeoutError(f"no response within {timeout:.3g}s")
+            continue
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            errors[name] = e
+    return results, errors
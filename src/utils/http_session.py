@@ -0,0 +1,31 @@
+"""
+HTTP Session Factory
+Keep-alive requests sessions for the external API clients
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def pooled_session(pool_size: int = 50, retries: int = 2) -> requests.Session:
+    """
+    Build a requests session with a keep-alive HTTPS pool
+
+    Calls reusing it skip the TCP and TLS handshakes; connection errors are
+    retried by the adapter with a short backoff.
+
+    Args:
+        pool_size: Hosts kept pooled, and connections kept per host
+        retries: Adapter-level retries per request
+
+    Returns:
+        New requests session
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries, backoff_factor=0.1)
+    ))
+    return session
@@ -3,14 +3,22 @@ Comprehensive Logging Setup
 Professional logging with rotation, structured logging, and multiple handlers
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
 import json
-from datetime import datetime
+import queue
+import time
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 import traceback
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -21,7 +29,7 @@ class StructuredFormatter(logging.Formatter):
         """Format log record as JSON"""
         # Base log data
         log_data = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -42,7 +50,11 @@ class StructuredFormatter(logging.Formatter):
                 'traceback': traceback.format_exception(*record.exc_info)
             }
         
-        return json.dumps(log_data)
+        if orjson is not None:
+            return orjson.dumps(log_data, default=str).decode('utf-8')
+        
+        log_data['timestamp'] = log_data['timestamp'].isoformat()
+        return json.dumps(log_data, default=str)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -72,13 +84,53 @@ class ColoredFormatter(logging.Formatter):
         return super().format(record)
 
 
+class PerformanceFilter(logging.Filter):
+    """
+    Pass only records flagged as performance data.
+    
+    PerformanceLogger/RequestLogger set ``record.perf``; checking an attribute
+    avoids formatting every message in the process just to route it.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return getattr(record, 'perf', False) or hasattr(record, 'duration')
+
+
+class InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process queue.
+    
+    The stock handler pre-formats each record and drops exc_info so it can be
+    pickled; records never leave this process, so enqueue them untouched and
+    let the listener's formatters see the original record.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def stop_logging_listener() -> None:
+    """Flush and stop the background logging listener, if running"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(stop_logging_listener)
+
+
 def setup_logging(
     log_dir: str = 'logs',
     log_level: str = 'INFO',
     console_output: bool = True,
     json_format: bool = False,
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
-    backup_count: int = 7
+    backup_count: int = 7,
+    use_queue: bool = True
 ) -> logging.Logger:
     """
     Setup comprehensive logging system
@@ -90,10 +142,13 @@ def setup_logging(
         json_format: Use JSON format for file logs
         max_bytes: Maximum size per log file
         backup_count: Number of backup files to keep
+        use_queue: Format and write records on a background listener thread
         
     Returns:
         Configured root logger
     """
+    global _queue_listener
+    
     # Create logs directory
     os.makedirs(log_dir, exist_ok=True)
     
@@ -102,7 +157,9 @@ def setup_logging(
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
     # Clear existing handlers
+    stop_logging_listener()
     root_logger.handlers.clear()
+    handlers = []
     
     # ===== Main Application Log =====
     main_log_path = os.path.join(log_dir, 'search-engine.log')
@@ -121,7 +178,7 @@ def setup_logging(
             datefmt='%Y-%m-%d %H:%M:%S'
         ))
     
-    root_logger.addHandler(main_handler)
+    handlers.append(main_handler)
     
     # ===== Error Log (ERROR and above only) =====
     error_log_path = os.path.join(log_dir, 'error.log')
@@ -139,7 +196,7 @@ def setup_logging(
         '%(message)s\n',
         datefmt='%Y-%m-%d %H:%M:%S'
     ))
-    root_logger.addHandler(error_handler)
+    handlers.append(error_handler)
     
     # ===== Performance Log =====
     perf_log_path = os.path.join(log_dir, 'performance.log')
@@ -151,12 +208,12 @@ def setup_logging(
     )
     
     # Only performance-related logs
-    perf_handler.addFilter(lambda record: 'performance' in record.getMessage().lower() or hasattr(record, 'duration'))
+    perf_handler.addFilter(PerformanceFilter())
     perf_handler.setFormatter(StructuredFormatter() if json_format else logging.Formatter(
         '%(asctime)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     ))
-    root_logger.addHandler(perf_handler)
+    handlers.append(perf_handler)
     
     # ===== Console Output =====
     if console_output:
@@ -165,14 +222,39 @@ def setup_logging(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%H:%M:%S'
         ))
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # ===== Dispatch =====
+    if use_queue:
+        # Callers only enqueue; formatting and disk I/O happen on the listener thread
+        log_queue = queue.Queue(-1)
+        root_logger.addHandler(InProcessQueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
     
     # Log initial setup
-    root_logger.info(f"Logging initialized: level={log_level}, dir={log_dir}")
+    root_logger.info("Logging initialized: level=%s, dir=%s", log_level, log_dir)
     
     return root_logger
 
 
+class PerfLogRecord(logging.LogRecord):
+    """
+    LogRecord emitted by PerformanceLogger/RequestLogger.
+    
+    ``perf`` is a class attribute, so PerformanceFilter matches these
+    records without a per-instance attribute write.
+    """
+    
+    perf = True
+    extra_data: Optional[Dict[str, Any]] = None
+
+
 class PerformanceLogger:
     """
     Context manager for logging performance metrics
@@ -194,12 +276,15 @@ class PerformanceLogger:
     
     def __enter__(self):
         """Start timing"""
-        self.start_time = datetime.now()
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Log performance"""
-        duration_ms = (datetime.now() - self.start_time).total_seconds() * 1000
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        duration_ms = (time.perf_counter() - self.start_time) * 1000
         
         log_data = {
             'operation': self.operation,
@@ -208,17 +293,15 @@ class PerformanceLogger:
             **self.context
         }
         
-        # Create structured log
-        message = f"Performance: {self.operation} completed in {duration_ms:.2f}ms"
-        
-        # Use logger's _log method to add custom attributes
-        record = self.logger.makeRecord(
+        # Build the record directly; the message is only interpolated if a
+        # handler actually formats it
+        record = PerfLogRecord(
             self.logger.name,
             logging.INFO,
             "",
             0,
-            message,
-            (),
+            "Performance: %s completed in %.2fms",
+            (self.operation, duration_ms),
             None
         )
         record.extra_data = log_data
@@ -238,6 +321,10 @@ class RequestLogger:
             logger: Logger instance
         """
         self.logger = logger
+        # Bound once; log_request sits on the per-request hot path
+        self._name = logger.name
+        self._is_enabled = logger.isEnabledFor
+        self._handle = logger.handle
     
     def log_request(self,
                     method: str,
@@ -255,6 +342,10 @@ class RequestLogger:
             duration_ms: Request duration in milliseconds
             **kwargs: Additional context
         """
+        level = logging.INFO if 200 <= status_code < 400 else logging.WARNING
+        if not self._is_enabled(level):
+            return
+
         log_data = {
             'type': 'http_request',
             'method': method,
@@ -264,20 +355,17 @@ class RequestLogger:
             **kwargs
         }
         
-        level = logging.INFO if 200 <= status_code < 400 else logging.WARNING
-        message = f"{method} {path} {status_code} {duration_ms:.2f}ms"
-        
-        record = self.logger.makeRecord(
-            self.logger.name,
+        record = PerfLogRecord(
+            self._name,
             level,
             "",
             0,
-            message,
-            (),
+            "%s %s %s %.2fms",
+            (method, path, status_code, duration_ms),
             None
         )
         record.extra_data = log_data
-        self.logger.handle(record)
+        self._handle(record)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -315,7 +403,6 @@ if __name__ == "__main__":
     # Test performance logging
     print("\nTesting performance logging:")
     with PerformanceLogger(test_logger, "search_query", query="python", results=42):
-        import time
         time.sleep(0.1)  # Simulate work
     
     # Test exception logging
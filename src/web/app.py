@@ -3,12 +3,25 @@ Flask Web Application - Phase 2 Update
 Updated with SerpAPI integration and new search endpoints
 """
 
+import hashlib
+import heapq
 import os, sys
 import logging
-from datetime import datetime
-from flask import Flask, request, jsonify, render_template
-from flask_cors import CORS
-from src.search import SearchManager
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date, datetime
+from functools import lru_cache, wraps
+from flask import Flask, Response, request, render_template, stream_template, stream_with_context, url_for
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.exceptions import HTTPException
+from src.search import PrefixTrie, SearchManager
+from src.search.prefix_trie import MAX_TERM_LENGTH
+from src.utils.http_session import pooled_session
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 basedir = os.path.abspath(os.path.dirname(__file__))
@@ -16,39 +29,26 @@ basedir = os.path.abspath(os.path.dirname(__file__))
 
 # Import Phase 1 components
 from src.config.config import Config
-from src.external.serpapi_client import SerpAPIClient, SerpAPIException
-from src.search.search_manager import SearchManager
-from dataclasses import asdict
-from src.external.google_search_client import GoogleSearchClient
-from src.marketplace.marketplace_client import MarketplaceClient
-from src.marketplace.price_alerts import PriceAlertManager
-from src.jobs.job_search_client import JobSearchClient, JobAlertManager
-
-# Import existing components (assuming they exist)
-try:
-    from src.ranking.advanced_ranker import AdvancedRanker
-except ImportError:
-    AdvancedRanker = None
-
-try:
-    from src.caching.cache_manager import CacheManager
-except ImportError:
-    CacheManager = None
+from dataclasses import asdict, is_dataclass
 
 try:
-    from src.storage.analytics_store import AnalyticsStore
+    import orjson
+    # numpy scalars/arrays (ranking scores, analytics aggregates) encode natively
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
 except ImportError:
-    AnalyticsStore = None
+    orjson = None
+    import json
 
 try:
-    from src.monitoring.metrics import MetricsCollector
+    from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+    from prometheus_client.core import GaugeMetricFamily
 except ImportError:
-    MetricsCollector = None
+    CollectorRegistry = None
 
-try:
-    from src.crawler.spider import Spider
-except ImportError:
-    Spider = None
+# External API clients, marketplace/job integrations, rankers, cache, analytics,
+# metrics and the crawler are imported inside their _build_*() factories so that
+# importing this module (and forking workers) doesn't pay for backends that are
+# disabled or never used.
 
 logger = logging.getLogger(__name__)
 
@@ -58,47 +58,524 @@ app = Flask(__name__,
     static_folder=os.path.join(basedir, 'static'),
     static_url_path='/static')
 
-search_manager = SearchManager()
-search_manager.search(
-    query="enter your search",
-    max_results=70,
+app.config['SECRET_KEY'] = Config.SECRET_KEY
+app.config['MAX_CONTENT_LENGTH'] = Config.WEB_MAX_CONTENT_LENGTH
+# Templates only change during development; elsewhere skip the stat() per
+# render and keep compiled template bytecode on disk across restarts.
+app.config['TEMPLATES_AUTO_RELOAD'] = Config.FLASK_DEBUG
+if Config.JINJA_CACHE_DIR:
+    os.makedirs(Config.JINJA_CACHE_DIR, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(Config.JINJA_CACHE_DIR or None)
+
+
+def _json_default(obj):
+    """Serialize the extra types jsonify used to accept"""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if type(obj).__name__ in ('Decimal', 'UUID'):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def ojson(payload, status: int = 200) -> Response:
+    """
+    Build a JSON response, serialized with orjson when it is installed
+    
+    Args:
+        payload: JSON-serializable value
+        status: HTTP status code
+        
+    Returns:
+        Flask Response with an application/json body
+    """
+    return Response(_dumps(payload), status=status, mimetype='application/json')
+
+
+def _dumps(payload) -> bytes:
+    """Encode a value as UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=_ORJSON_OPTIONS)
+    return json.dumps(payload, default=_json_default, ensure_ascii=False).encode('utf-8')
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """app.json backed by orjson: request.get_json(), jsonify() and |tojson"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            # e.g. indent/sort_keys, which orjson only partly supports
+            return super().dumps(obj, **kwargs)
+        return _dumps(obj).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(_dumps(obj), mimetype=self.mimetype)
+
+
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
+
+_SUCCESS_PREFIX = b'{"status":"success","data":'
+
+
+def _canned_error(message: str, status: int, **extra):
+    """
+    Pre-encode a fixed error response
+    
+    Returns a zero-argument factory. Each call wraps the shared body in a new
+    Response, because after_request hooks (CORS) add headers per request.
+    """
+    body = _dumps({'status': 'error', 'error': message, **extra})
+    return lambda: Response(body, status=status, mimetype='application/json')
+
+
+def _raw_success(data_json: str) -> Response:
+    """Wrap an already-encoded JSON document in the success envelope"""
+    body = b''.join((_SUCCESS_PREFIX, data_json.encode('utf-8'), b'}'))
+    return Response(body, mimetype='application/json')
+
+
+# Accepted spellings for boolean query/body parameters
+_TRUE = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _int_param_error(name: str) -> Response:
+    return ojson({
+        'status': 'error',
+        'error': f'Parameter "{name}" must be an integer'
+    }, 400)
+
+
+# Request schemas map a parameter name to (converter, default). They are
+# declared once at import time and applied by _parse_args.
+_REQUIRED = object()
+
+
+def _as_str(value) -> str:
+    return str(value).strip()
+
+
+def _as_bool(value) -> bool:
+    if isinstance(value, str):
+        return value.lower() in _TRUE
+    return bool(value)
+
+
+def _as_list(value) -> list:
+    """
+    Accept a list (JSON) or a comma-separated string (query string)
+    
+    Items are stripped and de-duplicated in order, so a source named twice
+    is only queried once.
+    """
+    if isinstance(value, str):
+        value = value.split(',')
+    elif not isinstance(value, list):
+        raise ValueError(value)
+    return list(dict.fromkeys(item for item in map(_as_str, value) if item))
+
+
+def _as_dict(value) -> dict:
+    if not isinstance(value, dict):
+        raise ValueError(value)
+    return value
+
+
+def _as_mode(value):
+    """A search mode override; anything unrecognized means the manager's own mode"""
+    value = _as_str(value)
+    return value if value in ('local', 'serpapi', 'hybrid') else None
+
+
+def _parse_args(schema: dict, data):
+    """
+    Coerce the request parameters described by a schema
+    
+    A field is absent when it is missing, null or blank.
+    
+    Args:
+        schema: Mapping of name -> (converter, default or _REQUIRED)
+        data: request.args for GET routes, the JSON body for POST routes
+        
+    Returns:
+        (args, None) on success, (None, 400 response) on bad input
+    """
+    args = {}
+    for name, (convert, default) in schema.items():
+        value = data.get(name)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            if default is _REQUIRED:
+                return None, ojson({
+                    'status': 'error',
+                    'error': f'Parameter "{name}" is required'
+                }, 400)
+            args[name] = default
+            continue
+        try:
+            args[name] = convert(value)
+        except (TypeError, ValueError):
+            return None, ojson({
+                'status': 'error',
+                'error': f'Invalid value for parameter "{name}"'
+            }, 400)
+    return args, None
+
+
+_SEARCH_ARGS = {
+    'q': (_as_str, _REQUIRED),
+    'max_results': (int, 50),
+    'limit': (int, 10),
+    'offset': (int, 0),
+    'mode': (_as_mode, None),
+    'safe_search': (_as_bool, True),
+    'region': (_as_str, 'wt-wt'),
+    'time_period': (_as_str, None),
+    'filters': (_as_dict, None),
+}
+
+_SUGGESTIONS_ARGS = {
+    'q': (_as_str, _REQUIRED),
+    'max': (int, 10),
+}
+
+_JOB_SEARCH_ARGS = {
+    'q': (_as_str, _REQUIRED),
+    'location': (_as_str, ''),
+    'max_results': (int, 20),
+    'remote_only': (_as_bool, False),
+    'min_salary': (int, None),
+    'experience_level': (_as_str, None),
+    'job_type': (_as_str, None),
+    'sources': (_as_list, None),
+    'async': (_as_bool, False),
+}
+
+_MARKETPLACE_SEARCH_ARGS = {
+    'q': (_as_str, _REQUIRED),
+    'max_results': (int, 30),
+    'marketplaces': (_as_list, None),
+    'min_price': (float, None),
+    'max_price': (float, None),
+    'sort_by': (_as_str, 'relevance'),
+    'async': (_as_bool, False),
+    'stream': (_as_bool, False),
+}
+
+_PRICE_ALERT_ARGS = {
+    'email': (_as_str, _REQUIRED),
+    'product_name': (_as_str, _REQUIRED),
+    'product_url': (_as_str, _REQUIRED),
+    'marketplace': (_as_str, _REQUIRED),
+    'target_price': (float, _REQUIRED),
+    'current_price': (float, _REQUIRED),
+}
+
+_JOB_ALERT_ARGS = {
+    'email': (_as_str, _REQUIRED),
+    'keywords': (_as_str, _REQUIRED),
+    'location': (_as_str, ''),
+    'remote_only': (_as_bool, False),
+    'min_salary': (int, None),
+}
+
+
+def _allowed_origins(setting: str):
+    """Parse CORS_ORIGINS; None means any origin"""
+    origins = frozenset(o.strip().rstrip('/') for o in setting.split(',') if o.strip())
+    return None if '*' in origins else origins
+
+
+_CORS_ORIGINS = _allowed_origins(Config.CORS_ORIGINS)
+
+
+def _add_cors_headers(response):
+    """
+    after_request hook answering CORS for the configured origins
+    
+    Preflight OPTIONS requests are answered by Flask's automatic OPTIONS
+    handling; this only adds the Access-Control headers to them.
+    """
+    origin = request.headers.get('Origin')
+    if not origin:
+        return response
+    
+    if _CORS_ORIGINS is None:
+        response.headers['Access-Control-Allow-Origin'] = '*'
+    elif origin in _CORS_ORIGINS:
+        response.headers['Access-Control-Allow-Origin'] = origin
+        response.vary.add('Origin')
+    else:
+        return response
+    
+    if request.method == 'OPTIONS':
+        response.headers['Access-Control-Allow-Methods'] = response.headers.get(
+            'Allow', 'GET, POST, PUT, DELETE, OPTIONS'
+        )
+        requested = request.headers.get('Access-Control-Request-Headers')
+        if requested:
+            response.headers['Access-Control-Allow-Headers'] = requested
+    return response
+
+
+_app_configured = False
+
+
+def create_app() -> Flask:
+    """
+    Finish configuring the application and return it
+    
+    Routes are registered on import; optional hooks such as CORS are only
+    installed here, by the server entry points. Safe to call more than once.
+    
+    Returns:
+        The configured Flask app
+    """
+    global _app_configured
+    
+    with _init_lock:
+        if not _app_configured:
+            if Config.CORS_ENABLED:
+                app.after_request(_add_cors_headers)
+            _app_configured = True
+    return app
+
+# Components are built lazily by their get_*() accessor on first use, so a
+# worker only pays for the backends its routes actually touch. _UNBUILT marks
+# "not constructed yet"; None means "constructed, but unavailable". Tests and
+# main.py may assign these globals directly.
+_UNBUILT = object()
+
+cache_manager = _UNBUILT
+local_ranker = _UNBUILT
+serpapi_client = _UNBUILT
+search_manager = _UNBUILT
+analytics_store = _UNBUILT
+metrics_collector = _UNBUILT
+spider = _UNBUILT
+google_client = _UNBUILT
+marketplace_client = _UNBUILT
+price_alert_manager = _UNBUILT
+job_search_client = _UNBUILT
+job_alert_manager = _UNBUILT
+
+_COMPONENT_NAMES = (
+    'cache_manager', 'local_ranker', 'serpapi_client', 'search_manager',
+    'analytics_store', 'metrics_collector', 'spider', 'google_client',
+    'marketplace_client', 'price_alert_manager', 'job_search_client',
+    'job_alert_manager',
 )
 
-app.config['SECRET_KEY'] = Config.SECRET_KEY
-app.config['JSON_SORT_KEYS'] = False
-
-# Enable CORS if configured
-if Config.CORS_ENABLED:
-    CORS(app, origins=Config.CORS_ORIGINS)
-
-# Initialize all global components as None
-cache_manager = None
-local_ranker = None
-serpapi_client = None
-search_manager = None
-analytics_store = None
-metrics_collector = None
-spider = None
-google_client = None
-marketplace_client = None
-price_alert_manager = None
-job_search_client = None
-job_alert_manager = None
-
-# Override variables for components passed from main.py
-_local_ranker_override = None
-_spider_override = None
+# Components passed from main.py that the app has no builder for
 _indexer_override = None
 _tokenizer_override = None
 _database_override = None
-_search_manager_override = None
+
+_init_lock = threading.RLock()
+
+
+def _lazy_component(name: str, builder):
+    """
+    Return the named component, building it on first access
+
+    Args:
+        name: Module global holding the component
+        builder: Zero-argument factory returning the component (or None)
+    """
+    value = globals()[name]
+    if value is _UNBUILT:
+        with _init_lock:
+            value = globals()[name]
+            if value is _UNBUILT:
+                value = builder()
+                globals()[name] = value
+    return value
+
+
+def _peek(name: str):
+    """Return the named component if it has been built, without building it"""
+    value = globals()[name]
+    return None if value is _UNBUILT else value
+
+
+def _lazy_available(name: str, enabled: bool) -> bool:
+    """Whether the named component is up, counting a not-yet-built one as up when enabled"""
+    value = globals()[name]
+    return enabled if value is _UNBUILT else value is not None
+
+
+@lru_cache(maxsize=None)
+def _http_session():
+    """One keep-alive session shared by the external API clients this worker builds"""
+    return pooled_session()
+
+
+def _build_local_ranker():
+    try:
+        from src.ranking.advanced_ranker import AdvancedRanker
+        from src.indexing.indexer import Indexer
+        ranker = AdvancedRanker(indexer=_indexer_override or Indexer())
+        logger.info("✓ Local Ranker initialized")
+        return ranker
+    except Exception as e:
+        logger.warning("Local Ranker failed: %s", e)
+        return None
+
+
+def _build_spider():
+    try:
+        from src.crawler.spider import Spider
+        crawler = Spider()
+        logger.info("✓ Spider initialized")
+        return crawler
+    except Exception as e:
+        logger.warning("Spider failed: %s", e)
+        return None
+
+
+def _build_cache_manager():
+    if not Config.CACHE_ENABLED:
+        return None
+    try:
+        from src.caching.cache_manager import CacheManager
+        cache = CacheManager(
+            l1_max_size=Config.CACHE_L1_MAX_SIZE,
+            l1_ttl=Config.CACHE_L1_TTL
+        )
+        logger.info("✓ Cache manager initialized")
+        return cache
+    except Exception as e:
+        logger.warning("Cache initialization failed: %s", e)
+        return None
+
+
+def _build_google_client():
+    google_enabled = os.getenv('GOOGLE_ENABLED', 'false').lower() == 'true'
+    if not (google_enabled and os.getenv('GOOGLE_API_KEY') and os.getenv('GOOGLE_SEARCH_ENGINE_ID')):
+        if google_enabled:
+            logger.warning("Google Search enabled but API credentials not set—searches will fall back to serpapi/local")
+        return None
+    try:
+        from src.external.google_search_client import GoogleSearchClient
+        client = GoogleSearchClient(session=_http_session())
+        logger.info("✓ Google Search client initialized")
+        return client
+    except Exception as e:
+        logger.error("Google Search initialization failed: %s", e)
+        return None
+
+
+def _build_serpapi_client():
+    if not (Config.SERPAPI_ENABLED and Config.SERPAPI_KEY):
+        if Config.SERPAPI_ENABLED:
+            logger.warning("SerpAPI enabled but SERPAPI_KEY not set—searches will fall back to local/google")
+        return None
+    try:
+        from src.external.serpapi_client import SerpAPIClient
+        client = SerpAPIClient(timeout=Config.SERPAPI_TIMEOUT, session=_http_session())
+        logger.info("✓ SerpAPI client initialized")
+        return client
+    except Exception as e:
+        logger.error("SerpAPI initialization failed: %s", e)
+        return None
+
+
+def _build_marketplace_client():
+    if not Config.MARKETPLACE_ENABLED:
+        return None
+    try:
+        from src.marketplace.marketplace_client import MarketplaceClient
+        client = MarketplaceClient(session=_http_session())
+        logger.info("✓ Marketplace client initialized")
+        return client
+    except Exception as e:
+        logger.warning("Marketplace initialization failed: %s", e)
+        return None
+
+
+def _build_price_alert_manager():
+    if not Config.MARKETPLACE_ENABLED:
+        return None
+    try:
+        from src.marketplace.price_alerts import PriceAlertManager
+        manager = PriceAlertManager()
+        logger.info("✓ Price alert manager initialized")
+        return manager
+    except Exception as e:
+        logger.warning("Price alert manager initialization failed: %s", e)
+        return None
+
+
+def _build_job_search_client():
+    if not Config.JOBS_ENABLED:
+        return None
+    try:
+        from src.jobs.job_search_client import JobSearchClient
+        client = JobSearchClient(session=_http_session())
+        logger.info("✓ Job search client initialized")
+        return client
+    except Exception as e:
+        logger.warning("Job search initialization failed: %s", e)
+        return None
+
+
+def _build_job_alert_manager():
+    if not Config.JOBS_ENABLED:
+        return None
+    try:
+        from src.jobs.job_search_client import JobAlertManager
+        manager = JobAlertManager()
+        logger.info("✓ Job alert manager initialized")
+        return manager
+    except Exception as e:
+        logger.warning("Job alert manager initialization failed: %s", e)
+        return None
+
+
+def _build_search_manager():
+    manager = SearchManager(
+        google_client=get_google_client(),
+        local_ranker=get_ranker(),
+        serpapi_client=get_serpapi_client(),
+        cache_manager=get_cache_manager(),
+        mode=Config.SEARCH_MODE
+    )
+    logger.info("✓ Search manager initialized in '%s' mode", Config.SEARCH_MODE)
+    return manager
+
+
+def _build_analytics_store():
+    if not Config.ANALYTICS_ENABLED:
+        return None
+    try:
+        from src.storage.analytics_store import AnalyticsStore
+        store = AnalyticsStore()
+        logger.info("✓ Analytics store initialized")
+        return store
+    except Exception as e:
+        logger.warning("Analytics initialization failed: %s", e)
+        return None
+
+
+def _build_metrics_collector():
+    try:
+        from src.monitoring.metrics import MetricsCollector
+        collector = MetricsCollector()
+        logger.info("✓ Metrics collector initialized")
+        return collector
+    except Exception as e:
+        logger.warning("Metrics initialization failed: %s", e)
+        return None
 
 
 def get_ranker():
     """Get the ranker instance"""
-    if _local_ranker_override:
-        return _local_ranker_override
-    return local_ranker
+    return _lazy_component('local_ranker', _build_local_ranker)
 
 
 def get_indexer():
@@ -110,9 +587,7 @@ def get_indexer():
 
 def get_spider():
     """Get the spider instance"""
-    if _spider_override:
-        return _spider_override
-    return spider
+    return _lazy_component('spider', _build_spider)
 
 
 def get_tokenizer():
@@ -131,30 +606,85 @@ def get_database():
 
 def get_search_manager():
     """Get the search manager instance"""
-    if _search_manager_override:
-        return _search_manager_override
-    return search_manager
+    return _lazy_component('search_manager', _build_search_manager)
+
+
+def get_cache_manager():
+    """Get the cache manager instance (None when caching is disabled)"""
+    return _lazy_component('cache_manager', _build_cache_manager)
+
+
+def get_serpapi_client():
+    """Get the SerpAPI client (None when not configured)"""
+    return _lazy_component('serpapi_client', _build_serpapi_client)
+
+
+def get_google_client():
+    """Get the Google Search client (None when not configured)"""
+    return _lazy_component('google_client', _build_google_client)
+
+
+def get_marketplace_client():
+    """Get the marketplace client (None when disabled)"""
+    return _lazy_component('marketplace_client', _build_marketplace_client)
+
+
+def get_price_alert_manager():
+    """Get the price alert manager (None when disabled)"""
+    return _lazy_component('price_alert_manager', _build_price_alert_manager)
+
+
+def get_job_search_client():
+    """Get the job search client (None when disabled)"""
+    return _lazy_component('job_search_client', _build_job_search_client)
+
+
+def get_job_alert_manager():
+    """Get the job alert manager (None when disabled)"""
+    return _lazy_component('job_alert_manager', _build_job_alert_manager)
+
+
+def get_analytics_store():
+    """Get the analytics store (None when analytics is disabled)"""
+    return _lazy_component('analytics_store', _build_analytics_store)
+
+
+def get_metrics_collector():
+    """Get the metrics collector"""
+    return _lazy_component('metrics_collector', _build_metrics_collector)
 
 
 def set_components(ranker=None, spider=None, indexer=None, tokenizer=None, database=None, search_manager_instance=None, 
                    marketplace_client_instance=None, job_search_client_instance=None, price_alert_manager_instance=None, job_alert_manager_instance=None):
     """
     Set component overrides from main.py
-    This allows main.py to pass its initialized components to the Flask app
+    This allows main.py to pass its initialized components to the Flask app.
+    Components the app can also build itself are stored in their module
+    globals, so the get_*() accessors need no override check per request.
     """
-    global _local_ranker_override, _spider_override, _indexer_override, _tokenizer_override, _database_override, _search_manager_override
+    global _indexer_override, _tokenizer_override, _database_override
+    global local_ranker, search_manager
     global marketplace_client, job_search_client, price_alert_manager, job_alert_manager
     
-    logger.info(f"set_components called with: ranker={ranker is not None}, spider={spider is not None}, indexer={indexer is not None}, tokenizer={tokenizer is not None}, database={database is not None}, search_manager={search_manager_instance is not None}, marketplace={marketplace_client_instance is not None}, jobs={job_search_client_instance is not None}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "set_components called with: ranker=%s, spider=%s, indexer=%s, "
+            "tokenizer=%s, database=%s, search_manager=%s, marketplace=%s, jobs=%s",
+            ranker is not None, spider is not None, indexer is not None,
+            tokenizer is not None, database is not None,
+            search_manager_instance is not None,
+            marketplace_client_instance is not None,
+            job_search_client_instance is not None,
+        )
     
     if ranker:
-        _local_ranker_override = ranker
+        local_ranker = ranker
         logger.info("✓ Local ranker set from main.py")
     else:
         logger.warning("⚠ Ranker was None")
     
     if spider:
-        _spider_override = spider
+        globals()['spider'] = spider  # the parameter shadows the global
         logger.info("✓ Spider set from main.py")
     else:
         logger.warning("⚠ Spider was None")
@@ -178,7 +708,7 @@ def set_components(ranker=None, spider=None, indexer=None, tokenizer=None, datab
         logger.warning("⚠ Database was None")
     
     if search_manager_instance:
-        _search_manager_override = search_manager_instance
+        search_manager = search_manager_instance
         logger.info("✓ SearchManager set from main.py")
     else:
         logger.warning("⚠ SearchManager was None")
@@ -201,146 +731,119 @@ def set_components(ranker=None, spider=None, indexer=None, tokenizer=None, datab
         logger.info("✓ Job alert manager set from main.py")
 
 
-def initialize_components():
-    """Initialize all application components"""
-    global cache_manager, local_ranker, analytics_store, metrics_collector, spider
-    global serpapi_client, search_manager
-    global google_client, marketplace_client, price_alert_manager
-    global job_search_client, job_alert_manager
-    
-    logger.info("="*60)
-    logger.info("Initializing Application Components")
-    logger.info("="*60)
-    
-    # Use components from main.py if available
-    if _local_ranker_override:
-        local_ranker = _local_ranker_override
-        logger.info("✓ Using ranker from main.py")
-    elif AdvancedRanker:
-        try:
-            from src.indexing.indexer import Indexer
-            indexer = _indexer_override or Indexer()
-            local_ranker = AdvancedRanker(indexer=indexer)
-            logger.info("✓ Local Ranker initialized")
-        except Exception as e:
-            logger.warning(f"Local Ranker failed: {e}")
-    
-    if _spider_override:
-        spider = _spider_override
-        logger.info("✓ Using spider from main.py")
-    elif Spider:
-        try:
-            spider = Spider()
-            logger.info("✓ Spider initialized")
-        except Exception as e:
-            logger.warning(f"Spider failed: {e}")
+def initialize_components(force: bool = False):
+    """
+    Eagerly build every component
     
-    # Initialize cache
-    if CacheManager and Config.CACHE_ENABLED:
-        try:
-            cache_manager = CacheManager()
-            logger.info("✓ Cache manager initialized")
-        except Exception as e:
-            logger.warning(f"Cache initialization failed: {e}")
+    Components are otherwise built lazily on first use; this is for callers
+    that want to pay the startup cost up front. Components that are already
+    built (or assigned via set_components) are kept unless force is set.
     
-    # Initialize Google Search client
-    google_enabled = os.getenv('GOOGLE_ENABLED', 'false').lower() == 'true'
-    if google_enabled and os.getenv('GOOGLE_API_KEY') and os.getenv('GOOGLE_SEARCH_ENGINE_ID'):
+    Args:
+        force: Drop and rebuild components that were already built
+    """
+    with _init_lock:
+        if force:
+            for name in _COMPONENT_NAMES:
+                globals()[name] = _UNBUILT
+        
+        logger.info("="*60)
+        logger.info("Initializing Application Components")
+        logger.info("="*60)
+        
+        get_ranker()
+        get_spider()
+        get_search_manager()
+        get_marketplace_client()
+        get_price_alert_manager()
+        get_job_search_client()
+        get_job_alert_manager()
+        get_analytics_store()
+        get_metrics_collector()
+        
+        if Config.FAST_BOOT:
+            logger.info("FAST_BOOT set—checking external APIs in the background")
+            threading.Thread(
+                target=_check_external_clients, name='health-check', daemon=True
+            ).start()
+        else:
+            _check_external_clients()
+        
+        logger.info("Application initialization complete!")
+
+
+def _check_external_clients():
+    """Log whether the configured external search APIs are reachable"""
+    for name, client in (('SerpAPI', _peek('serpapi_client')),
+                         ('Google Search', _peek('google_client'))):
+        if client is None:
+            continue
+        # Don't fail if health check fails—client may still work
         try:
-            google_client = GoogleSearchClient()
-            # Don't fail if health check fails—client may still work
+            if client.health_check():
+                logger.info("✓ %s client connected", name)
+            else:
+                logger.warning("%s health check failed, but client will still attempt searches", name)
+        except Exception as hc_error:
+            logger.debug("%s health check error (non-critical): %s", name, hc_error)
+
+
+# Search analytics and metrics are written off the request path: api_search
+# enqueues an event and a single daemon thread drains the queue in batches.
+_ANALYTICS_BATCH_SIZE = 100
+_analytics_q = queue.Queue(maxsize=10000)
+_analytics_worker = None
+
+
+def _drain_analytics_queue():
+    """Consume search events forever, writing them in batches"""
+    while True:
+        batch = [_analytics_q.get()]
+        while len(batch) < _ANALYTICS_BATCH_SIZE:
             try:
-                if google_client.health_check():
-                    logger.info("✓ Google Search client initialized and connected")
-                else:
-                    logger.warning("Google Search health check failed, but client will still attempt searches")
-            except Exception as hc_error:
-                logger.debug(f"Google Search health check error (non-critical): {hc_error}")
-        except Exception as e:
-            logger.error(f"Google Search initialization failed: {e}")
-            google_client = None
-    else:
-        if google_enabled and (not os.getenv('GOOGLE_API_KEY') or not os.getenv('GOOGLE_SEARCH_ENGINE_ID')):
-            logger.warning("Google Search enabled but API credentials not set—searches will fall back to serpapi/local")
-    
-    # Initialize SerpAPI client
-    if Config.SERPAPI_ENABLED and Config.SERPAPI_KEY:
+                batch.append(_analytics_q.get_nowait())
+            except queue.Empty:
+                break
+        
         try:
-            serpapi_client = SerpAPIClient(timeout=Config.SERPAPI_TIMEOUT)
-            # Don't fail if health check fails—client may still work
-            try:
-                if serpapi_client.health_check():
-                    logger.info("✓ SerpAPI client initialized and connected")
-                else:
-                    logger.warning("SerpAPI health check failed, but client will still attempt searches")
-            except Exception as hc_error:
-                logger.debug(f"SerpAPI health check error (non-critical): {hc_error}")
+            analytics_store = get_analytics_store()
+            if analytics_store:
+                analytics_store.track_searches_batch(batch)
+            
+            metrics_collector = get_metrics_collector()
+            if metrics_collector:
+                for event in batch:
+                    metrics_collector.record_search(
+                        duration_seconds=event['response_time'],
+                        result_count=event['results_count'],
+                        query_length=len(event['query'])
+                    )
         except Exception as e:
-            logger.error(f"SerpAPI initialization failed: {e}")
-            serpapi_client = None
-    else:
-        if Config.SERPAPI_ENABLED and not Config.SERPAPI_KEY:
-            logger.warning("SerpAPI enabled but SERPAPI_KEY not set—searches will fall back to local/google")
+            logger.error("Failed to record %s search events: %s", len(batch), e)
+        finally:
+            for _ in batch:
+                _analytics_q.task_done()
+
+
+def _record_search_event(event: dict) -> None:
+    """Queue a search event for the analytics worker (dropped if the queue is full)"""
+    global _analytics_worker
     
-    # Initialize Marketplace client
-    try:
-        marketplace_client = MarketplaceClient()
-        logger.info("✓ Marketplace client initialized")
-    except Exception as e:
-        logger.warning(f"Marketplace initialization failed: {e}")
+    # Stamp now, not when the worker drains the batch
+    event.setdefault('timestamp', time.time())
     
-    # Initialize Price Alert Manager
-    try:
-        price_alert_manager = PriceAlertManager()
-        logger.info("✓ Price alert manager initialized")
-    except Exception as e:
-        logger.warning(f"Price alert manager initialization failed: {e}")
-    
-    # Initialize Job Search client
-    try:
-        job_search_client = JobSearchClient()
-        logger.info("✓ Job search client initialized")
-    except Exception as e:
-        logger.warning(f"Job search initialization failed: {e}")
+    if _analytics_worker is None:
+        with _init_lock:
+            if _analytics_worker is None:
+                _analytics_worker = threading.Thread(
+                    target=_drain_analytics_queue, name='analytics-writer', daemon=True
+                )
+                _analytics_worker.start()
     
-    # Initialize Job Alert Manager
     try:
-        job_alert_manager = JobAlertManager()
-        logger.info("✓ Job alert manager initialized")
-    except Exception as e:
-        logger.warning(f"Job alert manager initialization failed: {e}")
-    
-    # Initialize search manager with all clients (only if not set from main.py)
-    if not _search_manager_override:
-        search_manager = SearchManager(
-            google_client=google_client,
-            local_ranker=local_ranker or _local_ranker_override,
-            serpapi_client=serpapi_client,
-            cache_manager=cache_manager,
-            mode=Config.SEARCH_MODE
-        )
-        logger.info(f"✓ Search manager initialized in '{Config.SEARCH_MODE}' mode")
-    else:
-        search_manager = _search_manager_override
-        logger.info("✓ Using search manager from main.py")
-    
-    # Initialize analytics
-    if AnalyticsStore and Config.ANALYTICS_ENABLED:
-        try:
-            analytics_store = AnalyticsStore()
-            logger.info("✓ Analytics store initialized")
-        except Exception as e:
-            logger.warning(f"Analytics initialization failed: {e}")
-    
-    # Initialize metrics
-    if MetricsCollector:
-        try:
-            metrics_collector = MetricsCollector()
-            logger.info("✓ Metrics collector initialized")
-        except Exception as e:
-            logger.warning(f"Metrics initialization failed: {e}")
-    
-    logger.info("Application initialization complete!")
+        _analytics_q.put_nowait(event)
+    except queue.Full:
+        logger.warning("Analytics queue full, dropping search event")
 
 
 # ============================================================================
@@ -357,7 +860,9 @@ def index():
 def results():
     """Render results page"""
     query = request.args.get('q', '')
-    return render_template('results.html', query=query)
+    # Streamed so the page head (stylesheets, scripts) goes out before the
+    # rest of the body is rendered
+    return Response(stream_template('results.html', query=query), mimetype='text/html')
 
 
 @app.route('/marketplace')
@@ -378,6 +883,144 @@ def jobs_page():
 # ROUTES - Search API
 # ============================================================================
 
+# Fixed error responses of the search routes when a backend is disabled
+_ERR_SEARCH_NOT_INITIALIZED = _canned_error(
+    'Search service is not available. Please check server configuration.', 503,
+    details='Search manager not initialized'
+)
+_ERR_SEARCH_UNAVAILABLE = _canned_error('Search service not available', 503)
+_ERR_NEWS_UNAVAILABLE = _canned_error('News search requires SerpAPI to be enabled', 503)
+_ERR_IMAGES_UNAVAILABLE = _canned_error('Image search requires SerpAPI to be enabled', 503)
+_ERR_QUERY_REQUIRED = _canned_error('Query parameter "q" is required', 400)
+_ERR_MODE_REQUIRED = _canned_error('Mode parameter is required', 400)
+
+# Popular searches are re-fetched by a background thread shortly before their
+# fresh TTL runs out, so hot queries don't wait on (or serve) stale entries.
+# Hit counts are halved every cycle so the ranking follows recent traffic.
+_MAX_TRACKED_SEARCHES = 1000
+_popular_searches = {}  # cache key -> [hits, loader, ttl, stale_ttl, should_cache]
+_popular_lock = threading.Lock()
+_cache_warmer = None
+
+
+def _warm_popular_searches():
+    """Refresh the most requested warm=True cache entries forever"""
+    while True:
+        time.sleep(Config.CACHE_WARM_INTERVAL)
+        cache = _peek('cache_manager')
+        
+        with _popular_lock:
+            top = heapq.nlargest(
+                Config.CACHE_WARM_TOP_K, _popular_searches.items(), key=lambda item: item[1][0]
+            )
+            for key in list(_popular_searches):
+                entry = _popular_searches[key]
+                entry[0] //= 2
+                if not entry[0]:
+                    del _popular_searches[key]
+        
+        if cache is None:
+            continue
+        for key, (_, loader, ttl, stale_ttl, should_cache) in top:
+            try:
+                cache.refresh(key, loader, ttl=ttl, stale_ttl=stale_ttl, should_cache=should_cache)
+            except Exception as e:
+                logger.warning("Cache warming failed for %s: %s", key, e)
+
+
+def _track_popular(key: str, loader, ttl: int, stale_ttl: int, should_cache) -> None:
+    """Count a hit on a warm=True cache entry, starting the warmer on first use"""
+    global _cache_warmer
+    
+    if _cache_warmer is None:
+        with _init_lock:
+            if _cache_warmer is None:
+                _cache_warmer = threading.Thread(
+                    target=_warm_popular_searches, name='cache-warmer', daemon=True
+                )
+                _cache_warmer.start()
+    
+    with _popular_lock:
+        entry = _popular_searches.get(key)
+        if entry is not None:
+            entry[0] += 1
+        elif len(_popular_searches) < _MAX_TRACKED_SEARCHES:
+            _popular_searches[key] = [1, loader, ttl, stale_ttl, should_cache]
+
+
+def swr_cache(ttl: int = 300, stale_ttl: int = 3600, should_cache=None, warm: bool = False):
+    """
+    Stale-while-revalidate caching for external API lookups
+    
+    The key is a blake2b hash of the function name and its arguments, so the
+    function name is the namespace cleared by /api/cache/invalidate. Passes
+    straight through when no cache manager is configured.
+    
+    Args:
+        ttl: Seconds a cached response is served as fresh
+        stale_ttl: Seconds a stale response is served while it is refreshed
+        should_cache: Optional predicate deciding whether a result is stored
+        warm: Keep the most requested entries refreshed in the background
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_cache_manager()
+            if cache is None:
+                return func(*args, **kwargs)
+            key = cache.swr_key(func.__name__, *args, *sorted(kwargs.items()))
+            loader = lambda: func(*args, **kwargs)
+            if warm and Config.CACHE_WARM_ENABLED:
+                _track_popular(key, loader, ttl, stale_ttl, should_cache)
+            return cache.get_or_refresh(
+                key, loader, ttl=ttl, stale_ttl=stale_ttl, should_cache=should_cache
+            )
+        return wrapper
+    return decorator
+
+
+# News and image payloads are cached already encoded as [total, json]: a hot
+# query is served without decoding and re-encoding the results each time.
+def _has_results(entry) -> bool:
+    return bool(entry and entry[0])
+
+
+@swr_cache(ttl=Config.CACHE_TTL_API_FRESH, stale_ttl=Config.CACHE_TTL_API_RESULTS,
+           should_cache=_has_results)
+def _cached_news_json(query: str, max_results: int):
+    results = get_serpapi_client().search_news(query, max_results)
+    return [results.get('total', 0), _dumps(results).decode('utf-8')]
+
+
+@swr_cache(ttl=Config.CACHE_TTL_API_FRESH, stale_ttl=Config.CACHE_TTL_API_RESULTS,
+           should_cache=_has_results)
+def _cached_images_json(query: str, max_results: int):
+    results = get_serpapi_client().search_images(query, max_results)
+    return [results.get('total', 0), _dumps(results).decode('utf-8')]
+
+
+@swr_cache(ttl=Config.CACHE_TTL_API_FRESH, stale_ttl=Config.CACHE_TTL_API_RESULTS,
+           should_cache=lambda results: bool(results.get('jobs')), warm=True)
+def _cached_job_search(**search_kwargs):
+    return get_job_search_client().search_jobs(**search_kwargs)
+
+
+@swr_cache(ttl=Config.CACHE_TTL_API_FRESH, stale_ttl=Config.CACHE_TTL_API_RESULTS,
+           should_cache=lambda results: bool(results.get('products')), warm=True)
+def _cached_marketplace_search(**search_kwargs):
+    return get_marketplace_client().search_all(**search_kwargs)
+
+
+# Public names accepted by /api/cache/invalidate -> swr_key namespaces
+_CACHE_NAMESPACES = {
+    'search': (SearchManager.CACHE_NAMESPACE,),
+    'news': (_cached_news_json.__name__,),
+    'images': (_cached_images_json.__name__,),
+    'jobs': (_cached_job_search.__name__,),
+    'marketplace': (_cached_marketplace_search.__name__,),
+}
+
+
 @app.route('/api/search', methods=['GET', 'POST'])
 def api_search():
     """
@@ -398,73 +1041,51 @@ def api_search():
     Returns:
         JSON with search results (paged)
     """
-    start_time = datetime.now()
-    
     # Get the search manager (from override or global)
     current_search_manager = get_search_manager()
     
     # Safety check for search_manager
     if current_search_manager is None:
         logger.error("Search manager not initialized")
-        return jsonify({
-            'status': 'error',
-            'error': 'Search service is not available. Please check server configuration.',
-            'details': 'Search manager not initialized'
-        }), 503
+        return _ERR_SEARCH_NOT_INITIALIZED()
     
     try:
         # Get parameters
         if request.method == 'POST':
             data = request.get_json() or {}
         else:
-            data = request.args.to_dict()
+            data = request.args
         
-        query = data.get('q', '').strip()
-        if not query:
-            return jsonify({
-                'error': 'Query parameter "q" is required',
-                'status': 'error'
-            }), 400
+        args, error = _parse_args(_SEARCH_ARGS, data)
+        if error:
+            return error
+        query = args['q']
         
         # --- PAGINATION PARAMETERS (New) ---
-        limit = int(data.get('limit', 10)) # Results per page (e.g., 10)
-        offset = int(data.get('offset', 0)) # Starting index (e.g., 0, 10, 20)
+        limit = args['limit'] # Results per page (e.g., 10)
+        offset = args['offset'] # Starting index (e.g., 0, 10, 20)
         
         # Determine the maximum ranked results the SearchManager must process.
         # This is the client's requested global cap (default 50) 
         # but must be large enough to fulfill the current page request (offset + limit).
-        client_max_cap = int(data.get('max_results', 50)) 
+        client_max_cap = args['max_results']
         
         # Ensure max_results fetched is max(client_max_cap, offset + limit) up to a server cap (e.g., 100)
         MAX_SERVER_CAP = 100 # Assuming this aligns with Config.RANKING_MAX_RESULTS
         max_fetch = max(client_max_cap, offset + limit)
         max_results_to_fetch = min(MAX_SERVER_CAP, max_fetch)
         
-        mode_override = data.get('mode')
-        safe_search = data.get('safe_search', 'true').lower() == 'true'
-        region = data.get('region', 'wt-wt')
-        time_period = data.get('time_period')
-        filters = data.get('filters', {})
-        
-        # Temporarily override mode if requested
-        original_mode = current_search_manager.mode
-        if mode_override and mode_override in ['local', 'serpapi', 'hybrid']:
-            current_search_manager.set_mode(mode_override)
-        
         # Perform search (Manager fetches up to max_results_to_fetch ranked items)
         results = current_search_manager.search(
             query=query,
             max_results=max_results_to_fetch, # Use the calculated max fetch size
-            filters=filters,
-            safe_search=safe_search,
-            region=region,
-            time_period=time_period
+            filters=args['filters'] or {},
+            mode=args['mode'],  # per-request override; the shared manager's mode is left alone
+            safe_search=args['safe_search'],
+            region=args['region'],
+            time_period=args['time_period']
         )
         
-        # Restore original mode
-        if mode_override:
-            current_search_manager.set_mode(original_mode)
-        
         # --- PAGINATION SLICING & METADATA UPDATE (New) ---
         
         # 1. Store the total count BEFORE slicing (for frontend pagination display)
@@ -477,49 +1098,111 @@ def api_search():
         # Apply slicing to the ranked results list, safely handling array boundaries
         sliced_results = results['results'][start_index:end_index]
 
-        # 3. Update the results structure to return only the current page's data
-        results['results'] = sliced_results
+        # 3. Return only the current page's data. Copy rather than mutate: the
+        # dict may be the very object held by the in-process result cache.
+        results = {**results, 'results': sliced_results}
         results['total'] = total_found # Preserve the true total count for pagination
         
         # --- END PAGINATION SLICING ---
         
-        # Track analytics
-        if analytics_store:
-            # Track using the original total results found
-            analytics_store.track_search(
-                query=query,
-                results_count=total_found, 
-                response_time=results['metadata'].get('response_time', 0),
-                mode=results['metadata'].get('mode', 'unknown')
-            )
-        
-        # Track metrics
-        if metrics_collector:
-            metrics_collector.record_search(
-                query_length=len(query),
-                results_count=total_found, 
-                response_time=(datetime.now() - start_time).total_seconds()
-            )
-        
-        return jsonify({
-            'status': 'success',
-            'data': results # Returns the modified results dict, which contains 'results' (sliced) and 'total' (true total)
+        # Track analytics and metrics in the background
+        _record_search_event({
+            'query': query,
+            'results_count': total_found,
+            'response_time': results['metadata'].get('response_time', 0),
+            'mode': results['metadata'].get('mode', 'unknown')
         })
+        
+        # Serialize the page once without the per-request timing metadata,
+        # hash that for a weak validator (so a client revisiting unchanged
+        # results gets an empty 304, GET only), then splice metadata back in
+        page = {k: v for k, v in results.items() if k != 'metadata'}
+        page_json = _dumps(page)
+        response = Response(b''.join((
+            _SUCCESS_PREFIX, page_json[:-1], b',"metadata":', _dumps(results['metadata']), b'}}'
+        )), mimetype='application/json')
+        response.set_etag(hashlib.blake2b(page_json, digest_size=8).hexdigest(), weak=True)
+        return response.make_conditional(request)
     
     except ValueError as e:
-        return jsonify({
+        return ojson({
             'error': f'Invalid parameter value: {str(e)}',
             'status': 'error'
         }), 400
     except Exception as e:
-        logger.error(f"Search error: {str(e)}", exc_info=True)
-        return jsonify({
+        logger.error("Search error: %s", e, exc_info=True)
+        return ojson({
             'status': 'error',
             'error': str(e),
             'query': query if 'query' in locals() else None
         }), 500
 
 
+# Typeahead sends a request per keystroke; suggestions for a prefix are
+# stable for minutes, so they are memoized and the memo dropped periodically.
+_SUGGESTIONS_CACHE_SECONDS = 600
+_suggestions_cache_expires = 0.0
+
+# When Google/SerpAPI have no suggestions (local mode, no keys), complete from
+# past searches. The trie is rebuilt from analytics whenever the memo expires.
+_SUGGESTION_TRIE_QUERIES = 50000
+_suggestion_trie = None
+
+
+def _get_suggestion_trie():
+    """Return the trie of logged queries, building it if needed (None without analytics)"""
+    global _suggestion_trie
+    
+    if _suggestion_trie is None:
+        store = get_analytics_store()
+        if store is None:
+            return None
+        popular = store.get_popular_queries(_SUGGESTION_TRIE_QUERIES)
+        _suggestion_trie = PrefixTrie((q['query'], q['count']) for q in popular)
+    return _suggestion_trie
+
+
+@lru_cache(maxsize=10000)
+def _trie_node(trie, prefix: str):
+    """
+    Trie node for a normalized prefix
+    
+    Memoized per prefix, so each keystroke walks one character on from the
+    node of the prefix typed before it instead of starting at the root.
+    """
+    if not prefix:
+        return trie.locate('')
+    if len(prefix) > MAX_TERM_LENGTH:
+        return None
+    parent = _trie_node(trie, prefix[:-1])
+    return None if parent is None else trie.locate(prefix[-1], parent)
+
+
+@lru_cache(maxsize=10000)
+def _cached_suggestions(manager, query: str, max_suggestions: int) -> tuple:
+    suggestions = manager.get_suggestions(query, max_suggestions)
+    if not suggestions:
+        trie = _get_suggestion_trie()
+        if trie is not None:
+            node = _trie_node(trie, ' '.join(query.split()))
+            suggestions = trie.complete_from(node, k=max_suggestions)
+    return tuple(suggestions)
+
+
+def _get_suggestions(manager, query: str, max_suggestions: int) -> list:
+    """Return suggestions for a normalized prefix, clearing the memo when it expires"""
+    global _suggestions_cache_expires, _suggestion_trie
+    
+    now = time.monotonic()
+    if now >= _suggestions_cache_expires:
+        _cached_suggestions.cache_clear()
+        _trie_node.cache_clear()
+        _suggestion_trie = None
+        _suggestions_cache_expires = now + _SUGGESTIONS_CACHE_SECONDS
+    
+    return list(_cached_suggestions(manager, query.lower(), max_suggestions))
+
+
 @app.route('/api/suggestions', methods=['GET'])
 def api_suggestions():
     """
@@ -535,33 +1218,26 @@ def api_suggestions():
     current_search_manager = get_search_manager()
     
     if current_search_manager is None:
-        return jsonify({
-            'status': 'error',
-            'error': 'Search service not available'
-        }), 503
+        return _ERR_SEARCH_UNAVAILABLE()
     
     try:
-        query = request.args.get('q', '').strip()
-        if not query:
-            return jsonify({
-                'status': 'error',
-                'error': 'Query parameter "q" is required'
-            }), 400
-        
-        max_suggestions = int(request.args.get('max', 10))
+        args, error = _parse_args(_SUGGESTIONS_ARGS, request.args)
+        if error:
+            return error
+        query, max_suggestions = args['q'], args['max']
         
         # Get suggestions from search manager
-        suggestions = current_search_manager.get_suggestions(query, max_suggestions)
+        suggestions = _get_suggestions(current_search_manager, query, max_suggestions)
         
-        return jsonify({
+        return ojson({
             'status': 'success',
             'query': query,
             'suggestions': suggestions
         })
     
     except Exception as e:
-        logger.error(f"Suggestions error: {str(e)}")
-        return jsonify({
+        logger.error("Suggestions error: %s", e)
+        return ojson({
             'status': 'error',
             'error': str(e)
         }), 500
@@ -579,33 +1255,37 @@ def api_search_news():
     Returns:
         JSON with news results
     """
+    serpapi_client = get_serpapi_client()
+    
     try:
-        query = request.args.get('q', '').strip()
-        if not query:
-            return jsonify({
-                'status': 'error',
-                'error': 'Query parameter "q" is required'
-            }), 400
+        # Several q parameters are fanned out concurrently
+        queries = [q.strip() for q in request.args.getlist('q') if q.strip()]
+        if not queries:
+            return _ERR_QUERY_REQUIRED()
+        query = queries[0]
         
-        max_results = int(request.args.get('max_results', 100))
+        try:
+            max_results = int(request.args.get('max_results', 100))
+        except ValueError:
+            return _int_param_error('max_results')
         
         if not serpapi_client:
-            return jsonify({
-                'status': 'error',
-                'error': 'News search requires SerpAPI to be enabled'
-            }), 503
+            return _ERR_NEWS_UNAVAILABLE()
+        
+        if len(queries) > 1:
+            return ojson({
+                'status': 'success',
+                'data': serpapi_client.search_many(queries, 'news', max_results)
+            })
         
         # Search news
-        results = serpapi_client.search_news(query, max_results)
+        _, results_json = _cached_news_json(query, max_results)
         
-        return jsonify({
-            'status': 'success',
-            'data': results
-        })
+        return _raw_success(results_json)
     
     except Exception as e:
-        logger.error(f"News search error: {str(e)}")
-        return jsonify({
+        logger.error("News search error: %s", e)
+        return ojson({
             'status': 'error',
             'error': str(e)
         }), 500
@@ -624,33 +1304,37 @@ def api_search_images():
     Returns:
         JSON with image results
     """
+    serpapi_client = get_serpapi_client()
+    
     try:
-        query = request.args.get('q', '').strip()
-        if not query:
-            return jsonify({
-                'status': 'error',
-                'error': 'Query parameter "q" is required'
-            }), 400
+        # Several q parameters are fanned out concurrently
+        queries = [q.strip() for q in request.args.getlist('q') if q.strip()]
+        if not queries:
+            return _ERR_QUERY_REQUIRED()
+        query = queries[0]
         
-        max_results = int(request.args.get('max_results', 20))
+        try:
+            max_results = int(request.args.get('max_results', 20))
+        except ValueError:
+            return _int_param_error('max_results')
         
         if not serpapi_client:
-            return jsonify({
-                'status': 'error',
-                'error': 'Image search requires SerpAPI to be enabled'
-            }), 503
+            return _ERR_IMAGES_UNAVAILABLE()
+        
+        if len(queries) > 1:
+            return ojson({
+                'status': 'success',
+                'data': serpapi_client.search_many(queries, 'images', max_results)
+            })
         
         # Search images
-        results = serpapi_client.search_images(query, max_results)
+        _, results_json = _cached_images_json(query, max_results)
         
-        return jsonify({
-            'status': 'success',
-            'data': results
-        })
+        return _raw_success(results_json)
     
     except Exception as e:
-        logger.error(f"Image search error: {str(e)}")
-        return jsonify({
+        logger.error("Image search error: %s", e)
+        return ojson({
             'status': 'error',
             'error': str(e)
         }), 500
@@ -670,36 +1354,32 @@ def api_set_search_mode():
     current_search_manager = get_search_manager()
     
     if current_search_manager is None:
-        return jsonify({
-            'status': 'error',
-            'error': 'Search service not available'
-        }), 503
+        return _ERR_SEARCH_UNAVAILABLE()
+    
+    # A missing, malformed or non-string body is a 400 checked up front, not
+    # an exception for the handler below to turn into a 500
+    data = request.get_json(silent=True)
+    mode = data.get('mode') if isinstance(data, dict) else None
+    if not isinstance(mode, str) or not mode.strip():
+        return _ERR_MODE_REQUIRED()
+    mode = mode.strip().lower()
     
     try:
-        data = request.get_json() or {}
-        mode = data.get('mode', '').lower()
-        
-        if not mode:
-            return jsonify({
-                'status': 'error',
-                'error': 'Mode parameter is required'
-            }), 400
-        
         if current_search_manager.set_mode(mode):
-            return jsonify({
+            return ojson({
                 'status': 'success',
                 'mode': mode,
                 'message': f'Search mode changed to {mode}'
             })
         else:
-            return jsonify({
+            return ojson({
                 'status': 'error',
                 'error': f'Invalid mode: {mode}. Must be local, serpapi, or hybrid'
             }), 400
     
     except Exception as e:
-        logger.error(f"Mode change error: {str(e)}")
-        return jsonify({
+        logger.error("Mode change error: %s", e)
+        return ojson({
             'status': 'error',
             'error': str(e)
         }), 500
@@ -709,6 +1389,41 @@ def api_set_search_mode():
 # ROUTES - Crawling
 # ============================================================================
 
+# Crawls run on a small background pool; the request only enqueues the job.
+# Spider keeps per-crawl counters on the instance, hence CRAWLER_MAX_JOBS
+# (default 1) rather than the per-crawl fetch concurrency.
+_MAX_TRACKED_CRAWL_JOBS = 1000
+_ERR_CRAWLER_UNAVAILABLE = _canned_error('Crawler not initialized', 503)
+_ERR_URLS_REQUIRED = _canned_error('URLs list is required', 400)
+_ERR_URLS_NOT_LIST = _canned_error('URLs must be a list', 400)
+_ERR_UNKNOWN_CRAWL_JOB = _canned_error('Unknown crawl job', 404)
+_crawl_pool = None
+_crawl_jobs = OrderedDict()
+
+
+def _submit_crawl(crawler, urls, max_depth: int) -> str:
+    """Run crawler.crawl in the background and return the job id"""
+    global _crawl_pool
+    
+    with _init_lock:
+        if _crawl_pool is None:
+            _crawl_pool = ThreadPoolExecutor(
+                max_workers=Config.CRAWLER_MAX_JOBS, thread_name_prefix='crawl'
+            )
+        
+        job_id = uuid.uuid4().hex
+        _crawl_jobs[job_id] = _crawl_pool.submit(crawler.crawl, urls, max_depth=max_depth)
+        
+        # Forget the oldest finished jobs once the table is full
+        while len(_crawl_jobs) > _MAX_TRACKED_CRAWL_JOBS:
+            oldest_id, oldest = next(iter(_crawl_jobs.items()))
+            if not oldest.done():
+                break
+            del _crawl_jobs[oldest_id]
+    
+    return job_id
+
+
 @app.route('/api/crawl', methods=['POST'])
 def api_crawl():
     """
@@ -719,48 +1434,123 @@ def api_crawl():
         max_depth (int): Maximum crawl depth (default: 1)
     
     Returns:
-        JSON with crawl status
+        202 with the job id; poll /api/crawl/<job_id> (the Location
+        header) for the result
     """
     try:
         current_spider = get_spider()
         
         if not current_spider:
-            return jsonify({
-                'status': 'error',
-                'error': 'Crawler not initialized'
-            }), 503
+            return _ERR_CRAWLER_UNAVAILABLE()
         
         data = request.get_json() or {}
         urls = data.get('urls', [])
-        max_depth = int(data.get('max_depth', 1))
         
         if not urls:
-            return jsonify({
+            return _ERR_URLS_REQUIRED()
+        
+        if not isinstance(urls, list):
+            return _ERR_URLS_NOT_LIST()
+        
+        if len(urls) > Config.CRAWLER_MAX_URLS_PER_REQUEST:
+            return ojson({
                 'status': 'error',
-                'error': 'URLs list is required'
-            }), 400
+                'error': f'At most {Config.CRAWLER_MAX_URLS_PER_REQUEST} URLs per request'
+            }), 413
+        
+        try:
+            max_depth = min(int(data.get('max_depth', 1)), Config.CRAWLER_MAX_DEPTH)
+        except (TypeError, ValueError):
+            return _int_param_error('max_depth')
         
-        # Start crawling
-        results = current_spider.crawl(urls, max_depth=max_depth)
+        # Start crawling in the background
+        job_id = _submit_crawl(current_spider, urls, max_depth)
         
-        return jsonify({
-            'status': 'success',
-            'message': f'Crawled {len(results)} pages',
-            'data': results
-        })
+        return ojson({
+            'status': 'accepted',
+            'job_id': job_id
+        }), 202, {'Location': url_for('api_crawl_status', job_id=job_id)}
     
+    except HTTPException:
+        # e.g. 413 from MAX_CONTENT_LENGTH while reading the body
+        raise
     except Exception as e:
-        logger.error(f"Crawl error: {str(e)}")
-        return jsonify({
+        logger.error("Crawl error: %s", e)
+        return ojson({
             'status': 'error',
             'error': str(e)
         }), 500
 
 
+@app.route('/api/crawl/<job_id>', methods=['GET'])
+def api_crawl_status(job_id):
+    """
+    Get the state of a crawl job
+    
+    Returns:
+        JSON with the job state and, once finished, its result or error
+    """
+    future = _crawl_jobs.get(job_id)
+    if future is None:
+        return _ERR_UNKNOWN_CRAWL_JOB()
+    
+    job = {'job_id': job_id, 'state': 'running' if future.running() else 'pending'}
+    if future.done():
+        error = future.exception()
+        if error is not None:
+            job['state'] = 'failed'
+            job['error'] = str(error)
+        else:
+            results = future.result()
+            job['state'] = 'done'
+            job['message'] = f'Crawled {len(results)} pages'
+            job['data'] = results
+    
+    return ojson({
+        'status': 'success',
+        'data': job
+    })
+
+
 # ============================================================================
 # ROUTES - Analytics & Statistics
 # ============================================================================
 
+# Health checkers and Prometheus poll the stats routes every few seconds;
+# they all share one snapshot of the component counters for this long.
+_STATS_TTL_SECONDS = 1.0
+_stats_snapshot = ((), 0.0, {})
+
+
+def _get_all_stats() -> dict:
+    """
+    Return get_stats() of the built search manager, SerpAPI client and cache
+    
+    The snapshot is reused for _STATS_TTL_SECONDS as long as the same
+    component instances are installed.
+    """
+    global _stats_snapshot
+    
+    components = (
+        _peek('search_manager'),
+        _peek('serpapi_client'),
+        _peek('cache_manager'),
+    )
+    now = time.monotonic()
+    cached_components, expires, stats = _stats_snapshot
+    if now < expires and all(a is b for a, b in zip(cached_components, components)):
+        return stats
+    
+    current_search_manager, serpapi_client, cache_manager = components
+    stats = {
+        'search_manager': current_search_manager.get_stats() if current_search_manager else {},
+        'serpapi': serpapi_client.get_stats() if serpapi_client else {},
+        'cache': cache_manager.get_stats() if cache_manager else {}
+    }
+    _stats_snapshot = (components, now + _STATS_TTL_SECONDS, stats)
+    return stats
+
+
 @app.route('/api/analytics', methods=['GET'])
 def api_analytics():
     """
@@ -769,28 +1559,24 @@ def api_analytics():
     Returns:
         JSON with analytics data
     """
+    analytics_store = _peek('analytics_store')
+    
     try:
-        current_search_manager = get_search_manager()
-        
-        analytics = {
-            'search_manager': current_search_manager.get_stats() if current_search_manager else {},
-            'serpapi': serpapi_client.get_stats() if serpapi_client else {},
-            'cache': cache_manager.get_stats() if cache_manager else {}
-        }
+        analytics = dict(_get_all_stats())
         
         # Add analytics store data if available
         if analytics_store:
             analytics['queries'] = analytics_store.get_popular_queries(limit=10)
             analytics['recent'] = analytics_store.get_recent_searches(limit=20)
         
-        return jsonify({
+        return ojson({
             'status': 'success',
             'data': analytics
         })
     
     except Exception as e:
-        logger.error(f"Analytics error: {str(e)}")
-        return jsonify({
+        logger.error("Analytics error: %s", e)
+        return ojson({
             'status': 'error',
             'error': str(e)
         }), 500
@@ -804,8 +1590,15 @@ def api_stats():
     Returns:
         JSON with system stats
     """
+    serpapi_client = _peek('serpapi_client')
+    google_client = _peek('google_client')
+    cache_manager = _peek('cache_manager')
+    analytics_store = _peek('analytics_store')
+    marketplace_client = _peek('marketplace_client')
+    job_search_client = _peek('job_search_client')
+    
     try:
-        current_search_manager = get_search_manager()
+        current_search_manager = _peek('search_manager')
         
         stats = {
             'search_mode': current_search_manager.mode if current_search_manager else 'unknown',
@@ -816,26 +1609,26 @@ def api_stats():
                 'search_manager': current_search_manager is not None,
                 'serpapi_client': serpapi_client is not None,
                 'google_client': google_client is not None,
-                'local_ranker': get_ranker() is not None,
+                'local_ranker': _peek('local_ranker') is not None,
                 'cache_manager': cache_manager is not None,
                 'analytics_store': analytics_store is not None,
-                'spider': get_spider() is not None,
+                'spider': _peek('spider') is not None,
                 'marketplace_client': marketplace_client is not None,
                 'job_search_client': job_search_client is not None
             }
         }
         
         if current_search_manager:
-            stats['search_stats'] = current_search_manager.get_stats()
+            stats['search_stats'] = _get_all_stats()['search_manager']
         
-        return jsonify({
+        return ojson({
             'status': 'success',
             'data': stats
         })
     
     except Exception as e:
-        logger.error(f"Stats error: {str(e)}")
-        return jsonify({
+        logger.error("Stats error: %s", e)
+        return ojson({
             'status': 'error',
             'error': str(e)
         }), 500
@@ -845,6 +1638,26 @@ def api_stats():
 # ROUTES - Health & Monitoring
 # ============================================================================
 
+# The upstream probes run side by side and share one deadline, so a hung API
+# can't hold /health past a load balancer's probe timeout. Each client's probe
+# is itself bounded by the same timeout, and a probe still running is waited
+# on again rather than joined by another, so slow probes can't pile up.
+_HEALTH_PROBE_TIMEOUT = 2.0
+_health_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='health')
+_health_probes = {}  # name -> (client, future of its latest probe)
+_health_probes_lock = threading.Lock()
+
+
+def _health_probe(name: str, client):
+    """Return the client's running probe, or start a new one"""
+    with _health_probes_lock:
+        probe = _health_probes.get(name)
+        if probe is None or probe[0] is not client or probe[1].done():
+            future = _health_pool.submit(client.health_check, timeout=_HEALTH_PROBE_TIMEOUT)
+            probe = _health_probes[name] = (client, future)
+        return probe[1]
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """
@@ -853,35 +1666,46 @@ def health_check():
     Returns:
         JSON with health status
     """
+    cache_manager = _peek('cache_manager')
+    serpapi_client = _peek('serpapi_client')
+    google_client = _peek('google_client')
+    
     try:
         health = {
             'status': 'healthy',
             'timestamp': datetime.now().isoformat(),
+            # Components built on first use count as up while unbuilt, so a
+            # fresh worker isn't reported down before any request needs them
             'components': {
-                'local_ranker': get_ranker() is not None,
-                'cache_manager': cache_manager is not None,
-                'spider': get_spider() is not None,
+                'local_ranker': _peek('local_ranker') is not None,
+                'cache_manager': _lazy_available('cache_manager', Config.CACHE_ENABLED),
+                'spider': _peek('spider') is not None,
                 'serpapi': serpapi_client is not None,
                 'google_search': google_client is not None,
-                'marketplace': marketplace_client is not None,
-                'job_search': job_search_client is not None
+                'marketplace': _lazy_available('marketplace_client', Config.MARKETPLACE_ENABLED),
+                'job_search': _lazy_available('job_search_client', Config.JOBS_ENABLED)
             }
         }
         
-        # Check SerpAPI
-        if serpapi_client:
-            health['components']['serpapi'] = serpapi_client.health_check()
-        
-        # Check Google Search
-        if google_client:
-            health['components']['google'] = google_client.health_check()
+        # Probe SerpAPI and Google Search concurrently; late probes count as down
+        probes = {
+            name: _health_probe(name, client)
+            for name, client in (('serpapi', serpapi_client), ('google', google_client))
+            if client
+        }
+        if probes:
+            wait(probes.values(), timeout=_HEALTH_PROBE_TIMEOUT)
+        for name, probe in probes.items():
+            health['components'][name] = (
+                probe.done() and probe.exception() is None and probe.result()
+            )
         
         # Check cache
         if cache_manager:
             health['components']['cache'] = True
         
         # Check search manager
-        current_search_manager = get_search_manager()
+        current_search_manager = _peek('search_manager')
         if current_search_manager:
             health['components']['search_manager'] = True
         
@@ -891,16 +1715,66 @@ def health_check():
         
         status_code = 200 if all_healthy else 503
         
-        return jsonify(health), status_code
+        return ojson(health), status_code
     
     except Exception as e:
-        logger.error(f"Health check error: {str(e)}")
-        return jsonify({
+        logger.error("Health check error: %s", e)
+        return ojson({
             'status': 'unhealthy',
             'error': str(e)
         }), 500
 
 
+# Prometheus text exposition, rendered with one %-format per source
+_SEARCH_METRICS_TMPL = (
+    'search_total_searches %(total_searches)s\n'
+    'search_cache_hits %(cache_hits)s\n'
+    'search_avg_response_time %(avg_response_time)s'
+)
+_SEARCH_METRICS_DEFAULTS = {'total_searches': 0, 'cache_hits': 0, 'avg_response_time': 0}
+
+_SERPAPI_METRICS_TMPL = (
+    'serpapi_total_requests %(total_requests)s\n'
+    'serpapi_successful_requests %(successful_requests)s\n'
+    'serpapi_failed_requests %(failed_requests)s'
+)
+_SERPAPI_METRICS_DEFAULTS = {'total_requests': 0, 'successful_requests': 0, 'failed_requests': 0}
+
+# (component, stats section, ((metric name, stats key, help), ...)) for
+# prometheus_client; names match the plain-text fallback above
+_PROMETHEUS_METRICS = (
+    ('search_manager', 'search_manager', (
+        ('search_total_searches', 'total_searches', 'Searches handled by the search manager'),
+        ('search_cache_hits', 'cache_hits', 'Searches answered from the result cache'),
+        ('search_avg_response_time', 'avg_response_time', 'Mean search response time in seconds'),
+    )),
+    ('serpapi_client', 'serpapi', (
+        ('serpapi_total_requests', 'total_requests', 'Requests sent to SerpAPI'),
+        ('serpapi_successful_requests', 'successful_requests', 'SerpAPI requests that succeeded'),
+        ('serpapi_failed_requests', 'failed_requests', 'SerpAPI requests that failed'),
+    )),
+)
+
+
+class _ComponentStatsCollector:
+    """prometheus_client collector reading the component stats at scrape time"""
+    
+    def collect(self):
+        stats = _get_all_stats()
+        for component, section, metrics in _PROMETHEUS_METRICS:
+            if _peek(component) is None:
+                continue
+            for name, key, help_text in metrics:
+                yield GaugeMetricFamily(name, help_text, value=stats[section].get(key) or 0)
+
+
+if CollectorRegistry is not None:
+    _METRICS_REGISTRY = CollectorRegistry(auto_describe=False)
+    _METRICS_REGISTRY.register(_ComponentStatsCollector())
+else:
+    _METRICS_REGISTRY = None
+
+
 @app.route('/api/metrics', methods=['GET'])
 def api_metrics():
     """
@@ -909,28 +1783,32 @@ def api_metrics():
     Returns:
         Plain text metrics
     """
+    serpapi_client = _peek('serpapi_client')
+    
     try:
+        if _METRICS_REGISTRY is not None:
+            return generate_latest(_METRICS_REGISTRY), 200, {'Content-Type': CONTENT_TYPE_LATEST}
+        
         metrics = []
-        current_search_manager = get_search_manager()
+        current_search_manager = _peek('search_manager')
+        component_stats = _get_all_stats()
         
         # Search metrics
         if current_search_manager:
-            stats = current_search_manager.get_stats()
-            metrics.append(f'search_total_searches {stats.get("total_searches", 0)}')
-            metrics.append(f'search_cache_hits {stats.get("cache_hits", 0)}')
-            metrics.append(f'search_avg_response_time {stats.get("avg_response_time", 0)}')
+            metrics.append(_SEARCH_METRICS_TMPL % {
+                **_SEARCH_METRICS_DEFAULTS, **component_stats['search_manager']
+            })
         
         # SerpAPI metrics
         if serpapi_client:
-            stats = serpapi_client.get_stats()
-            metrics.append(f'serpapi_total_requests {stats.get("total_requests", 0)}')
-            metrics.append(f'serpapi_successful_requests {stats.get("successful_requests", 0)}')
-            metrics.append(f'serpapi_failed_requests {stats.get("failed_requests", 0)}')
+            metrics.append(_SERPAPI_METRICS_TMPL % {
+                **_SERPAPI_METRICS_DEFAULTS, **component_stats['serpapi']
+            })
         
         return '\n'.join(metrics), 200, {'Content-Type': 'text/plain'}
     
     except Exception as e:
-        logger.error(f"Metrics error: {str(e)}")
+        logger.error("Metrics error: %s", e)
         return str(e), 500
 
 
@@ -938,26 +1816,28 @@ def api_metrics():
 # ROUTES - Cache Management
 # ============================================================================
 
+_ERR_CACHE_DISABLED = _canned_error('Cache not enabled', 503)
+
+
 @app.route('/api/cache/stats', methods=['GET'])
 def api_cache_stats():
     """Get cache statistics"""
+    cache_manager = get_cache_manager()
+    
     try:
         if not cache_manager:
-            return jsonify({
-                'status': 'error',
-                'error': 'Cache not enabled'
-            }), 503
+            return _ERR_CACHE_DISABLED()
         
         stats = cache_manager.get_stats()
         
-        return jsonify({
+        return ojson({
             'status': 'success',
             'data': stats
         })
     
     except Exception as e:
-        logger.error(f"Cache stats error: {str(e)}")
-        return jsonify({
+        logger.error("Cache stats error: %s", e)
+        return ojson({
             'status': 'error',
             'error': str(e)
         }), 500
@@ -966,352 +1846,396 @@ def api_cache_stats():
 @app.route('/api/cache/clear', methods=['POST'])
 def api_cache_clear():
     """Clear cache"""
+    cache_manager = get_cache_manager()
+    
     try:
         if not cache_manager:
-            return jsonify({
-                'status': 'error',
-                'error': 'Cache not enabled'
-            }), 503
+            return _ERR_CACHE_DISABLED()
         
         cache_manager.clear()
         
-        return jsonify({
+        return ojson({
             'status': 'success',
             'message': 'Cache cleared successfully'
         })
     
     except Exception as e:
-        logger.error(f"Cache clear error: {str(e)}")
-        return jsonify({
+        logger.error("Cache clear error: %s", e)
+        return ojson({
             'status': 'error',
             'error': str(e)
         }), 500
 
 
-# ============================================================================
-# ROUTES - Marketplace
-# ============================================================================
-
-@app.route('/api/marketplace/search', methods=['GET', 'POST'])
-def api_marketplace_search():
-    """Search across multiple marketplaces"""
+@app.route('/api/cache/invalidate', methods=['POST'])
+def api_cache_invalidate():
+    """
+    Drop the cached responses of one endpoint
+    
+    JSON Body:
+        namespace (str): One of search, news, images, jobs, marketplace
+    """
+    cache_manager = get_cache_manager()
+    
     try:
-        if not marketplace_client:
-            return jsonify({
-                'status': 'error',
-                'error': 'Marketplace search not available'
-            }), 503
-        
-        if request.method == 'POST':
-            data = request.get_json() or {}
-        else:
-            data = request.args.to_dict()
+        if not cache_manager:
+            return _ERR_CACHE_DISABLED()
         
-        query = data.get('q', '').strip()
-        if not query:
-            return jsonify({
+        data = request.get_json() or {}
+        namespace = data.get('namespace')
+        if namespace not in _CACHE_NAMESPACES:
+            return ojson({
                 'status': 'error',
-                'error': 'Query parameter "q" is required'
+                'error': f'namespace must be one of: {", ".join(_CACHE_NAMESPACES)}'
             }), 400
         
-        max_results = int(data.get('max_results', 30))
-        marketplaces = data.get('marketplaces', '').split(',') if data.get('marketplaces') else None
-        min_price = float(data['min_price']) if data.get('min_price') else None
-        max_price = float(data['max_price']) if data.get('max_price') else None
-        sort_by = data.get('sort_by', 'relevance')
-        
-        results = marketplace_client.search_all(
-            query=query,
-            max_results=max_results,
-            marketplaces=marketplaces,
-            min_price=min_price,
-            max_price=max_price,
-            sort_by=sort_by
+        removed = sum(
+            cache_manager.invalidate_namespace(name) for name in _CACHE_NAMESPACES[namespace]
         )
         
-        return jsonify({
+        return ojson({
             'status': 'success',
-            'data': results
+            'message': f'Invalidated {removed} cached {namespace} responses'
         })
     
     except Exception as e:
-        logger.error(f"Marketplace search error: {str(e)}")
-        return jsonify({
+        logger.error("Cache invalidate error: %s", e)
+        return ojson({
             'status': 'error',
             'error': str(e)
         }), 500
 
 
+# ============================================================================
+# ROUTES - Marketplace
+# ============================================================================
+
+# Fixed error responses of the marketplace, alert and job routes. Anything
+# these routes raise is logged and turned into a 500 by handle_exception.
+_ERR_MARKETPLACE_UNAVAILABLE = _canned_error('Marketplace search not available', 503)
+_ERR_COMPARE_UNAVAILABLE = _canned_error('Product comparison not available', 503)
+_ERR_PRODUCT_IDS_REQUIRED = _canned_error('product_ids array is required', 400)
+_MAX_COMPARE_PRODUCTS = 50
+_ERR_TOO_MANY_PRODUCTS = _canned_error(
+    f'Too many products (max {_MAX_COMPARE_PRODUCTS})', 400
+)
+_ERR_PRICE_ALERTS_UNAVAILABLE = _canned_error('Price alerts not available', 503)
+_ERR_EMAIL_REQUIRED = _canned_error('Email parameter is required', 400)
+_ERR_ALERT_NOT_FOUND = _canned_error('Alert not found', 404)
+_ERR_TARGET_PRICE_INVALID = _canned_error('target_price must be a number', 400)
+_ERR_JOBS_UNAVAILABLE = _canned_error('Job search not available', 503)
+_ERR_JOB_ALERTS_UNAVAILABLE = _canned_error('Job alerts not available', 503)
+
+
+@app.route('/api/marketplace/search', methods=['GET'])
+def api_marketplace_search():
+    """Search across multiple marketplaces"""
+    return _marketplace_search(request.args)
+
+
+@app.route('/api/marketplace/search', methods=['POST'])
+def api_marketplace_search_post():
+    """Search across multiple marketplaces (JSON body)"""
+    return _marketplace_search(request.get_json(silent=True) or {})
+
+
+def _marketplace_search(data):
+    marketplace_client = get_marketplace_client()
+    
+    if not marketplace_client:
+        return _ERR_MARKETPLACE_UNAVAILABLE()
+    
+    args, error = _parse_args(_MARKETPLACE_SEARCH_ARGS, data)
+    if error:
+        return error
+    
+    run_async = args.pop('async')
+    stream = args.pop('stream')
+    search_kwargs = {'query': args.pop('q'), **args}
+    if run_async:
+        return _enqueue_task('search_marketplaces_task', search_kwargs)
+    if stream:
+        return _stream_marketplace_search(marketplace_client, search_kwargs)
+    
+    results = _cached_marketplace_search(**search_kwargs)
+    
+    return ojson({
+        'status': 'success',
+        'data': results
+    })
+
+
+def _stream_marketplace_search(marketplace_client, search_kwargs: dict) -> Response:
+    """
+    Send marketplace results as NDJSON, one line per marketplace as it answers
+    
+    Streamed searches bypass the result cache; the first line goes out as
+    soon as the fastest marketplace responds.
+    """
+    def generate():
+        for chunk in marketplace_client.search_stream(**search_kwargs):
+            yield _dumps(chunk) + b'\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
 @app.route('/api/marketplace/compare', methods=['POST'])
 def api_marketplace_compare():
     """Compare multiple products"""
-    try:
-        if not marketplace_client:
-            return jsonify({
-                'status': 'error',
-                'error': 'Product comparison not available'
-            }), 503
-        
-        data = request.get_json() or {}
-        product_ids = data.get('product_ids', [])
-        
-        if not product_ids:
-            return jsonify({
-                'status': 'error',
-                'error': 'product_ids array is required'
-            }), 400
-        
-        comparison = marketplace_client.compare_products(product_ids)
-        
-        return jsonify({
-            'status': 'success',
-            'data': comparison
-        })
+    marketplace_client = get_marketplace_client()
     
-    except Exception as e:
-        logger.error(f"Product comparison error: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 500
+    if not marketplace_client:
+        return _ERR_COMPARE_UNAVAILABLE()
+    
+    data = request.get_json() or {}
+    product_ids = data.get('product_ids', [])
+    
+    if not product_ids:
+        return _ERR_PRODUCT_IDS_REQUIRED()
+    
+    if len(product_ids) > _MAX_COMPARE_PRODUCTS:
+        return _ERR_TOO_MANY_PRODUCTS()
+    
+    if _wants_async(data):
+        return _enqueue_task('compare_products_task', {'product_ids': product_ids})
+    
+    comparison = marketplace_client.compare_products(product_ids)
+    
+    return ojson({
+        'status': 'success',
+        'data': comparison
+    })
 
 
-@app.route('/api/alerts', methods=['GET', 'POST'])
+@app.route('/api/alerts', methods=['GET'])
 def api_price_alerts():
-    """Get or create price alerts"""
-    try:
-        if not price_alert_manager:
-            return jsonify({
-                'status': 'error',
-                'error': 'Price alerts not available'
-            }), 503
-        
-        if request.method == 'GET':
-            email = request.args.get('email')
-            if not email:
-                return jsonify({
-                    'status': 'error',
-                    'error': 'Email parameter is required'
-                }), 400
-            
-            alerts = price_alert_manager.get_user_alerts(email)
-            return jsonify({
-                'status': 'success',
-                'data': [asdict(a) for a in alerts]
-            })
-        
-        else:  # POST
-            data = request.get_json() or {}
-            required = ['email', 'product_name', 'product_url', 'marketplace', 'target_price', 'current_price']
-            
-            for field in required:
-                if field not in data:
-                    return jsonify({
-                        'status': 'error',
-                        'error': f'Missing required field: {field}'
-                    }), 400
-            
-            alert_id = price_alert_manager.create_alert(
-                user_email=data['email'],
-                product_name=data['product_name'],
-                product_url=data['product_url'],
-                marketplace=data['marketplace'],
-                target_price=float(data['target_price']),
-                current_price=float(data['current_price'])
-            )
-            
-            return jsonify({
-                'status': 'success',
-                'alert_id': alert_id,
-                'message': 'Price alert created successfully'
-            })
+    """Get a user's price alerts"""
+    price_alert_manager = get_price_alert_manager()
     
-    except Exception as e:
-        logger.error(f"Price alert error: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 500
+    if not price_alert_manager:
+        return _ERR_PRICE_ALERTS_UNAVAILABLE()
+    
+    email = request.args.get('email')
+    if not email:
+        return _ERR_EMAIL_REQUIRED()
+    
+    alerts = price_alert_manager.get_user_alerts(email)
+    return ojson({
+        'status': 'success',
+        'data': [a.to_dict() for a in alerts]
+    })
+
+
+@app.route('/api/alerts', methods=['POST'])
+def api_price_alerts_create():
+    """Create a price alert"""
+    price_alert_manager = get_price_alert_manager()
+    
+    if not price_alert_manager:
+        return _ERR_PRICE_ALERTS_UNAVAILABLE()
+    
+    args, error = _parse_args(_PRICE_ALERT_ARGS, request.get_json(silent=True) or {})
+    if error:
+        return error
+    
+    alert_id = price_alert_manager.create_alert(
+        user_email=args.pop('email'),
+        **args
+    )
+    
+    return ojson({
+        'status': 'success',
+        'alert_id': alert_id,
+        'message': 'Price alert created successfully'
+    })
 
 
 @app.route('/api/alerts/<alert_id>', methods=['GET', 'PUT', 'DELETE'])
 def api_price_alert_detail(alert_id):
     """Get, update, or delete a specific alert"""
-    try:
-        if not price_alert_manager:
-            return jsonify({
-                'status': 'error',
-                'error': 'Price alerts not available'
-            }), 503
+    price_alert_manager = get_price_alert_manager()
+    
+    if not price_alert_manager:
+        return _ERR_PRICE_ALERTS_UNAVAILABLE()
+    
+    if request.method == 'GET':
+        alert = price_alert_manager.get_alert(alert_id)
+        if not alert:
+            return _ERR_ALERT_NOT_FOUND()
         
-        if request.method == 'GET':
-            alert = price_alert_manager.get_alert(alert_id)
-            if not alert:
-                return jsonify({
-                    'status': 'error',
-                    'error': 'Alert not found'
-                }), 404
-            
-            return jsonify({
+        return ojson({
+            'status': 'success',
+            'data': alert.to_dict()
+        })
+    
+    elif request.method == 'PUT':
+        data = request.get_json() or {}
+        try:
+            target_price = float(data.get('target_price'))
+        except (TypeError, ValueError):
+            return _ERR_TARGET_PRICE_INVALID()
+        
+        if price_alert_manager.update_alert(alert_id, target_price):
+            return ojson({
                 'status': 'success',
-                'data': asdict(alert)
+                'message': 'Alert updated'
             })
-        
-        elif request.method == 'PUT':
-            data = request.get_json() or {}
-            target_price = float(data.get('target_price'))
-            
-            if price_alert_manager.update_alert(alert_id, target_price):
-                return jsonify({
-                    'status': 'success',
-                    'message': 'Alert updated'
-                })
-            else:
-                return jsonify({
-                    'status': 'error',
-                    'error': 'Alert not found'
-                }), 404
-        
-        else:  # DELETE
-            if price_alert_manager.delete_alert(alert_id):
-                return jsonify({
-                    'status': 'success',
-                    'message': 'Alert deleted'
-                })
-            else:
-                return jsonify({
-                    'status': 'error',
-                    'error': 'Alert not found'
-                }), 404
+        else:
+            return _ERR_ALERT_NOT_FOUND()
     
-    except Exception as e:
-        logger.error(f"Price alert detail error: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 500
+    else:  # DELETE
+        if price_alert_manager.delete_alert(alert_id):
+            return ojson({
+                'status': 'success',
+                'message': 'Alert deleted'
+            })
+        else:
+            return _ERR_ALERT_NOT_FOUND()
 
 
 # ============================================================================
 # ROUTES - Job Search
 # ============================================================================
 
-@app.route('/api/jobs/search', methods=['GET', 'POST'])
+@app.route('/api/jobs/search', methods=['GET'])
 def api_job_search():
     """Search for jobs"""
-    try:
-        if not job_search_client:
-            return jsonify({
-                'status': 'error',
-                'error': 'Job search not available'
-            }), 503
-        
-        if request.method == 'POST':
-            data = request.get_json() or {}
-        else:
-            data = request.args.to_dict()
-        
-        query = data.get('q', '').strip()
-        if not query:
-            return jsonify({
-                'status': 'error',
-                'error': 'Query parameter "q" is required'
-            }), 400
-        
-        # Parse boolean/typed parameters robustly (accept JSON booleans or strings)
-        raw_remote = data.get('remote_only', False)
-        if isinstance(raw_remote, str):
-            remote_only = raw_remote.lower() == 'true'
-        else:
-            remote_only = bool(raw_remote)
+    return _job_search(request.args)
 
-        min_salary = int(data['min_salary']) if data.get('min_salary') else None
 
-        # sources may be provided as a comma-separated string (GET) or a list (POST)
-        raw_sources = data.get('sources')
-        if isinstance(raw_sources, str):
-            sources = [s.strip() for s in raw_sources.split(',') if s.strip()]
-        elif isinstance(raw_sources, list):
-            sources = raw_sources
-        else:
-            sources = None
+@app.route('/api/jobs/search', methods=['POST'])
+def api_job_search_post():
+    """Search for jobs (JSON body)"""
+    return _job_search(request.get_json(silent=True) or {})
 
-        results = job_search_client.search_jobs(
-            query=query,
-            location=data.get('location', ''),
-            max_results=int(data.get('max_results', 20)),
-            remote_only=remote_only,
-            min_salary=min_salary,
-            experience_level=data.get('experience_level'),
-            job_type=data.get('job_type'),
-            sources=sources
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'data': results
-        })
+
+def _job_search(data):
+    job_search_client = get_job_search_client()
     
-    except Exception as e:
-        logger.error(f"Job search error: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 500
+    if not job_search_client:
+        return _ERR_JOBS_UNAVAILABLE()
+    
+    args, error = _parse_args(_JOB_SEARCH_ARGS, data)
+    if error:
+        return error
+    
+    run_async = args.pop('async')
+    search_kwargs = {'query': args.pop('q'), **args}
+    if run_async:
+        return _enqueue_task('search_jobs_task', search_kwargs)
+    
+    results = _cached_job_search(**search_kwargs)
+    
+    return ojson({
+        'status': 'success',
+        'data': results
+    })
 
 
-@app.route('/api/jobs/alerts', methods=['GET', 'POST'])
+@app.route('/api/jobs/alerts', methods=['GET'])
 def api_job_alerts():
-    """Get or create job alerts"""
+    """Get a user's job alerts"""
+    job_alert_manager = get_job_alert_manager()
+    
+    if not job_alert_manager:
+        return _ERR_JOB_ALERTS_UNAVAILABLE()
+    
+    email = request.args.get('email')
+    if not email:
+        return _ERR_EMAIL_REQUIRED()
+    
+    alerts = job_alert_manager.get_user_alerts(email)
+    return ojson({
+        'status': 'success',
+        'data': alerts
+    })
+
+
+@app.route('/api/jobs/alerts', methods=['POST'])
+def api_job_alerts_create():
+    """Create a job alert"""
+    job_alert_manager = get_job_alert_manager()
+    
+    if not job_alert_manager:
+        return _ERR_JOB_ALERTS_UNAVAILABLE()
+    
+    args, error = _parse_args(_JOB_ALERT_ARGS, request.get_json(silent=True) or {})
+    if error:
+        return error
+    
+    alert_id = job_alert_manager.create_alert(
+        user_email=args.pop('email'),
+        **args
+    )
+    
+    return ojson({
+        'status': 'success',
+        'alert_id': alert_id,
+        'message': 'Job alert created successfully'
+    })
+
+
+# ============================================================================
+# ROUTES - Background Tasks
+# ============================================================================
+
+# Job and marketplace searches sent with async=true run on the Celery
+# workers (see celery_app.py) instead of holding a web worker for seconds.
+_ERR_TASK_QUEUE_UNAVAILABLE = _canned_error('Task queue not available', 503)
+
+
+def _wants_async(data) -> bool:
+    return _as_bool(data.get('async', False))
+
+
+def _enqueue_task(task_name: str, kwargs: dict):
+    """
+    Queue a celery_app task and return the 202 response pointing at it
+    
+    Args:
+        task_name: Name of the task function in celery_app
+        kwargs: Keyword arguments for the task
+    """
+    import celery_app
+    
     try:
-        if not job_alert_manager:
-            return jsonify({
-                'status': 'error',
-                'error': 'Job alerts not available'
-            }), 503
+        task = getattr(celery_app, task_name).apply_async(kwargs=kwargs)
+    except Exception as e:
+        logger.error("Could not queue %s: %s", task_name, e)
+        return _ERR_TASK_QUEUE_UNAVAILABLE()
+    
+    return ojson({
+        'status': 'accepted',
+        'task_id': task.id
+    }), 202
+
+
+@app.route('/api/tasks/<task_id>', methods=['GET'])
+def api_task_status(task_id):
+    """
+    Get the state of a background task
+    
+    Returns:
+        JSON with the Celery task state and, once finished, its result or error
+    """
+    try:
+        from celery_app import celery
         
-        if request.method == 'GET':
-            email = request.args.get('email')
-            if not email:
-                return jsonify({
-                    'status': 'error',
-                    'error': 'Email parameter is required'
-                }), 400
-            
-            alerts = job_alert_manager.get_user_alerts(email)
-            return jsonify({
-                'status': 'success',
-                'data': alerts
-            })
+        result = celery.AsyncResult(task_id)
+        task = {'task_id': task_id, 'state': result.state}
+        if result.successful():
+            task['data'] = result.result
+        elif result.failed():
+            task['error'] = str(result.result)
         
-        else:  # POST
-            data = request.get_json() or {}
-            required = ['email', 'keywords', 'location']
-            
-            for field in required:
-                if field not in data:
-                    return jsonify({
-                        'status': 'error',
-                        'error': f'Missing required field: {field}'
-                    }), 400
-            
-            alert_id = job_alert_manager.create_alert(
-                user_email=data['email'],
-                keywords=data['keywords'],
-                location=data['location'],
-                remote_only = str(data.get('remote_only', False)).lower() == 'true',
-                min_salary=int(data['min_salary']) if data.get('min_salary') else None
-            )
-            
-            return jsonify({
-                'status': 'success',
-                'alert_id': alert_id,
-                'message': 'Job alert created successfully'
-            })
+        return ojson({
+            'status': 'success',
+            'data': task
+        })
     
     except Exception as e:
-        logger.error(f"Job alert error: {str(e)}")
-        return jsonify({
+        logger.error("Task status error: %s", e)
+        return ojson({
             'status': 'error',
             'error': str(e)
         }), 500
@@ -1321,32 +2245,44 @@ def api_job_alerts():
 # Error Handlers
 # ============================================================================
 
+# Scanners probing random paths make 404 the most common error of all
+_ERR_NOT_FOUND = _canned_error('Not found', 404, code=404)
+_ERR_TOO_LARGE = _canned_error('Request body too large', 413, code=413)
+_ERR_INTERNAL = _canned_error('Internal server error', 500, code=500)
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
-        'status': 'error',
-        'error': 'Not found',
-        'code': 404
-    }), 404
+    return _ERR_NOT_FOUND()
+
+
+@app.errorhandler(413)
+def request_too_large(error):
+    """Handle oversized request bodies"""
+    return _ERR_TOO_LARGE()
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    logger.error(f"Internal server error: {str(error)}")
-    return jsonify({
-        'status': 'error',
-        'error': 'Internal server error',
-        'code': 500
-    }), 500
+    logger.error("Internal server error: %s", error)
+    return _ERR_INTERNAL()
 
 
 @app.errorhandler(Exception)
 def handle_exception(error):
     """Handle all uncaught exceptions"""
-    logger.error(f"Unhandled exception: {str(error)}", exc_info=True)
-    return jsonify({
+    if isinstance(error, HTTPException):
+        # abort()/bad JSON bodies keep their own status code
+        return ojson({
+            'status': 'error',
+            'error': error.description,
+            'code': error.code
+        }), error.code
+    
+    logger.error("Unhandled exception: %s", error, exc_info=True)
+    return ojson({
         'status': 'error',
         'error': str(error)
     }), 500
@@ -7,6 +7,7 @@ Tests pagination support for both APIs
 import os
 import sys
 import time
+import traceback
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -19,6 +20,9 @@ from src.external.serpapi_client import SerpAPIClient
 from src.external.google_search_client import GoogleSearchClient
 from src.config.config import Config
 
+# Failures are reported either way; tracebacks only with --verbose
+VERBOSE = '--verbose' in sys.argv[1:]
+
 def test_serpapi_20_results():
     """Test SerpAPI with max_results=20 (requires pagination)"""
     print("\n" + "="*60)
@@ -57,8 +61,8 @@ def test_serpapi_20_results():
         
     except Exception as e:
         print(f"❌ FAILED: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            traceback.print_exc()
         return False
 
 def test_google_20_results():
@@ -102,8 +106,8 @@ def test_google_20_results():
         
     except Exception as e:
         print(f"❌ FAILED: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            traceback.print_exc()
         return False
 
 def test_hybrid_mode_20_results():
@@ -168,8 +172,8 @@ def test_hybrid_mode_20_results():
         
     except Exception as e:
         print(f"❌ FAILED: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            traceback.print_exc()
         return False
 
 def main():
@@ -7,8 +7,12 @@ Tests marketplace API, job search API, and Google API client integration
 import os
 import sys
 import json
+import threading
 import time
+import traceback
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -18,15 +22,28 @@ from src.config.config import Config
 from src.marketplace.marketplace_client import MarketplaceClient
 from src.jobs.job_search_client import JobSearchClient
 from src.external.google_search_client import GoogleSearchClient
+from src.utils.buffered_output import buffered_print as print, run_buffered
 
 # Test configuration
 BASE_URL = "http://127.0.0.1:8080"
+# Failures are reported either way; tracebacks only with --verbose
+VERBOSE = '--verbose' in sys.argv[1:]
 TEST_RESULTS = []
 
+# One keep-alive session for every HTTP check, shared by the concurrent
+# sections; the pool is sized for them
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Sections run concurrently; each one prints into its own buffer and records
+# results on a thread-local list, flushed in section order once all have finished
+_section = threading.local()
+
 def test_result(name, passed, details=""):
     """Track test results"""
     status = "✅ PASS" if passed else "❌ FAIL"
-    TEST_RESULTS.append({"name": name, "passed": passed, "status": status, "details": details})
+    results = getattr(_section, 'results', TEST_RESULTS)
+    results.append({"name": name, "passed": passed, "status": status, "details": details})
     print(f"{status}: {name}")
     if details:
         print(f"       {details}")
@@ -70,8 +87,8 @@ def test_marketplace_backend():
     
     except Exception as e:
         test_result("Marketplace client initialization", False, f"✗ Error: {str(e)[:60]}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            print(traceback.format_exc(), end="")
         return False
 
 # ============================================================================
@@ -113,8 +130,8 @@ def test_job_search_backend():
     
     except Exception as e:
         test_result("Job search client initialization", False, f"✗ Error: {str(e)[:60]}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            print(traceback.format_exc(), end="")
         return False
 
 # ============================================================================
@@ -172,8 +189,8 @@ def test_google_api_backend():
         
         except Exception as e:
             test_result("Google client initialization", False, f"✗ Error: {str(e)[:60]}")
-            import traceback
-            traceback.print_exc()
+            if VERBOSE:
+                print(traceback.format_exc(), end="")
         
         return True
     
@@ -194,7 +211,7 @@ def test_api_endpoints():
     # Check if server is running
     print("\n1. Checking if Flask server is running...")
     try:
-        response = requests.get(f"{BASE_URL}/", timeout=2)
+        response = SESSION.get(f"{BASE_URL}/", timeout=2)
         test_result("Flask server running", True, f"✓ Server responsive (status {response.status_code})")
     except requests.exceptions.ConnectionError:
         test_result("Flask server running", False, "✗ Cannot connect to Flask server at http://127.0.0.1:8080")
@@ -207,7 +224,7 @@ def test_api_endpoints():
     # Test marketplace endpoint
     print("\n2. Testing /api/marketplace/search endpoint...")
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/marketplace/search",
             json={"q": "laptop", "max_results": 5},
             timeout=10
@@ -229,7 +246,7 @@ def test_api_endpoints():
     # Test job search endpoint
     print("\n3. Testing /api/jobs/search endpoint...")
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/jobs/search",
             json={"q": "python developer", "location": "remote", "max_results": 5},
             timeout=10
@@ -251,7 +268,7 @@ def test_api_endpoints():
     # Test main search endpoint (Google integration)
     print("\n4. Testing /api/search endpoint (with Google)...")
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{BASE_URL}/api/search?q=python&max_results=5",
             timeout=10
         )
@@ -288,7 +305,7 @@ def test_ui_endpoints():
     for endpoint, name in endpoints:
         print(f"\nTesting {name} page ({endpoint})...")
         try:
-            response = requests.get(f"{BASE_URL}{endpoint}", timeout=5)
+            response = SESSION.get(f"{BASE_URL}{endpoint}", timeout=5)
             if response.status_code == 200:
                 test_result(f"UI: {name} page", True, f"✓ Page loads (status {response.status_code})")
             else:
@@ -300,6 +317,23 @@ def test_ui_endpoints():
 # MAIN
 # ============================================================================
 
+SECTIONS = [
+    test_marketplace_backend,
+    test_job_search_backend,
+    test_google_api_backend,
+    test_ui_endpoints,
+    test_api_endpoints,
+]
+
+def run_section(section):
+    """Run one section, returning its printed output and results"""
+    _section.results = []
+    try:
+        _, output = run_buffered(section)
+        return output, _section.results
+    finally:
+        del _section.results
+
 def main():
     """Run all tests"""
     print("\n")
@@ -308,12 +342,12 @@ def main():
     print("║                     November 24, 2025                                  ║")
     print("╚════════════════════════════════════════════════════════════════════════╝")
     
-    # Run all tests
-    test_marketplace_backend()
-    test_job_search_backend()
-    test_google_api_backend()
-    test_ui_endpoints()
-    test_api_endpoints()
+    # Run all tests; the sections are independent and mostly wait on the
+    # network, so the suite takes about as long as the slowest one
+    with ThreadPoolExecutor(max_workers=len(SECTIONS)) as executor:
+        for output, results in executor.map(run_section, SECTIONS):
+            sys.stdout.write(output)
+            TEST_RESULTS.extend(results)
     
     # Summary
     print("\n" + "="*70)
@@ -4,13 +4,19 @@ Test script to verify external API integrations are working.
 Run this to check if SerpAPI, Google, and marketplace APIs are properly connected.
 """
 
+import asyncio
 import os
 import sys
 import logging
+import traceback
+
+import requests
+from requests.adapters import HTTPAdapter
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from src.caching.cache_manager import CacheManager
 from src.config.config import Config
 from src.external.serpapi_client import SerpAPIClient, SerpAPIException
 from src.external.google_search_client import GoogleSearchClient, GoogleSearchException
@@ -19,6 +25,7 @@ from src.ranking.advanced_ranker import AdvancedRanker
 from src.indexing.indexer import Indexer
 from src.storage.database import Database
 from src.processing.tokenizer import Tokenizer
+from src.utils.buffered_output import buffered_print as print, run_buffered
 
 # Setup logging
 logging.basicConfig(
@@ -27,6 +34,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# One keep-alive pool shared by every client the tests build, so the checks
+# hitting the same API host reuse its TLS connection
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+# The tests run concurrently; each prints into its own buffer, flushed in
+# test order once all of them have finished
+async def run_all(tests):
+    """Run the blocking tests on worker threads; one failing doesn't cancel the rest"""
+    return await asyncio.gather(
+        *(asyncio.to_thread(run_buffered, test) for test in tests),
+        return_exceptions=True
+    )
+
 def test_serpapi():
     """Test SerpAPI connection and search."""
     print("\n" + "="*70)
@@ -43,7 +64,7 @@ def test_serpapi():
     
     try:
         print(f"✓ Config: SERPAPI_ENABLED={Config.SERPAPI_ENABLED}, KEY={'***' + Config.SERPAPI_KEY[-4:] if Config.SERPAPI_KEY else 'NOT SET'}")
-        client = SerpAPIClient(timeout=Config.SERPAPI_TIMEOUT)
+        client = SerpAPIClient(timeout=Config.SERPAPI_TIMEOUT, session=SESSION)
         print("✓ SerpAPI client initialized")
         
         # Try a test search
@@ -87,7 +108,7 @@ def test_google():
     
     try:
         print(f"✓ Config: GOOGLE_ENABLED=true")
-        client = GoogleSearchClient()
+        client = GoogleSearchClient(session=SESSION)
         print("✓ Google Search client initialized")
         
         # Try a test search
@@ -130,7 +151,7 @@ def test_search_manager_hybrid():
         
         if Config.SERPAPI_ENABLED and Config.SERPAPI_KEY:
             try:
-                serpapi_client = SerpAPIClient()
+                serpapi_client = SerpAPIClient(session=SESSION)
                 print("✓ SerpAPI client ready")
             except Exception as e:
                 print(f"⚠ SerpAPI not available: {e}")
@@ -138,16 +159,26 @@ def test_search_manager_hybrid():
         google_enabled = os.getenv('GOOGLE_ENABLED', 'false').lower() == 'true'
         if google_enabled and os.getenv('GOOGLE_API_KEY') and os.getenv('GOOGLE_SEARCH_ENGINE_ID'):
             try:
-                google_client = GoogleSearchClient()
+                google_client = GoogleSearchClient(session=SESSION)
                 print("✓ Google Search client ready")
             except Exception as e:
                 print(f"⚠ Google Search not available: {e}")
         
+        # Cached the way the app wires it, so a repeated query (and, with
+        # Redis, a repeated run) doesn't go back out to the APIs
+        cache_manager = None
+        if Config.CACHE_ENABLED:
+            cache_manager = CacheManager(
+                l1_max_size=Config.CACHE_L1_MAX_SIZE,
+                l1_ttl=Config.CACHE_L1_TTL
+            )
+        
         # Initialize SearchManager in hybrid mode
         search_manager = SearchManager(
             local_ranker=ranker,
             serpapi_client=serpapi_client,
             google_client=google_client,
+            cache_manager=cache_manager,
             mode='hybrid'
         )
         print(f"✓ SearchManager initialized in 'hybrid' mode")
@@ -168,6 +199,10 @@ def test_search_manager_hybrid():
         print(f"   Local count: {metadata.get('local_count', 0)}")
         print(f"   API count: {metadata.get('api_count', 0)}")
         
+        if cache_manager:
+            search_manager.search("machine learning", max_results=5)
+            print(f"   Repeat served from cache: {'✓' if search_manager.stats['cache_hits'] else '✗'}")
+        
         if total > 0:
             print(f"   First result: {results['results'][0].get('title', 'N/A')}")
             return True
@@ -177,8 +212,7 @@ def test_search_manager_hybrid():
             
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(traceback.format_exc(), end="")
         return False
 
 def main():
@@ -191,12 +225,26 @@ def main():
     
     Config.print_config()
     
-    results = {
-        "SerpAPI": test_serpapi(),
-        "Google": test_google(),
-        "Hybrid": test_search_manager_hybrid(),
+    tests = {
+        "SerpAPI": test_serpapi,
+        "Google": test_google,
+        "Hybrid": test_search_manager_hybrid,
     }
     
+    # Independent network round-trips: the run takes as long as the slowest
+    try:
+        outcomes = asyncio.run(run_all(tests.values()))
+    finally:
+        SESSION.close()
+    
+    results = {}
+    for name, outcome in zip(tests, outcomes):
+        if isinstance(outcome, BaseException):
+            outcome = (False, f"❌ {name} test crashed: {outcome}\n")
+        passed, output = outcome
+        sys.stdout.write(output)
+        results[name] = passed
+    
     print("\n" + "="*70)
     print("SUMMARY")
     print("="*70)
@@ -1,33 +1,72 @@
 """Test the search endpoint."""
-import requests
+import asyncio
 import json
 
-def test_search():
-    base_url = 'http://localhost:5000'
-    
-    # Test cases
-    test_queries = [
-        {'endpoint': '/search?query=python', 'expected_status': 200},
-        {'endpoint': '/search?q=python', 'expected_status': 200},
-        {'endpoint': '/search?query=', 'expected_status': 400},
-        {'endpoint': '/search', 'expected_status': 400}
-    ]
-    
-    for test in test_queries:
-        url = base_url + test['endpoint']
+import requests
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+BASE_URL = 'http://localhost:5000'
+
+# Test cases
+TEST_QUERIES = [
+    {'endpoint': '/search?query=python', 'expected_status': 200},
+    {'endpoint': '/search?q=python', 'expected_status': 200},
+    {'endpoint': '/search?query=', 'expected_status': 400},
+    {'endpoint': '/search', 'expected_status': 400}
+]
+
+# The probes all go to one host; reuse the keep-alive connection
+SESSION = requests.Session()
+
+# Failures reported as "is the Flask app running?" rather than raised
+_CONNECT_ERRORS = (requests.exceptions.ConnectionError,) + ((httpx.TransportError,) if httpx else ())
+
+
+async def _fetch_all(urls):
+    """GET every URL concurrently over one pooled client"""
+    async with httpx.AsyncClient() as client:
+        return await asyncio.gather(*(client.get(url) for url in urls), return_exceptions=True)
+
+
+def _fetch_all_sync(urls):
+    """GET the URLs one after another (without httpx)"""
+    responses = []
+    for url in urls:
         try:
-            print(f"\nTesting: {url}")
-            response = requests.get(url)
-            print(f"Status code: {response.status_code} (Expected: {test['expected_status']})")
-            
-            if response.status_code == 200:
-                data = response.json()
-                print(f"Results: {json.dumps(data, indent=2)}")
-            else:
-                print(f"Error: {response.text}")
-                
-        except requests.exceptions.ConnectionError:
+            responses.append(SESSION.get(url))
+        except requests.exceptions.ConnectionError as e:
+            responses.append(e)
+    return responses
+
+
+def test_search():
+    urls = [BASE_URL + test['endpoint'] for test in TEST_QUERIES]
+
+    # The probes are independent; send them together when httpx is installed
+    if httpx is not None:
+        responses = asyncio.run(_fetch_all(urls))
+    else:
+        responses = _fetch_all_sync(urls)
+
+    for test, url, response in zip(TEST_QUERIES, urls, responses):
+        print(f"\nTesting: {url}")
+        if isinstance(response, _CONNECT_ERRORS):
             print(f"Could not connect to {url} - is the Flask app running?")
+            continue
+        if isinstance(response, BaseException):
+            raise response
+
+        print(f"Status code: {response.status_code} (Expected: {test['expected_status']})")
+
+        if response.status_code == 200:
+            data = response.json()
+            print(f"Results: {json.dumps(data, indent=2)}")
+        else:
+            print(f"Error: {response.text}")
 
 if __name__ == '__main__':
-    test_search()
\ No newline at end of file
+    test_search()
@@ -0,0 +1,173 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from src.storage.analytics_store import AnalyticsStore
+
+
+class TestAnalyticsStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'analytics.db')
+        self.store = AnalyticsStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_log_search_counts_and_popularity(self):
+        self.store.log_search("Python Tutorial", 10, 0.1)
+        self.store.log_search("python tutorial ", 0, 0.3)
+        self.store.log_search("flask", 5, 0.2)
+
+        stats = self.store.get_statistics()
+        self.assertEqual(stats['total_searches'], 3)
+        self.assertEqual(stats['unique_queries'], 2)
+        self.assertEqual(stats['failed_searches'], 1)
+        self.assertEqual(stats['most_popular_query'], 'python tutorial')
+        self.assertEqual(
+            self.store.get_popular_queries(1),
+            [{'query': 'python tutorial', 'count': 2}]
+        )
+
+    def test_failed_and_recent_queries(self):
+        self.store.log_search("nothing here", 0, 0.1)
+        self.store.log_search("python", 3, 0.1)
+
+        failed = self.store.get_failed_queries()
+        self.assertEqual([q['query'] for q in failed], ['nothing here'])
+
+        recent = self.store.get_recent_searches(2)
+        self.assertEqual([q['query'] for q in recent], ['python', 'nothing here'])
+
+    def test_failed_queries_outlive_recent_window(self):
+        self.store.log_search("no hits", 0, 0.1)
+        for i in range(150):
+            self.store.log_search(f"query {i}", 1, 0.1)
+
+        failed = self.store.get_failed_queries()
+        self.assertEqual([q['query'] for q in failed], ['no hits'])
+
+        self.store.close()
+        self.store = AnalyticsStore(self.path)
+        self.assertEqual(
+            [q['query'] for q in self.store.get_failed_queries()], ['no hits']
+        )
+
+    def test_repeated_queries_share_one_string(self):
+        self.store.log_search("Repeated Query", 1, 0.1)
+        self.store.log_search(" repeated query", 1, 0.1)
+
+        first, second = self.store.get_recent_searches(2)
+        self.assertIs(first['query'], second['query'])
+
+    def test_suggestions_use_prefix(self):
+        self.store.log_search("python flask", 1, 0.1)
+        self.store.log_search("python django", 1, 0.1)
+        self.store.log_search("python django", 1, 0.1)
+        self.store.log_search("java", 1, 0.1)
+
+        self.assertEqual(
+            self.store.get_query_suggestions("py"),
+            ['python django', 'python flask']
+        )
+
+    def test_track_searches_batch(self):
+        self.store.track_searches_batch([
+            {'query': 'python', 'results_count': 4, 'response_time': 0.1, 'mode': 'local'},
+            {'query': 'Python', 'results_count': 2, 'response_time': 0.2, 'mode': 'hybrid'},
+            {'query': 'missing', 'results_count': 0, 'response_time': 0.3, 'mode': 'local'},
+            {'query': '   ', 'results_count': 1, 'response_time': 0.1, 'mode': 'local'},
+        ])
+
+        self.assertEqual(self.store.total_searches, 3)
+        self.assertEqual(self.store.failed_searches, 1)
+        self.assertEqual(
+            self.store.get_popular_queries(1), [{'query': 'python', 'count': 2}]
+        )
+        self.assertEqual(
+            [q['query'] for q in self.store.get_recent_searches(3)],
+            ['missing', 'python', 'python']
+        )
+
+    def test_track_searches_batch_keeps_event_timestamp(self):
+        self.store.track_searches_batch([
+            {'query': 'old', 'results_count': 1, 'response_time': 0.1, 'mode': 'local',
+             'timestamp': 0.0},
+        ])
+
+        self.assertEqual(
+            self.store.get_recent_searches(1)[0]['timestamp'], '1970-01-01T00:00:00+00:00'
+        )
+        self.assertEqual(self.store.conn.execute('SELECT ts FROM query_events').fetchone(), (0.0,))
+
+    def test_data_persists_across_instances(self):
+        self.store.track_search("persisted", 2, 0.05, 'local')
+        self.store.close()
+
+        self.store = AnalyticsStore(self.path)
+        self.assertEqual(self.store.total_searches, 1)
+        self.assertEqual(self.store.get_recent_searches(1)[0]['query'], 'persisted')
+
+    def test_legacy_json_import_keeps_totals(self):
+        self.store.close()
+        os.remove(self.path)
+        now = datetime.now()
+        recent = (now - timedelta(hours=1)).isoformat()
+        older = (now - timedelta(hours=2)).isoformat()
+        with open(os.path.join(self.temp_dir, 'analytics.json'), 'w') as f:
+            json.dump({
+                'query_counts': {'python': 4000, 'rust': 1000},
+                'query_timestamps': {'python': [recent], 'rust': [older, older, recent]},
+                'recent_queries': [
+                    {'query': 'python', 'result_count': 3, 'search_time': 0.1, 'timestamp': recent},
+                    {'query': 'rust', 'result_count': 2, 'search_time': 0.1, 'timestamp': recent},
+                ],
+                'total_searches': 5000,
+                'failed_searches': 700,
+            }, f)
+
+        self.store = AnalyticsStore(self.path)
+
+        stats = self.store.get_statistics()
+        self.assertEqual(stats['total_searches'], 5000)
+        self.assertEqual(stats['failed_searches'], 700)
+        self.assertEqual(stats['success_rate_percent'], 86.0)
+        # Timestamps outside recent_queries still count toward windowed popularity
+        self.assertEqual(
+            self.store.get_popular_queries(2, time_window=timedelta(days=1)),
+            [{'query': 'rust', 'count': 3}, {'query': 'python', 'count': 1}]
+        )
+
+        self.store.log_search('python', 0, 0.1)
+        self.store.close()
+        self.store = AnalyticsStore(self.path)
+        self.assertEqual(self.store.total_searches, 5001)
+        self.assertEqual(self.store.failed_searches, 701)
+
+    def test_counters_under_threads(self):
+        def log():
+            for i in range(50):
+                self.store.log_search("query", i % 2, 0.01)
+
+        threads = [threading.Thread(target=log) for _ in range(8)]
+        threads.append(threading.Thread(target=self.store.clear))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # clear() may land anywhere, but the counters must agree with the db
+        total, failed = self.store.conn.execute(
+            'SELECT COUNT(*), COALESCE(SUM(result_count = 0), 0) FROM query_events'
+        ).fetchone()
+        self.assertEqual(self.store.total_searches, total)
+        self.assertEqual(self.store.failed_searches, failed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,8 +5,10 @@ Tests for all Flask API endpoints
 
 import pytest
 import json
+import time
 from unittest.mock import Mock, patch, MagicMock
 from src.web.app import app, initialize_components
+from src.config.config import Config
 
 
 @pytest.fixture
@@ -64,6 +66,24 @@ class TestSearchEndpoints:
             assert data['data']['query'] == 'test'
             assert len(data['data']['results']) == 1
     
+    def test_search_not_modified(self, client, mock_search_manager):
+        """Test a repeat GET /api/search with the page's ETag gets a 304"""
+        with patch('src.web.app.search_manager', mock_search_manager):
+            first = client.get('/api/search?q=test')
+            etag = first.headers['ETag']
+            data = json.loads(first.data)['data']
+            assert data['metadata']['response_time'] == 0.123
+            assert data['total'] == 1
+            
+            mock_search_manager.search.return_value['metadata']['response_time'] = 0.456
+            response = client.get('/api/search?q=test', headers={'If-None-Match': etag})
+            assert response.status_code == 304
+            assert response.data == b''
+            
+            mock_search_manager.search.return_value['total'] = 2
+            response = client.get('/api/search?q=test', headers={'If-None-Match': etag})
+            assert response.status_code == 200
+    
     def test_search_post(self, client, mock_search_manager):
         """Test POST /api/search"""
         with patch('src.web.app.search_manager', mock_search_manager):
@@ -92,8 +112,24 @@ class TestSearchEndpoints:
             response = client.get('/api/search?q=test&mode=serpapi')
             
             assert response.status_code == 200
-            mock_search_manager.set_mode.assert_called()
-    
+            assert mock_search_manager.search.call_args.kwargs['mode'] == 'serpapi'
+            mock_search_manager.set_mode.assert_not_called()
+
+    def test_search_parameter_coercion(self, client, mock_search_manager):
+        """Test bad numbers are rejected and unknown modes ignored"""
+        with patch('src.web.app.search_manager', mock_search_manager):
+            response = client.get('/api/search?q=test&limit=ten')
+            assert response.status_code == 400
+            assert '"limit"' in json.loads(response.data)['error']
+
+            response = client.get('/api/search?q=%20test%20&mode=fast&safe_search=off')
+            assert response.status_code == 200
+            kwargs = mock_search_manager.search.call_args.kwargs
+            assert kwargs['query'] == 'test'
+            assert kwargs['mode'] is None
+            assert kwargs['safe_search'] is False
+            assert kwargs['filters'] == {}
+
     def test_search_with_filters(self, client, mock_search_manager):
         """Test search with filters"""
         with patch('src.web.app.search_manager', mock_search_manager):
@@ -126,7 +162,43 @@ class TestSuggestionsEndpoint:
             assert data['status'] == 'success'
             assert 'suggestions' in data
             assert len(data['suggestions']) == 3
-    
+
+    def test_suggestions_cached_per_prefix(self, client, mock_search_manager):
+        """Test repeated prefixes are served from the suggestions cache"""
+        with patch('src.web.app.search_manager', mock_search_manager):
+            client.get('/api/suggestions?q=Happi&max=5')
+            response = client.get('/api/suggestions?q=happi%20&max=5')
+
+            assert response.status_code == 200
+            assert json.loads(response.data)['suggestions'] == ['test 1', 'test 2', 'test 3']
+            mock_search_manager.get_suggestions.assert_called_once_with('happi', 5)
+
+    def test_suggestions_fall_back_to_past_queries(self, client):
+        """Test past searches complete the prefix when no provider answers"""
+        manager = Mock()
+        manager.get_suggestions.return_value = []
+        store = Mock()
+        store.get_popular_queries.return_value = [
+            {'query': 'python flask', 'count': 2},
+            {'query': 'python django', 'count': 5},
+            {'query': 'java', 'count': 9},
+        ]
+
+        with patch('src.web.app.search_manager', manager), \
+                patch('src.web.app.analytics_store', store), \
+                patch('src.web.app._suggestion_trie', None):
+            response = client.get('/api/suggestions?q=Py&max=5')
+
+            assert json.loads(response.data)['suggestions'] == ['python django', 'python flask']
+
+    def test_suggestions_invalid_max(self, client, mock_search_manager):
+        """Test non-integer max is rejected as a bad request"""
+        with patch('src.web.app.search_manager', mock_search_manager):
+            response = client.get('/api/suggestions?q=test&max=lots')
+
+            assert response.status_code == 400
+            assert json.loads(response.data)['status'] == 'error'
+
     def test_suggestions_no_query(self, client):
         """Test suggestions without query"""
         response = client.get('/api/suggestions')
@@ -243,6 +315,16 @@ class TestModeEndpoint:
         )
         
         assert response.status_code == 400
+    
+    def test_set_mode_malformed_body(self, client, mock_search_manager):
+        """Test malformed mode bodies are rejected as bad requests"""
+        with patch('src.web.app.search_manager', mock_search_manager):
+            for body in ('not json', json.dumps(['hybrid']), json.dumps({'mode': None})):
+                response = client.post('/api/search/mode', data=body,
+                                       content_type='application/json')
+                
+                assert response.status_code == 400
+        mock_search_manager.set_mode.assert_not_called()
 
 
 class TestCrawlEndpoint:
@@ -267,9 +349,28 @@ class TestCrawlEndpoint:
                 content_type='application/json'
             )
             
-            assert response.status_code == 200
+            assert response.status_code == 202
             data = json.loads(response.data)
-            assert data['status'] == 'success'
+            assert data['status'] == 'accepted'
+            assert response.headers['Location'] == f"/api/crawl/{data['job_id']}"
+            
+            # Poll until the background crawl finishes
+            for _ in range(100):
+                status = client.get(response.headers['Location'])
+                job = json.loads(status.data)['data']
+                if job['state'] == 'done':
+                    break
+                time.sleep(0.01)
+            
+            assert job['state'] == 'done'
+            assert job['data']['indexed'] == 5
+            mock_spider.crawl.assert_called_once_with(['https://example.com'], max_depth=2)
+
+    def test_crawl_unknown_job(self, client):
+        """Test polling a crawl job that doesn't exist"""
+        response = client.get('/api/crawl/does-not-exist')
+
+        assert response.status_code == 404
     
     def test_crawl_no_urls(self, client):
         """Test crawl without URLs"""
@@ -282,6 +383,125 @@ class TestCrawlEndpoint:
             
             assert response.status_code == 400
 
+    def test_crawl_too_many_urls(self, client):
+        """Test crawl rejects more URLs than allowed per request"""
+        mock_spider = Mock()
+        urls = ['https://example.com/%d' % i for i in range(Config.CRAWLER_MAX_URLS_PER_REQUEST + 1)]
+
+        with patch('src.web.app.spider', mock_spider):
+            response = client.post(
+                '/api/crawl',
+                data=json.dumps({'urls': urls}),
+                content_type='application/json'
+            )
+
+            assert response.status_code == 413
+            mock_spider.crawl.assert_not_called()
+
+
+class TestMarketplaceEndpoints:
+    """Test marketplace search and compare endpoints"""
+    
+    def test_compare_too_many_products(self, client):
+        """Test compare rejects oversized product lists before fetching"""
+        mock_marketplace = Mock()
+        product_ids = [{'id': str(i), 'marketplace': 'amazon'} for i in range(51)]
+
+        with patch('src.web.app.marketplace_client', mock_marketplace):
+            response = client.post(
+                '/api/marketplace/compare', json={'product_ids': product_ids}
+            )
+
+            assert response.status_code == 400
+            mock_marketplace.compare_products.assert_not_called()
+
+    def test_marketplace_search_stream(self, client):
+        """Test stream=true sends one NDJSON line per marketplace"""
+        mock_marketplace = Mock()
+        mock_marketplace.search_stream.return_value = iter([
+            {'marketplace': 'ebay', 'products': [{'title': 'a'}]},
+            {'marketplace': 'amazon', 'products': []},
+        ])
+
+        with patch('src.web.app.marketplace_client', mock_marketplace):
+            response = client.get('/api/marketplace/search?q=laptop&stream=true')
+
+            assert response.status_code == 200
+            assert response.mimetype == 'application/x-ndjson'
+            lines = [json.loads(line) for line in response.data.splitlines()]
+            assert [line['marketplace'] for line in lines] == ['ebay', 'amazon']
+            mock_marketplace.search_all.assert_not_called()
+
+
+class TestJobEndpoints:
+    """Test job search and job alert parameter handling"""
+    
+    def test_job_search_coerces_params(self, client):
+        """Test query-string params are typed before reaching the client"""
+        mock_jobs = Mock()
+        mock_jobs.search_jobs.return_value = {'jobs': []}
+        
+        with patch('src.web.app.job_search_client', mock_jobs), \
+                patch('src.web.app.cache_manager', None):
+            response = client.get(
+                '/api/jobs/search?q=python&remote_only=true&min_salary=50000&sources=a,%20b,,a'
+            )
+            
+            assert response.status_code == 200
+            kwargs = mock_jobs.search_jobs.call_args.kwargs
+            assert kwargs['query'] == 'python'
+            assert kwargs['remote_only'] is True
+            assert kwargs['min_salary'] == 50000
+            assert kwargs['sources'] == ['a', 'b']
+    
+    def test_job_search_invalid_param(self, client):
+        """Test a malformed number is a 400, not a 500"""
+        with patch('src.web.app.job_search_client', Mock()):
+            response = client.get('/api/jobs/search?q=python&min_salary=lots')
+            
+            assert response.status_code == 400
+    
+    def test_job_alert_missing_field(self, client):
+        """Test creating a job alert without keywords"""
+        mock_alerts = Mock()
+        
+        with patch('src.web.app.job_alert_manager', mock_alerts):
+            response = client.post('/api/jobs/alerts', json={'email': 'a@b.com'})
+            
+            assert response.status_code == 400
+            mock_alerts.create_alert.assert_not_called()
+
+
+class TestBackgroundTasks:
+    """Test async job/marketplace searches queued on Celery"""
+    
+    def test_job_search_async_queues_task(self, client):
+        """Test async=true enqueues the search instead of running it"""
+        mock_jobs = Mock()
+        
+        with patch('src.web.app.job_search_client', mock_jobs), \
+                patch('celery_app.search_jobs_task.apply_async') as mock_apply:
+            mock_apply.return_value.id = 'task-1'
+            response = client.get('/api/jobs/search?q=python&async=true')
+            
+            assert response.status_code == 202
+            assert json.loads(response.data)['task_id'] == 'task-1'
+            assert mock_apply.call_args.kwargs['kwargs']['query'] == 'python'
+            mock_jobs.search_jobs.assert_not_called()
+    
+    def test_task_status(self, client):
+        """Test polling a finished task returns its result"""
+        result = Mock(state='SUCCESS', result={'total': 0})
+        result.successful.return_value = True
+        
+        with patch('celery_app.celery.AsyncResult', return_value=result):
+            response = client.get('/api/tasks/task-1')
+            
+            data = json.loads(response.data)
+            assert response.status_code == 200
+            assert data['data']['state'] == 'SUCCESS'
+            assert data['data']['data'] == {'total': 0}
+
 
 class TestAnalyticsEndpoints:
     """Test analytics endpoints"""
@@ -345,6 +565,41 @@ class TestCacheEndpoints:
             data = json.loads(response.data)
             assert data['status'] == 'success'
             mock_cache.clear.assert_called_once()
+    
+    def test_cache_invalidate(self, client):
+        """Test invalidating one endpoint's cached responses"""
+        mock_cache = Mock()
+        mock_cache.invalidate_namespace.return_value = 2
+        
+        with patch('src.web.app.cache_manager', mock_cache):
+            response = client.post('/api/cache/invalidate', json={'namespace': 'jobs'})
+            
+            assert response.status_code == 200
+            mock_cache.invalidate_namespace.assert_called_once_with('_cached_job_search')
+            
+            response = client.post('/api/cache/invalidate', json={'namespace': 'bogus'})
+            assert response.status_code == 400
+    
+    def test_cache_invalidate_search(self, client):
+        """Test invalidating search drops the manager's merged results too"""
+        from src.caching.cache_manager import CacheManager
+        from src.search.search_manager import SearchManager
+        
+        serpapi = Mock()
+        serpapi.search.return_value = {'organic_results': [
+            {'title': 'Result', 'link': 'https://example.com', 'snippet': ''}
+        ]}
+        cache = CacheManager(enabled=True)
+        manager = SearchManager(serpapi_client=serpapi, cache_manager=cache, mode='serpapi')
+        
+        with patch('src.web.app.cache_manager', cache), \
+                patch('src.web.app.search_manager', manager):
+            client.get('/api/search?q=test')
+            response = client.post('/api/cache/invalidate', json={'namespace': 'search'})
+            assert response.status_code == 200
+            client.get('/api/search?q=test')
+        
+        assert serpapi.search.call_count == 2
 
 
 class TestHealthEndpoints:
@@ -376,6 +631,76 @@ class TestHealthEndpoints:
             data = json.loads(response.data)
             assert data['status'] == 'degraded'
 
+    def test_health_check_probes_concurrently(self, client):
+        """Test slow upstream probes run together and are cut off at the deadline"""
+        slow = Mock()
+        slow.health_check.side_effect = lambda timeout=None: time.sleep(0.5) or True
+
+        with patch('src.web.app.serpapi_client', slow), \
+                patch('src.web.app.google_client', slow), \
+                patch('src.web.app._HEALTH_PROBE_TIMEOUT', 0.2):
+            start = time.time()
+            response = client.get('/health')
+            elapsed = time.time() - start
+            # A probe still running is waited on again, not started twice
+            client.get('/health')
+
+        data = json.loads(response.data)
+        assert response.status_code == 503
+        assert data['components']['serpapi'] is False
+        assert data['components']['google'] is False
+        assert elapsed < 0.5
+        assert slow.health_check.call_count == 2
+        slow.health_check.assert_called_with(timeout=0.2)
+
+    def test_health_check_fresh_worker(self, client):
+        """Test a worker booted through set_components alone reports healthy"""
+        from src.web import app as web_app
+
+        healthy = Mock()
+        healthy.health_check.return_value = True
+        unbuilt = {name: web_app._UNBUILT for name in web_app._COMPONENT_NAMES}
+
+        with patch.multiple('src.web.app', **unbuilt), \
+                patch.object(Config, 'CACHE_ENABLED', True), \
+                patch.object(Config, 'MARKETPLACE_ENABLED', True), \
+                patch.object(Config, 'JOBS_ENABLED', True):
+            web_app.set_components(ranker=Mock(), spider=Mock(), search_manager_instance=Mock())
+            web_app.serpapi_client = healthy
+            web_app.google_client = healthy
+            response = client.get('/health')
+
+            assert web_app.marketplace_client is web_app._UNBUILT
+            assert web_app.job_search_client is web_app._UNBUILT
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['components']['marketplace'] is True
+        assert data['components']['job_search'] is True
+
+    def test_health_check_does_not_build_components(self, client):
+        """Test health check leaves lazily built components alone"""
+        from src.web import app as web_app
+
+        with patch('src.web.app.serpapi_client', web_app._UNBUILT):
+            with patch('src.web.app.search_manager', web_app._UNBUILT):
+                client.get('/health')
+
+                assert web_app.serpapi_client is web_app._UNBUILT
+                assert web_app.search_manager is web_app._UNBUILT
+
+    def test_set_components_fills_component_globals(self, client):
+        """Test components from main.py are returned without building"""
+        from src.web import app as web_app
+        manager = Mock()
+
+        with patch('src.web.app.search_manager', web_app._UNBUILT), \
+                patch('src.web.app._build_search_manager') as mock_build:
+            web_app.set_components(search_manager_instance=manager)
+
+            assert web_app.get_search_manager() is manager
+            mock_build.assert_not_called()
+
 
 class TestErrorHandlers:
     """Test error handlers"""
@@ -389,6 +714,78 @@ class TestErrorHandlers:
         assert data['status'] == 'error'
         assert data['code'] == 404
 
+    def test_route_exception_handler(self, client):
+        """Test an exception inside a route becomes a JSON 500"""
+        mock_alerts = Mock()
+        mock_alerts.get_user_alerts.side_effect = RuntimeError('store down')
+
+        with patch('src.web.app.job_alert_manager', mock_alerts):
+            response = client.get('/api/jobs/alerts?email=a@b.com')
+
+            assert response.status_code == 500
+            assert json.loads(response.data)['error'] == 'store down'
+
+    def test_method_not_allowed_keeps_status(self, client):
+        """Test HTTP errors are not turned into 500s"""
+        response = client.delete('/api/jobs/search')
+
+        assert response.status_code == 405
+
+
+class TestJsonProvider:
+    """Test the app-wide JSON provider"""
+    
+    def test_jsonify_handles_dates(self):
+        """Test jsonify() goes through the same encoder as ojson()"""
+        from datetime import date
+        from flask import jsonify
+        
+        with app.test_request_context('/'):
+            response = jsonify(day=date(2024, 1, 2))
+        
+        assert json.loads(response.data) == {'day': '2024-01-02'}
+        assert response.mimetype == 'application/json'
+
+    def test_request_body_parsed_by_provider(self):
+        """Test POST bodies are decoded by app.json, not the stdlib"""
+        with patch.object(app.json, 'loads', wraps=app.json.loads) as mock_loads:
+            with app.test_request_context('/', method='POST', json={'product_ids': [1, 2]}):
+                from flask import request
+                assert request.get_json() == {'product_ids': [1, 2]}
+
+        mock_loads.assert_called_once()
+
+    def test_malformed_body_is_400(self, client):
+        """Test an unparseable JSON body is rejected, not a 500"""
+        with patch('src.web.app.marketplace_client', Mock()):
+            response = client.post(
+                '/api/marketplace/compare',
+                data='{"product_ids": [',
+                content_type='application/json'
+            )
+
+        assert response.status_code == 400
+
+
+class TestCors:
+    """Test the CORS after_request hook"""
+
+    def test_listed_origin_is_echoed(self):
+        """Test only listed origins get an Allow-Origin header"""
+        from flask import Response
+        from src.web.app import _add_cors_headers
+
+        allowed = frozenset({'http://localhost:3000'})
+        with patch('src.web.app._CORS_ORIGINS', allowed):
+            with app.test_request_context('/', headers={'Origin': 'http://localhost:3000'}):
+                response = _add_cors_headers(Response())
+            assert response.headers['Access-Control-Allow-Origin'] == 'http://localhost:3000'
+            assert 'Origin' in response.vary
+
+            with app.test_request_context('/', headers={'Origin': 'http://evil.test'}):
+                response = _add_cors_headers(Response())
+            assert 'Access-Control-Allow-Origin' not in response.headers
+
 
 class TestUIRoutes:
     """Test UI routes"""
@@ -404,12 +801,28 @@ class TestUIRoutes:
     
     def test_results_page(self, client):
         """Test results page"""
-        with patch('src.web.app.render_template') as mock_render:
-            mock_render.return_value = '<html>Results</html>'
+        with patch('src.web.app.stream_template') as mock_stream:
+            mock_stream.return_value = iter(['<html>', 'Results</html>'])
             response = client.get('/results?q=test')
             
             assert response.status_code == 200
-            mock_render.assert_called_with('results.html', query='test')
+            assert response.data == b'<html>Results</html>'
+            mock_stream.assert_called_with('results.html', query='test')
+    
+    def test_results_page_escapes_query(self, client):
+        """Test the streamed results page still autoescapes the query"""
+        response = client.get('/results?q=<script>x</script>')
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'text/html'
+        assert b'<script>x</script>' not in response.data
+        assert b'&lt;script&gt;x&lt;/script&gt;' in response.data
+    
+    def test_routes_registered_once(self):
+        """Test no URL rule is registered twice"""
+        rules = [(rule.rule, frozenset(rule.methods)) for rule in app.url_map.iter_rules()]
+        
+        assert len(rules) == len(set(rules))
 
 
 class TestIntegration:
@@ -1,25 +1,53 @@
 """Unit tests for crawler module."""
 
+import os
+import shutil
+import tempfile
+import threading
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from src.crawler.spider import Spider
 from src.processing.tokenizer import Tokenizer
 from src.indexing.indexer import Indexer
 from src.storage.database import Database
 
+URLS = [f"http://example.com/page{i}" for i in range(10)]
+
+
 class TestCrawler(unittest.TestCase):
     def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
         self.tokenizer = Tokenizer()
-        self.database = Database("test_index.json")
-        self.indexer = Indexer(self.tokenizer, self.database)
-        self.spider = Spider(self.tokenizer, self.indexer)
-
-    @patch('requests.get')
-    def test_crawl(self, mock_get):
-        mock_get.return_value.text = "<html><body>Test content</body></html>"
-        self.spider.crawl(["http://example.com"])
+        self.database = Database(os.path.join(self.temp_dir, "test_index.json"))
+        self.indexer = Indexer(self.database, self.tokenizer)
+        self.spider = Spider(self.tokenizer, self.indexer, max_workers=len(URLS))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_crawl(self):
+        # Every fetch waits until all ten are in flight, so this only
+        # completes if the spider fetches the pages concurrently
+        barrier = threading.Barrier(len(URLS), timeout=5)
+
+        def fetch(url, **kwargs):
+            barrier.wait()
+            response = MagicMock()
+            response.headers = {"Content-Type": "text/html"}
+            # Each page links to every start URL, including itself
+            links = "".join(f'<a href="{link}">next</a>' for link in URLS)
+            response.text = f"<html><body>Test content {links}</body></html>"
+            return response
+
+        with patch.object(self.spider.session, "get", side_effect=fetch) as mock_get:
+            stats = self.spider.crawl(URLS + URLS[:3], max_depth=2)
+
+        self.assertEqual(mock_get.call_count, len(URLS))
+        self.assertEqual(stats["crawled"], len(URLS))
+        self.indexer.flush()
         index = self.database.load_index()
         self.assertIn("test", index)
+        self.assertEqual(len(index["test"]), len(URLS))
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+"""Tests for gather_with_deadline: results, errors and the shared deadline."""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.concurrency import gather_with_deadline
+
+
+class TestGatherWithDeadline(unittest.TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.executor.shutdown(wait=True)
+
+    def test_splits_results_errors_and_late_futures(self):
+        def fail():
+            raise ValueError("boom")
+
+        futures = {
+            'slow': self.executor.submit(self.release.wait),
+            'ok': self.executor.submit(lambda: [1, 2]),
+            'bad': self.executor.submit(fail),
+        }
+
+        start = time.time()
+        results, errors = gather_with_deadline(futures, 0.1)
+
+        self.assertLess(time.time() - start, 1.0)
+        self.assertEqual(results, {'ok': [1, 2]})
+        self.assertEqual(list(errors), ['slow', 'bad'])
+        self.assertIsInstance(errors['slow'], TimeoutError)
+        self.assertIsInstance(errors['bad'], ValueError)
+
+    def test_expired_deadline_still_collects_finished(self):
+        future = self.executor.submit(lambda: 'done')
+        future.result()
+
+        results, errors = gather_with_deadline({'done': future}, -1)
+
+        self.assertEqual(results, {'done': 'done'})
+        self.assertEqual(errors, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
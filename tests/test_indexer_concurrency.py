@@ -3,7 +3,6 @@
 import unittest
 import os
 import threading
-import time
 
 from src.indexing.indexer import Indexer
 from src.storage.database import Database
@@ -18,7 +17,7 @@ class TestIndexerConcurrency(unittest.TestCase):
             pass
         self.db = Database(self.test_path)
         # tokenizer isn't used by Indexer internals for these tests
-        self.indexer = Indexer(None, self.db)
+        self.indexer = Indexer(self.db, None)
 
     def tearDown(self):
         try:
@@ -54,11 +53,28 @@ class TestIndexerConcurrency(unittest.TestCase):
         freqs = sorted([p[1] for p in postings])
         self.assertEqual(freqs, [3, 3, 3, 3, 3])
 
+    def test_concurrent_batch_indexing(self):
+        def worker(i):
+            tokens = ["alpha"] * 3 + ["beta"]
+            self.indexer.index_documents([(f"doc{i}-{j}", tokens) for j in range(100)])
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        postings = self.indexer.index["alpha"]
+        self.assertEqual(len(postings), 500)
+        self.assertEqual({p[1] for p in postings}, {3})
+        self.assertEqual(len(self.indexer.index["beta"]), 500)
+
     def test_background_flusher(self):
         # replace indexer with auto-flush enabled
         self.indexer.stop_auto_flush()
-        self.indexer = Indexer(None, self.db)
-        self.indexer.start_auto_flush(interval=0.05)
+        self.indexer = Indexer(self.db, None)
+        flushed = threading.Event()
+        self.indexer.start_auto_flush(interval=0.01, on_flush=flushed.set)
 
         def worker(doc_id):
             tokens = ["gamma"]
@@ -73,8 +89,13 @@ class TestIndexerConcurrency(unittest.TestCase):
         for t in threads:
             t.join()
 
-        # wait for background flusher to run at least once
-        time.sleep(0.2)
+        # The first signal may come from a flush that ran mid-indexing, and
+        # one in flight at clear() can still signal afterwards; the second
+        # signal after a clear() comes from a flush begun after the joins
+        self.assertTrue(flushed.wait(2.0))
+        for _ in range(2):
+            flushed.clear()
+            self.assertTrue(flushed.wait(2.0))
         index = self.db.load_index()
         self.assertIn("gamma", index)
         postings = index["gamma"]
@@ -35,6 +35,53 @@ class TestIndexing(unittest.TestCase):
             self.assertEqual(index["hello"], [["doc1", 1]])
 
 
+
+class TestDatabase(unittest.TestCase):
+      def setUp(self):
+            self.test_path = "test_database_index.json"
+            self.database = Database(self.test_path)
+
+      def tearDown(self):
+            try:
+                  os.remove(self.test_path)
+            except OSError:
+                  pass
+
+      def test_load_index_reparses_only_after_changes(self):
+            self.assertEqual(self.database.load_index(), {})
+            self.database.save_index({"hello": [["doc1", 1]]})
+            first = self.database.load_index()
+            self.assertIs(self.database.load_index(), first)
+
+            self.database.save_index({"hello": [["doc1", 1]], "world": [["doc2", 2]]})
+            self.assertEqual(sorted(self.database.load_index()), ["hello", "world"])
+
+      def test_indexer_does_not_mutate_loaded_index(self):
+            self.database.save_index({"hello": [["doc1", 1]]})
+            indexer = Indexer(self.database, Tokenizer())
+            indexer.index_document("doc1", ["hello"])
+            self.assertEqual(self.database.load_index()["hello"], [["doc1", 1]])
+
+
+class TestTokenizer(unittest.TestCase):
+      def test_ascii_and_accented_text_normalize_alike(self):
+            tokenizer = Tokenizer(use_stemming=False)
+            self.assertEqual(tokenizer.tokenize("Cafe Resume 2024"), ["cafe", "resume", "2024"])
+            self.assertEqual(tokenizer.tokenize("Café Résumé 2024"), ["cafe", "resume", "2024"])
+
+      def test_stemming_matches_original_form(self):
+            tokenizer = Tokenizer()
+            if not tokenizer.use_stemming:
+                  self.skipTest("NLTK not available")
+            expected = [tokenizer.stemmer.stem("running"), tokenizer.stemmer.stem("runners")]
+            self.assertEqual(tokenizer.tokenize("running runners"), expected)
+            self.assertEqual(tokenizer.tokenize("running runners"), expected)
+            self.assertEqual(
+                  [processed for _, processed in tokenizer.tokenize_preserve_original("Running")],
+                  [tokenizer.stemmer.stem("running")]
+            )
+
+
 if __name__ == "__main__":
       unittest.main()
   
\ No newline at end of file
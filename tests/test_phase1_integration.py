@@ -5,6 +5,8 @@ Tests for SerpAPI client and Search Manager
 
 import pytest
 import os
+import threading
+import time
 from unittest.mock import Mock, patch, MagicMock
 from src.external.serpapi_client import SerpAPIClient, SerpAPIException
 from src.search.search_manager import SearchManager
@@ -80,6 +82,56 @@ class TestSerpAPIClient:
         # With 3 retry attempts, that's 3 * 2 = 6 increments
         assert client.stats['failed_requests'] == 6
     
+    @patch('src.external.serpapi_client.GoogleSearch')
+    def test_search_merges_pages_in_order(self, mock_search, client):
+        """Test pages fetched together are merged in page order"""
+        def page(params, session=None):
+            start = params['start']
+            search = Mock()
+            if start < 30:
+                # Later pages answer first
+                time.sleep((30 - start) / 1000)
+                organic = [{'title': f'R{start + i}', 'link': f'https://e.com/{start + i}'}
+                           for i in range(10)]
+            else:
+                organic = []
+            search.get_dict.return_value = {'organic_results': organic}
+            return search
+        
+        mock_search.side_effect = page
+        
+        results = client.search('test query', max_results=55)
+        
+        titles = [r['title'] for r in results['organic_results']]
+        assert titles == [f'R{i}' for i in range(30)]
+        # Six pages: page 1 alone, then a wave of four stopped by the empty
+        # fourth page
+        assert mock_search.call_count == 5
+    
+    @patch('src.external.serpapi_client.GoogleSearch')
+    def test_search_stops_after_short_first_page(self, mock_search, client):
+        """Test a short first page isn't followed by billed requests for later ones"""
+        mock_search.return_value.get_dict.return_value = {
+            'organic_results': [{'title': 'Only', 'link': 'https://e.com/only'}]
+        }
+        
+        results = client.search('test query', max_results=50)
+        
+        assert [r['title'] for r in results['organic_results']] == ['Only']
+        assert mock_search.call_count == 1
+    
+    @patch('src.external.serpapi_client.GoogleSearch')
+    def test_search_uses_shared_session(self, mock_search):
+        """Test a session passed in is the one searches go through"""
+        import requests
+        
+        session = requests.Session()
+        mock_search.return_value.get_dict.return_value = {'organic_results': []}
+        
+        SerpAPIClient(api_key='test_key', session=session).search('test query')
+        
+        assert mock_search.call_args.kwargs['session'] is session
+    
     @patch('src.external.serpapi_client.GoogleSearch')
     def test_get_suggestions(self, mock_search, client):
         """Test autocomplete suggestions"""
@@ -96,12 +148,95 @@ class TestSerpAPIClient:
         
         assert len(suggestions) == 2
         assert 'python programming' in suggestions
+
+    def test_get_dict_keeps_requested_keys(self):
+        """Test keyed get_dict builds only the requested top-level values"""
+        import io
+        import json
+        from src.external.serpapi_client import GoogleSearch
+
+        body = json.dumps({
+            'search_metadata': {'total_time_taken': 0.5},
+            'organic_results': [{'title': 'Result', 'position': 1}],
+            'related_searches': [{'query': 'other'}] * 100
+        }).encode()
+
+        class FakeResponse:
+            def __init__(self):
+                self.raw = io.BytesIO(body)
+            @property
+            def text(self):
+                return self.raw.read().decode()
+            def __enter__(self):
+                return self
+            def __exit__(self, *exc):
+                return False
+
+        response = FakeResponse()
+        session = Mock()
+        session.get.return_value = response
+        search = GoogleSearch({'engine': 'duckduckgo', 'q': 'test'}, session=session)
+
+        assert search.get_dict(keys=('organic_results',)) == {
+            'organic_results': [{'title': 'Result', 'position': 1}]
+        }
+        # Body read to the end so the connection can be reused
+        assert response.raw.tell() == len(body)
+
+    @patch('src.external.serpapi_client.GoogleSearch')
+    def test_health_check(self, mock_search, client):
+        """Test health check is one bounded fetch, not a retried search"""
+        mock_search.return_value.get_dict.return_value = {'organic_results': []}
+        with patch.object(client, 'search') as mock_client_search:
+            assert client.health_check(timeout=1.5) == True
+            mock_client_search.assert_not_called()
+        assert mock_search.call_count == 1
+        assert mock_search.return_value.timeout == 1.5
+        
+        mock_search.return_value.get_dict.return_value = {'error': 'Invalid API key'}
+        assert client.health_check() == False
     
-    def test_health_check(self, client):
-        """Test health check"""
-        with patch.object(client, 'search') as mock_search:
-            mock_search.return_value = {'organic_results': []}
-            assert client.health_check() == True
+    def test_search_many_fans_out_async(self, client):
+        """Test multiple news queries are gathered over one async client"""
+        class FakeResponse:
+            def __init__(self, data):
+                self.data = data
+            def raise_for_status(self):
+                pass
+            def json(self):
+                return self.data
+        
+        class FakeAsyncClient:
+            instances = 0
+            def __init__(self):
+                FakeAsyncClient.instances += 1
+            async def __aenter__(self):
+                return self
+            async def __aexit__(self, *exc):
+                return False
+            async def get(self, url, params=None, timeout=None):
+                return FakeResponse({'news_results': [{'title': params['q'], 'link': 'https://n.com'}]})
+        
+        with patch('src.external.serpapi_client.httpx', Mock(AsyncClient=FakeAsyncClient)):
+            results = client.search_many(['python', 'flask'], 'news', max_results=5)
+        
+        assert [r['query'] for r in results] == ['python', 'flask']
+        assert results[1]['results'][0]['title'] == 'flask'
+        assert FakeAsyncClient.instances == 1
+
+    def test_search_many_without_httpx_runs_concurrently(self, client):
+        """Test the sync fallback doesn't run the queries one after another"""
+        def slow_news(query, max_results):
+            time.sleep(0.2)
+            return {'query': query, 'results': [], 'total': 0}
+
+        with patch('src.external.serpapi_client.httpx', None), \
+                patch.object(client, 'search_news', side_effect=slow_news):
+            start = time.time()
+            results = client.search_many(['a', 'b', 'c'], 'news')
+
+        assert time.time() - start < 0.5
+        assert [r['query'] for r in results] == ['a', 'b', 'c']
 
 
 class TestSearchManager:
@@ -208,7 +343,48 @@ class TestSearchManager:
         # Should only have one result due to deduplication
         if manager_hybrid.deduplicate:
             assert len(results['results']) == 1
-    
+
+    def test_hybrid_drops_slow_source(self, manager_hybrid):
+        """Test a source past the deadline doesn't hold up the search"""
+        manager_hybrid.SOURCE_TIMEOUT = 0.2
+        manager_hybrid.serpapi_client.search.side_effect = lambda **kwargs: time.sleep(1) or {}
+
+        start = time.time()
+        results = manager_hybrid.search('slow query', max_results=10)
+
+        assert time.time() - start < 0.8
+        assert results['metadata']['local_count'] == 1
+        assert results['metadata']['serpapi_count'] == 0
+
+    def test_cache_key_normalizes_query(self, manager_local):
+        """Test query variants share a cache entry but other params don't"""
+        store = {}
+        manager_local.cache_manager = Mock(
+            get=Mock(side_effect=store.get),
+            set=Mock(side_effect=lambda key, value, ttl=None: store.__setitem__(key, value))
+        )
+
+        manager_local.search('Python  Tutorial', max_results=10)
+        manager_local.search('python tutorial', max_results=10)
+        assert manager_local.local_ranker.rank.call_count == 1
+
+        manager_local.search('python tutorial', max_results=20)
+        assert manager_local.local_ranker.rank.call_count == 2
+
+    def test_hybrid_overlaps_local_and_api(self, manager_hybrid):
+        """Test local ranking runs while the API request is in flight"""
+        ranked = manager_hybrid.local_ranker.rank.return_value
+        manager_hybrid.local_ranker.rank.side_effect = lambda *a, **kw: time.sleep(0.3) or ranked
+        api_results = manager_hybrid.serpapi_client.search.return_value
+        manager_hybrid.serpapi_client.search.side_effect = lambda **kw: time.sleep(0.3) or api_results
+
+        start = time.time()
+        results = manager_hybrid.search('overlap query', max_results=10)
+
+        assert time.time() - start < 0.5
+        assert results['metadata']['local_count'] == 1
+        assert results['metadata']['serpapi_count'] == 1
+
     def test_mode_switching(self, manager_hybrid):
         """Test runtime mode switching"""
         assert manager_hybrid.mode == 'hybrid'
@@ -220,6 +396,22 @@ class TestSearchManager:
         success = manager_hybrid.set_mode('invalid')
         assert success == False
     
+    def test_per_call_mode_override(self, manager_hybrid, mock_serpapi):
+        """Test a mode passed to search() applies to that call only"""
+        results = manager_hybrid.search('test query', max_results=10, mode='local')
+        
+        assert results['metadata']['mode'] == 'local'
+        assert manager_hybrid.mode == 'hybrid'
+        mock_serpapi.search.assert_not_called()
+
+    def test_per_call_suggestions_mode(self, manager_hybrid, mock_serpapi):
+        """Test a mode passed to get_suggestions() applies to that call only"""
+        mock_serpapi.get_suggestions.return_value = ['test query']
+
+        assert manager_hybrid.get_suggestions('test', mode='local') == []
+        assert manager_hybrid.get_suggestions('test') == ['test query']
+        assert manager_hybrid.mode == 'hybrid'
+
     def test_statistics_tracking(self, manager_local):
         """Test statistics are tracked correctly"""
         initial_count = manager_local.stats['total_searches']
@@ -230,6 +422,121 @@ class TestSearchManager:
         assert manager_local.stats['local_searches'] > 0
 
 
+class TestStaleWhileRevalidate:
+    """Test stale-while-revalidate caching of external API results"""
+
+    @pytest.fixture
+    def cache(self):
+        from src.caching.cache_manager import CacheManager
+        cache = CacheManager(enabled=True)
+        cache.redis_client = None  # use the in-memory fallback
+        return cache
+
+    def test_fresh_hit_skips_loader(self, cache):
+        loader = Mock(return_value={'total': 1})
+        key = cache.swr_key('news', 'python', 10)
+
+        assert cache.get_or_refresh(key, loader, ttl=60, stale_ttl=600) == {'total': 1}
+        assert cache.get_or_refresh(key, loader, ttl=60, stale_ttl=600) == {'total': 1}
+        assert loader.call_count == 1
+
+    def test_stale_hit_served_while_refreshing(self, cache):
+        key = cache.swr_key('news', 'python', 10)
+        cache.set(key, {'value': 'old', 'fresh_until': 0}, ttl=600)
+        refreshed = threading.Event()
+
+        def loader():
+            refreshed.set()
+            return 'new'
+
+        assert cache.get_or_refresh(key, loader, ttl=60, stale_ttl=600) == 'old'
+        assert refreshed.wait(2)
+        for _ in range(100):
+            if not cache._refreshing:
+                break
+            time.sleep(0.01)
+        assert cache.get_or_refresh(key, loader, ttl=60, stale_ttl=600) == 'new'
+        assert cache.stale_hits == 1
+
+    def test_refresh_reloads_fresh_entry(self, cache):
+        key = cache.swr_key('jobs', 'python')
+        cache.get_or_refresh(key, lambda: 'old', ttl=60, stale_ttl=600)
+
+        cache.refresh(key, lambda: 'warm', ttl=60, stale_ttl=600)
+        assert cache.get_or_refresh(key, Mock(), ttl=60, stale_ttl=600) == 'warm'
+
+    def test_failed_refresh_keeps_stale(self, cache):
+        key = cache.swr_key('images', 'cats', 20)
+        cache.set(key, {'value': 'old', 'fresh_until': 0}, ttl=600)
+
+        loader = Mock(side_effect=RuntimeError('quota exceeded'))
+        assert cache.get_or_refresh(key, loader, ttl=60, stale_ttl=600) == 'old'
+        for _ in range(100):
+            if not cache._refreshing:
+                break
+            time.sleep(0.01)
+        assert cache.get(key)['value'] == 'old'
+
+    def test_search_manager_serves_stale_api_results(self, cache):
+        serpapi = Mock()
+        serpapi.search.return_value = {'organic_results': [
+            {'title': 'API Result', 'url': 'https://api.com', 'snippet': ''}
+        ]}
+        manager = SearchManager(serpapi_client=serpapi, cache_manager=cache, mode='serpapi')
+
+        first = manager.search('python', max_results=10)
+        assert manager.search('python', max_results=10) == first
+        assert serpapi.search.call_count == 1
+
+        # Past the fresh TTL the stale result is served and refreshed behind it
+        key = manager._generate_cache_key('python', None, 'serpapi', 10)
+        cache.set(key, {**cache.get(key), 'fresh_until': 0}, ttl=600)
+        assert manager.search('python', max_results=10) == first
+        for _ in range(100):
+            if not cache._refreshing:
+                break
+            time.sleep(0.01)
+        assert serpapi.search.call_count == 2
+        assert cache.get(key)['fresh_until'] > time.time()
+
+
+class TestTwoTierCache:
+    """Test the in-process LRU in front of Redis"""
+
+    @pytest.fixture
+    def cache(self):
+        from src.caching.cache_manager import CacheManager
+        cache = CacheManager(enabled=False, l1_max_size=2)
+        cache.enabled = True
+        cache.redis_client = MagicMock()
+        return cache
+
+    def test_l1_serves_repeat_reads(self, cache):
+        cache.redis_client.get.return_value = '{"total": 3}'
+
+        assert cache.get('k') == {'total': 3}
+        assert cache.get('k') == {'total': 3}
+        assert cache.redis_client.get.call_count == 1
+        assert cache.l1_hits == 1
+
+    def test_l1_evicts_least_recently_used(self, cache):
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key, ttl=60)
+
+        assert list(cache.l1_cache) == ['b', 'c']
+
+    def test_invalidate_namespace(self, cache):
+        jobs_key = cache.swr_key('jobs', 'python')
+        cache.set(jobs_key, 'x', ttl=60)
+        cache.set(cache.swr_key('news', 'python'), 'y', ttl=60)
+        cache.redis_client.scan_iter.return_value = [jobs_key]
+
+        assert cache.invalidate_namespace('jobs') == 1
+        assert jobs_key not in cache.l1_cache
+        assert len(cache.l1_cache) == 1
+        cache.redis_client.delete.assert_called_once_with(jobs_key)
+
+
 class TestConfig:
     """Test configuration management"""
     
@@ -0,0 +1,46 @@
+import unittest
+
+from src.search.prefix_trie import PrefixTrie
+
+
+class TestPrefixTrie(unittest.TestCase):
+    def setUp(self):
+        self.trie = PrefixTrie([
+            ('python tutorial', 3),
+            ('Python  Flask', 7),
+            ('pytest', 1),
+            ('java', 4),
+            ('python tutorial', 2),
+        ], top_k=3)
+
+    def test_complete_orders_by_weight(self):
+        self.assertEqual(
+            self.trie.complete('py'),
+            ['python flask', 'python tutorial', 'pytest']
+        )
+        self.assertEqual(self.trie.complete('python t'), ['python tutorial'])
+
+    def test_complete_normalizes_prefix(self):
+        self.assertEqual(self.trie.complete('  PYTHON   F'), ['python flask'])
+
+    def test_complete_respects_k_and_top_k(self):
+        self.assertEqual(self.trie.complete('', k=2), ['python flask', 'python tutorial'])
+        self.assertEqual(len(self.trie.complete('', k=10)), 3)
+
+    def test_unknown_prefix(self):
+        self.assertEqual(self.trie.complete('rust'), [])
+
+    def test_locate_continues_from_node(self):
+        node = self.trie.locate('pyt')
+        self.assertEqual(
+            self.trie.complete_from(node, 'hon '), self.trie.complete('python ')
+        )
+        self.assertEqual(self.trie.complete_from(node, 'z'), [])
+        self.assertIsNone(self.trie.locate('x', node))
+
+    def test_duplicate_terms_are_merged(self):
+        self.assertEqual(len(self.trie), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.marketplace.price_alerts import PriceAlertManager
+
+
+class TestPriceAlerts(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = PriceAlertManager(os.path.join(self.temp_dir, 'alerts.json'))
+        self.alert_id = self.manager.create_alert(
+            'user@example.com', 'Laptop', 'https://example.com/laptop',
+            'amazon', 800.0, 999.0
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_to_dict_reused_until_changed(self):
+        alert = self.manager.get_alert(self.alert_id)
+        first = alert.to_dict()
+        self.assertIs(alert.to_dict(), first)
+
+        self.manager.update_alert(self.alert_id, 750.0)
+        updated = alert.to_dict()
+        self.assertIsNot(updated, first)
+        self.assertEqual(updated['target_price'], 750.0)
+        self.assertEqual(first['target_price'], 800.0)
+
+    def test_alerts_reload_from_disk(self):
+        reloaded = PriceAlertManager(self.manager.storage_path)
+        self.assertEqual(
+            reloaded.get_alert(self.alert_id).to_dict(),
+            self.manager.get_alert(self.alert_id).to_dict()
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
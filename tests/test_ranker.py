@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.indexing.indexer import Indexer
+from src.ranking.ranker import Ranker
+from src.storage.database import Database
+
+
+class _SplitTokenizer:
+    def tokenize(self, text):
+        return text.lower().split()
+
+
+class TestRanker(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        database = Database(os.path.join(self.temp_dir, 'index.json'))
+        self.indexer = Indexer(database, _SplitTokenizer())
+        self.indexer.index_document('doc1', ['python', 'flask', 'web'])
+        self.indexer.index_document('doc2', ['python', 'python', 'tutorial'])
+        self.ranker = Ranker(self.indexer)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_rank_orders_by_bm25(self):
+        ranked = self.ranker.rank('python tutorial')
+        self.assertEqual([doc_id for doc_id, _ in ranked], ['doc2', 'doc1'])
+
+    def test_scores_match_per_term_bm25(self):
+        expected = {}
+        for term in ('python', 'web'):
+            for doc_id, term_freq in self.indexer.index.get(term, []):
+                expected[doc_id] = expected.get(doc_id, 0.0) + \
+                    self.ranker._calculate_bm25_score(term, doc_id, term_freq)
+
+        self.assertEqual(dict(self.ranker.rank('python web')), expected)
+
+    def test_top_k_is_prefix_of_full_ranking(self):
+        self.indexer.index_document('doc3', ['python', 'web', 'web'])
+        full = self.ranker.rank('python web', top_k=10)
+
+        self.assertEqual(len(full), 3)
+        self.assertEqual(self.ranker.rank('python web', top_k=2), full[:2])
+
+    def test_repeated_query_served_from_cache(self):
+        first = self.ranker.rank('python flask')
+
+        self.assertEqual(self.ranker.rank('flask python'), first)
+        self.assertEqual(len(self.ranker._results), 1)
+
+    def test_cache_follows_index_changes(self):
+        self.assertEqual(self.ranker.rank('django'), [])
+
+        self.indexer.index_document('doc3', ['django', 'web'])
+        self.assertEqual([doc_id for doc_id, _ in self.ranker.rank('django')], ['doc3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
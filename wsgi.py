@@ -0,0 +1,20 @@
+"""
+gevent WSGI entry point for production.
+
+The search, news/image and crawl routes spend almost all of their time
+waiting on SerpAPI, Google and crawled sites, so each worker runs them on
+cooperative greenlets instead of one request per thread:
+
+    gunicorn -k gevent -w 4 --worker-connections 1000 wsgi:app
+
+monkey.patch_all() must run before anything imports socket/ssl (requests,
+urllib3, redis), which is why it comes ahead of the application import.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+from entry import app  # noqa: E402  (must follow monkey patching)
+
+__all__ = ['app']